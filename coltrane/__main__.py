@@ -0,0 +1,3 @@
+from coltrane.cli import main
+
+main()
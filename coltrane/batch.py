@@ -1,16 +1,20 @@
 import json
-from dataclasses import dataclass
+import numbers
+from dataclasses import asdict, dataclass, replace
 from hashlib import blake2b
-from typing import Dict
+from typing import Dict, Iterable, Mapping, Union
 
 from lazy import lazy
-from sklearn.base import TransformerMixin
+from sklearn.base import TransformerMixin, clone
 from sklearn.metrics._scorer import _BaseScorer
 from sklearn.model_selection import BaseCrossValidator
 from sklearn.pipeline import Pipeline
 from tqdm.auto import tqdm
 
 from coltrane.file.io.base import Data
+from coltrane.incremental import Incremental
+from coltrane.stopping import Stopping
+from coltrane.util.fingerprint import digest
 
 
 @dataclass(frozen=True)
@@ -25,20 +29,113 @@ class Batch:
     scorers: Dict[str, _BaseScorer]
     encoder: TransformerMixin = None
     multiprocessing: bool = False
+    stopping: Stopping = None
+    incremental: Incremental = None
 
     @lazy
     def as_nice_hash(self) -> str:
         """
         Short identifier of the batch. Logs will appear under it.
+        Same experiment always lands in the same folder.
 
         Returns
         -------
         str
         """
 
-        encoded = str(id(self)).encode("utf-8")
+        encoded = self.fingerprint.encode("utf-8")
         return blake2b(encoded, digest_size=4).hexdigest()
 
+    @lazy
+    def fingerprint(self) -> str:
+        """
+        Deterministic identifier of the experiment.
+        It's built from data set digest, pipeline params, cross-validation
+        config, scorers and encoder, so identical batches share it.
+
+        Returns
+        -------
+        str
+        """
+
+        fingerprint = {
+            'data': self.data_fingerprint,
+            'pipeline': self.pipeline.get_params(deep=True),
+            'selection': repr(self.selection),
+            'scorers': {
+                name: {
+                    'type': type(scorer),
+                    'func': scorer._score_func,
+                    'sign': scorer._sign,
+                    'kwargs': scorer._kwargs
+                }
+                for name, scorer in self.scorers.items()
+            }
+        }
+
+        # ? Batches fitted as a whole keep their former fingerprints.
+        if self.incremental is not None:
+            fingerprint['incremental'] = asdict(self.incremental)
+
+        return digest(fingerprint)
+
+    @lazy
+    def data_fingerprint(self) -> str:
+        """
+        Identifies records and encoded labels fed to the pipeline.
+        Batches differing only by pipeline share it.
+
+        Returns
+        -------
+        str
+        """
+
+        encoder = None
+
+        if self.encoder is not None:
+            encoder = [self.encoder, self.encoder.get_params()]
+
+        return digest({
+            'data': self.data.digest,
+            'encoder': encoder
+        })
+
+    @lazy
+    def deterministic(self) -> bool:
+        """
+        Whether selection yields the same splits on every run,
+        so scores may be cached under `fingerprint`.
+        Shuffling splitters need integer `random_state`.
+
+        Returns
+        -------
+        bool
+        """
+
+        if not hasattr(self.selection, 'random_state'):
+            return True
+
+        # ? Repeated and shuffle splitters always shuffle.
+        if not getattr(self.selection, 'shuffle', True):
+            return True
+
+        return isinstance(self.selection.random_state, numbers.Integral)
+
+    @lazy
+    def repeat_size(self) -> int:
+        """
+        Number of splits in a single repeat of cross-validation.
+
+        Returns
+        -------
+        int
+        """
+
+        n_splits = self.selection.get_n_splits()
+        n_repeats = getattr(self.selection, 'n_repeats', 1)
+
+        return max(1, n_splits // n_repeats)
+
     @lazy
     def as_dict(self):
         """
@@ -68,6 +165,12 @@ class Batch:
 
         batch['metrics'] = metrics
 
+        if self.stopping is not None:
+            batch['stopping'] = asdict(self.stopping)
+
+        if self.incremental is not None:
+            batch['incremental'] = asdict(self.incremental)
+
         return batch
 
     @lazy
@@ -92,6 +195,57 @@ class Batch:
 
         return as_dict
 
+    def sweep(
+        self,
+        pipelines: Union[Mapping[str, Pipeline], Iterable]
+    ) -> Dict[str, 'Batch']:
+        """
+        Derives batches differing only by pipeline.
+
+        Parameters
+        ----------
+        pipelines : Union[Mapping[str, Pipeline], Iterable]
+            Either named pipelines, list of pipelines,
+            or parameter grid, e.g. `sklearn.model_selection.ParameterGrid`.
+            Each params set of the grid is applied to the clone
+            of this batch pipeline.
+
+        Returns
+        -------
+        Dict[str, Batch]
+            Batches by name. Unnamed ones are identified by `as_nice_hash`.
+
+        Raises
+        ------
+        ValueError
+            When unnamed configurations share `as_nice_hash`,
+            e.g. they're duplicated.
+        """
+
+        if isinstance(pipelines, Mapping):
+            return {
+                name: replace(self, pipeline=pipeline)
+                for name, pipeline in pipelines.items()
+            }
+
+        batches = {}
+
+        for pipeline in pipelines:
+            if isinstance(pipeline, Mapping):
+                pipeline = clone(self.pipeline).set_params(**pipeline)
+
+            batch = replace(self, pipeline=pipeline)
+
+            if batch.as_nice_hash in batches:
+                raise ValueError(
+                    'Configurations collide under {}, '
+                    'name them explicitly.'.format(batch.as_nice_hash)
+                )
+
+            batches[batch.as_nice_hash] = batch
+
+        return batches
+
     def pprint(self):
         """
         Pretty prints your data set and pipeline onto console using tqdm.
@@ -0,0 +1,366 @@
+import json
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from timeit import default_timer
+from typing import Dict, Iterable, List
+
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import LinearRegression
+from sklearn.metrics import accuracy_score, make_scorer, r2_score
+from sklearn.model_selection import RepeatedKFold, RepeatedStratifiedKFold
+from sklearn.naive_bayes import GaussianNB
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import LabelEncoder, StandardScaler
+
+from coltrane import Batch
+from coltrane.executor import Process
+from coltrane.file.io.csv.single import Data
+
+CLASSIFICATION = 'classification'
+REGRESSION = 'regression'
+
+ROWS = (10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7)
+COLUMNS = (10, 100, 1000)
+
+# ? Measured stages, in order.
+LOAD = 'load'
+INSPECT = 'inspect'
+SERIAL = 'process-serial'
+PARALLEL = 'process-parallel'
+
+TIME = 'time'
+PEAK_MEMORY = 'peak-memory'
+
+
+@dataclass(frozen=True)
+class Case:
+    """
+    Synthetic data set to benchmark on.
+
+    Attributes
+    ----------
+    task : str
+        Either `classification` or `regression`.
+    rows : int
+        Number of records.
+    columns : int
+        Number of attributes.
+    """
+
+    task: str
+    rows: int
+    columns: int
+
+    def __post_init__(self):
+        if self.task not in (CLASSIFICATION, REGRESSION):
+            raise ValueError('Unknown task: {}'.format(self.task))
+
+    @property
+    def name(self) -> str:
+        return '{}-{}x{}'.format(self.task, self.rows, self.columns)
+
+
+@dataclass(frozen=True)
+class Regression:
+    """
+    Measure, that got worse than its baseline.
+    """
+
+    case: str
+    stage: str
+    measure: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline
+
+
+def grid(
+    tasks: Iterable[str] = (CLASSIFICATION, REGRESSION),
+    rows: Iterable[int] = ROWS,
+    columns: Iterable[int] = COLUMNS
+) -> List[Case]:
+    """
+    Every combination of tasks, rows and columns.
+
+    Returns
+    -------
+    List[Case]
+    """
+
+    return [
+        Case(task, n_rows, n_columns)
+        for task in tasks
+        for n_rows in rows
+        for n_columns in columns
+    ]
+
+
+def generate(
+    case: Case,
+    folder: Path,
+    chunksize: int = 100000,
+    random_state: int = 0
+) -> Path:
+    """
+    Writes synthetic `csv` data set, in the layout of `csv.single.Data`.
+    It's written in chunks, so large cases don't need to fit in memory.
+    Already generated file is reused.
+
+    Parameters
+    ----------
+    case : Case
+    folder : Path
+        Where the file is stored.
+    chunksize : int, optional
+        Number of records generated at once.
+    random_state : int, optional
+
+    Returns
+    -------
+    Path
+        Generated file.
+    """
+
+    path = Path(folder, case.name + '.csv')
+
+    if path.exists():
+        return path
+
+    Path(folder).mkdir(parents=True, exist_ok=True)
+
+    random = np.random.RandomState(random_state)
+    attributes = ['x{}'.format(index) for index in range(case.columns)]
+    weights = random.normal(size=(case.columns, 3))
+
+    # ? Partial file isn't mistaken for generated one.
+    partial = path.with_suffix('.partial')
+
+    for start in range(0, case.rows, chunksize):
+        size = min(chunksize, case.rows - start)
+        x = random.normal(size=(size, case.columns))
+        noise = random.normal(size=(size, 3))
+
+        if case.task == CLASSIFICATION:
+            classes = np.argmax(x @ weights + noise, axis=1)
+            y = np.char.add('class-', classes.astype(str))
+        else:
+            y = x @ weights[:, 0] + noise[:, 0]
+
+        chunk = pd.DataFrame(x, columns=attributes)
+        chunk.insert(0, 'id', np.arange(start, start + size))
+        chunk['label'] = y
+
+        chunk.to_csv(
+            partial,
+            mode='a' if start else 'w',
+            header=not start,
+            index=False,
+            float_format='%.6g'
+        )
+
+    partial.rename(path)
+
+    return path
+
+
+def run(
+    cases: Iterable[Case],
+    folder: Path,
+    n_jobs: int = None,
+    trace_memory: bool = True
+) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """
+    Times loading, inspection and processing, both serial and parallel,
+    of each case.
+
+    Peak memory is traced with `tracemalloc` within the main process,
+    workers of parallel processing aren't covered.
+
+    Parameters
+    ----------
+    cases : Iterable[Case]
+    folder : Path
+        Where data sets are generated.
+    n_jobs : int, optional
+        Workers of parallel processing, all cores by default.
+    trace_memory : bool, optional
+        Whether peak memory is measured. Tracing slows allocations down,
+        so times are comparable only between runs sharing this setting.
+
+    Returns
+    -------
+    Dict[str, Dict[str, Dict[str, float]]]
+        Measures, by case name and stage.
+    """
+
+    results = {}
+
+    for case in cases:
+        path = generate(case, folder)
+        measures = results[case.name] = {}
+
+        with TemporaryDirectory(prefix='coltrane-') as output:
+            with _measure(measures, LOAD, trace_memory):
+                data = Data(path)
+                data.x
+                data.y
+
+            inspector, processor = _task(case)
+
+            with _measure(measures, INSPECT, trace_memory):
+                inspector(headless=True).inspect(data, output)
+
+            batch = _batch(case, data)
+
+            with _measure(measures, SERIAL, trace_memory):
+                with processor(headless=True) as serial:
+                    serial.process(batch, output)
+
+            batch = replace(batch, multiprocessing=True)
+            executor = Process(n_jobs=n_jobs)
+
+            with _measure(measures, PARALLEL, trace_memory):
+                with processor(executor, headless=True) as parallel:
+                    parallel.process(batch, output)
+
+    return results
+
+
+def compare(
+    results: Dict,
+    baseline: Dict,
+    tolerance: float = 0.2
+) -> List[Regression]:
+    """
+    Finds measures, that got worse than baseline by more than tolerance.
+    Cases and stages missing in either one are skipped.
+
+    Parameters
+    ----------
+    results : Dict
+        Current measures, as returned by `run`.
+    baseline : Dict
+        Measures to compare to.
+    tolerance : float, optional
+        Allowed relative increase, e.g. `0.2` for 20%.
+
+    Returns
+    -------
+    List[Regression]
+    """
+
+    regressions = []
+
+    for case, stages in results.items():
+        for stage, measures in stages.items():
+            baseline_measures = baseline.get(case, {}).get(stage, {})
+
+            for measure, current in measures.items():
+                previous = baseline_measures.get(measure)
+
+                if not previous:
+                    continue
+
+                if current > previous * (1 + tolerance):
+                    regressions.append(
+                        Regression(case, stage, measure, previous, current)
+                    )
+
+    return regressions
+
+
+def save(results: Dict, path: Path):
+    """
+    Stores results as `json` baseline.
+
+    Parameters
+    ----------
+    results : Dict
+    path : Path
+    """
+
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+    with open(path, 'w') as stream:
+        json.dump(results, stream, indent=4, sort_keys=True)
+
+
+def load(path: Path) -> Dict:
+    """
+    Reads `json` baseline.
+
+    Parameters
+    ----------
+    path : Path
+
+    Returns
+    -------
+    Dict
+    """
+
+    with open(path, 'r') as stream:
+        return json.load(stream)
+
+
+@contextmanager
+def _measure(measures: Dict, stage: str, trace_memory: bool):
+    tracing = trace_memory and not tracemalloc.is_tracing()
+
+    if tracing:
+        tracemalloc.start()
+
+    start = default_timer()
+
+    try:
+        yield
+    finally:
+        measures[stage] = {TIME: default_timer() - start}
+
+        if tracing:
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            measures[stage][PEAK_MEMORY] = peak
+
+
+def _task(case: Case):
+    if case.task == CLASSIFICATION:
+        from coltrane.classification import Inspector, Processor
+    else:
+        from coltrane.regression import Inspector, Processor
+
+    return Inspector, Processor
+
+
+def _batch(case: Case, data: Data) -> Batch:
+    if case.task == CLASSIFICATION:
+        return Batch(
+            data,
+            pipeline=Pipeline(steps=[
+                ('standard-scaler', StandardScaler()),
+                ('naive-bayes', GaussianNB())
+            ]),
+            selection=RepeatedStratifiedKFold(
+                n_splits=5,
+                n_repeats=1,
+                random_state=0
+            ),
+            scorers={'accuracy': make_scorer(accuracy_score)},
+            encoder=LabelEncoder()
+        )
+
+    return Batch(
+        data,
+        pipeline=Pipeline(steps=[
+            ('standard-scaler', StandardScaler()),
+            ('linear', LinearRegression())
+        ]),
+        selection=RepeatedKFold(n_splits=5, n_repeats=1, random_state=0),
+        scorers={'r2': make_scorer(r2_score)}
+    )
@@ -9,8 +9,8 @@ from coltrane.inspection import Inspector as Base
 
 class Inspector(Base):
 
-    def __init__(self):
-        super(Inspector, self).__init__()
+    def __init__(self, *args, **kwargs):
+        super(Inspector, self).__init__(*args, **kwargs)
 
     def __post_inspect(self, data: Data, logger: Logger):
 
@@ -35,10 +35,13 @@ class Inspector(Base):
             Record count for each label.
         """
 
-        labels = data.y
+        class_balance = data.statistics.class_balance
+
+        if class_balance is not None:
+            return class_balance
 
         class_balance = {}
-        aggregate = np.unique(labels, return_counts=True)
+        aggregate = np.unique(data.y, return_counts=True)
 
         for label, count in np.transpose(aggregate):
             class_balance[str(label)] = count
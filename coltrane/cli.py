@@ -0,0 +1,260 @@
+import argparse
+import json
+from dataclasses import asdict
+from pathlib import Path
+from typing import Dict, List, Mapping, Tuple
+
+from coltrane import benchmark, spec
+from coltrane.executor import Loky, Process, Serial, Thread
+from coltrane.util import SplitCache
+from coltrane.util.stats import BatchStats
+
+__EXECUTORS = {
+    'serial': Serial,
+    'thread': Thread,
+    'process': Process,
+    'loky': Loky
+}
+
+
+def main(argv: List[str] = None):
+    """
+    Entry point of `coltrane` command.
+
+    ```sh
+    coltrane run batch.yaml --output log --shard 0/4
+    coltrane merge batch.yaml --output log
+    coltrane benchmark --rows 1000 100000 --baseline baseline.json
+    ```
+
+    Parameters
+    ----------
+    argv : List[str], optional
+        Command line arguments, `sys.argv` by default.
+    """
+
+    parser = argparse.ArgumentParser(
+        prog='coltrane',
+        description='Runs research batches described by specification files.'
+    )
+
+    commands = parser.add_subparsers(dest='command')
+    commands.required = True
+
+    run = commands.add_parser(
+        'run',
+        help='Processes batch, or its shard.'
+    )
+
+    run.add_argument('spec', type=Path, help='`.json` or `.yaml` file.')
+    run.add_argument('--output', type=Path, default=Path('log'))
+
+    run.add_argument(
+        '--shard',
+        type=_shard,
+        default=None,
+        help='`i/N`, runs only i-th of N slices of (pipeline, split) tasks.'
+    )
+
+    run.add_argument(
+        '--executor',
+        choices=sorted(__EXECUTORS),
+        default='process',
+        help='Backend for batches with `multiprocessing` enabled.'
+    )
+
+    run.add_argument('--jobs', type=int, default=None)
+
+    merge = commands.add_parser(
+        'merge',
+        help='Assembles results of every shard into a single report.'
+    )
+
+    merge.add_argument('spec', type=Path, help='`.json` or `.yaml` file.')
+    merge.add_argument('--output', type=Path, default=Path('log'))
+
+    bench = commands.add_parser(
+        'benchmark',
+        help='Times coltrane over synthetic data sets.'
+    )
+
+    bench.add_argument(
+        '--tasks',
+        nargs='+',
+        choices=[benchmark.CLASSIFICATION, benchmark.REGRESSION],
+        default=[benchmark.CLASSIFICATION, benchmark.REGRESSION]
+    )
+
+    bench.add_argument('--rows', nargs='+', type=int, default=[1000])
+    bench.add_argument('--columns', nargs='+', type=int, default=[10])
+
+    bench.add_argument(
+        '--folder',
+        type=Path,
+        default=Path('benchmark'),
+        help='Where synthetic data sets are kept between runs.'
+    )
+
+    bench.add_argument('--jobs', type=int, default=None)
+
+    bench.add_argument(
+        '--baseline',
+        type=Path,
+        default=None,
+        help='`.json` results to compare to.'
+    )
+
+    bench.add_argument(
+        '--tolerance',
+        type=float,
+        default=0.2,
+        help='Allowed relative increase of each measure.'
+    )
+
+    bench.add_argument(
+        '--update',
+        action='store_true',
+        help='Stores results as the baseline.'
+    )
+
+    bench.add_argument(
+        '--no-memory',
+        action='store_true',
+        help='Skips tracing peak memory, which slows allocations down.'
+    )
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        report = _run(args)
+    elif args.command == 'merge':
+        report = _merge(args)
+    else:
+        report = _benchmark(args)
+
+    print(json.dumps(report, indent=4))
+
+    # ? Regressions fail the command, so CI can track them.
+    if args.command == 'benchmark' and report['regressions']:
+        raise SystemExit(1)
+
+
+def _run(args: argparse.Namespace) -> Dict:
+    loaded = spec.load(args.spec)
+    batch, sweep = spec.build(loaded)
+
+    if args.executor == 'serial':
+        executor = Serial()
+    else:
+        executor = __EXECUTORS[args.executor](n_jobs=args.jobs)
+
+    processor = _processor(loaded)(
+        executor=executor,
+        cache=SplitCache(Path(args.output, 'splits')),
+        headless=True,
+        shard=args.shard,
+        plans=Path(args.output, 'plans')
+    )
+
+    with processor:
+        if sweep is None:
+            stats = {batch.as_nice_hash: processor.process(batch, args.output)}
+        else:
+            stats = processor.sweep(batch, sweep, args.output)
+
+    return _report(stats)
+
+
+def _merge(args: argparse.Namespace) -> Dict:
+    batch, sweep = spec.build(spec.load(args.spec))
+    cache = SplitCache(Path(args.output, 'splits'))
+
+    if sweep is None:
+        batches = {batch.as_nice_hash: batch}
+    else:
+        batches = batch.sweep(sweep)
+
+    stats = {}
+
+    for name, batch in batches.items():
+        total = batch.selection.get_n_splits(batch.data.x, batch.data.y)
+
+        splits = [
+            cache.get(batch.fingerprint, split_index)
+            for split_index in range(total)
+        ]
+
+        stats[name] = BatchStats(
+            [split for split in splits if split is not None],
+            total=total
+        )
+
+    report = _report(stats)
+
+    with open(Path(args.output, 'report.json'), 'w') as stream:
+        json.dump(report, stream, indent=4)
+
+    return report
+
+
+def _benchmark(args: argparse.Namespace) -> Dict:
+    cases = benchmark.grid(args.tasks, args.rows, args.columns)
+
+    results = benchmark.run(
+        cases,
+        args.folder,
+        n_jobs=args.jobs,
+        trace_memory=not args.no_memory
+    )
+
+    regressions = []
+
+    if args.baseline is not None and args.baseline.exists():
+        baseline = benchmark.load(args.baseline)
+        regressions = benchmark.compare(results, baseline, args.tolerance)
+
+    if args.baseline is not None and args.update:
+        benchmark.save(results, args.baseline)
+        regressions = []
+
+    return {
+        'results': results,
+        'regressions': [asdict(regression) for regression in regressions]
+    }
+
+
+def _report(stats: Mapping[str, BatchStats]) -> Dict:
+    return {
+        name: {
+            'splits': len(batch_stats.splits),
+            'total': batch_stats.total,
+            'scores': batch_stats.running.summary(),
+            'profile': batch_stats.profile
+        }
+        for name, batch_stats in stats.items()
+    }
+
+
+def _processor(loaded: Dict) -> type:
+    task = loaded.get('task', 'classification')
+
+    if task == 'classification':
+        from coltrane.classification import Processor
+    elif task == 'regression':
+        from coltrane.regression import Processor
+    else:
+        raise ValueError('Unknown task: {}'.format(task))
+
+    return Processor
+
+
+def _shard(value: str) -> Tuple[int, int]:
+    try:
+        index, count = (int(part) for part in value.split('/'))
+    except ValueError:
+        raise argparse.ArgumentTypeError('Expected i/N, got: ' + value)
+
+    if not 0 <= index < count:
+        raise argparse.ArgumentTypeError('Shard out of range: ' + value)
+
+    return index, count
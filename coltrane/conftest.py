@@ -1,3 +1,5 @@
+from pathlib import Path
+
 import numpy as np
 from pytest import fixture
 
@@ -11,3 +13,8 @@ def pytest_sessionstart(session):
 @fixture(scope='session')
 def random_state() -> int:
     return __RANDOM_STATE
+
+
+@fixture(scope='session')
+def iris_path() -> Path:
+    return Path('coltrane/test/data/iris.csv')
@@ -0,0 +1,456 @@
+import asyncio
+import os
+import threading
+import time
+import weakref
+from abc import ABC, abstractmethod
+from collections import deque
+from concurrent import futures
+from itertools import islice
+from math import ceil
+from typing import (Any, AsyncIterator, Callable, Iterable, Iterator, List,
+                    Optional, Sequence, Tuple)
+
+# ? Time, when currently running chunk was submitted, per worker thread.
+_dispatch = threading.local()
+
+
+class Executor(ABC):
+    """
+    Pluggable backend for running splits.
+    Worker pool is created on first use, reused across batches
+    and shut down on `close`.
+    """
+
+    # ? Workers don't share memory with the caller,
+    # ? data set has to be transported to them.
+    processes = False
+
+    # ? Pool runs tasks in background, so chunks are submitted ahead of
+    # ? consumed results. Otherwise they're run on submit, only once the
+    # ? consumer asks for more, so stopped batches aren't run further.
+    ahead = True
+
+    def __init__(self, n_jobs: int = None, chunksize: int = None):
+        """
+        Parameters
+        ----------
+        n_jobs : int, optional
+            Number of workers. `None` or negative value means all cores.
+        chunksize : int, optional
+            Number of tasks submitted to a worker at once.
+            By default it's estimated from the number of tasks,
+            so each worker gets about four chunks.
+        """
+
+        super().__init__()
+
+        if not n_jobs or n_jobs < 0:
+            n_jobs = os.cpu_count() or 1
+
+        self.n_jobs = n_jobs
+        self.chunksize = chunksize
+        self.__pool = None
+        self.__finalizer = None
+
+    @abstractmethod
+    def _create_pool(self) -> futures.Executor:
+        pass
+
+    @property
+    def pool(self) -> futures.Executor:
+        if self.__pool is None:
+            self.__pool = self._create_pool()
+            self.__finalizer = weakref.finalize(self, _shutdown, self.__pool)
+
+        return self.__pool
+
+    def submit(self, func: Callable, *args, **kwargs) -> futures.Future:
+        return self.pool.submit(func, *args, **kwargs)
+
+    def starmap(
+        self,
+        func: Callable,
+        tasks: Sequence[tuple]
+    ) -> Iterator[Any]:
+        """
+        Runs `func` over argument tuples, yielding results in task order.
+        Tasks are submitted lazily in chunks, so only a bounded number
+        of chunks is in flight at any time.
+
+        Parameters
+        ----------
+        func : Callable
+            Must be picklable for process based backends.
+        tasks : Sequence[tuple]
+            Arguments for each call.
+
+        Yields
+        -------
+        Any
+            Result of each call.
+        """
+
+        pending = deque()
+        chunks = self.__chunk(tasks, len(tasks))
+
+        try:
+            for chunk in islice(chunks, self.__window):
+                pending.append(self.__submit_chunk(func, chunk))
+
+            while pending:
+                results = pending.popleft().result()
+
+                for chunk in islice(chunks, 1):
+                    pending.append(self.__submit_chunk(func, chunk))
+
+                yield from results
+
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def imap_unordered(
+        self,
+        func: Callable,
+        tasks: Iterable[tuple],
+        total: int = None
+    ) -> Iterator[Tuple[int, Any]]:
+        """
+        Runs `func` over argument tuples, yielding results as soon as
+        they're done, along with their task index.
+        Tasks are taken lazily, when there's room for another chunk,
+        so they may be filtered meanwhile, e.g. by a generator.
+
+        Parameters
+        ----------
+        func : Callable
+            Must be picklable for process based backends.
+        tasks : Iterable[tuple]
+            Arguments for each call.
+        total : int, optional
+            Expected number of tasks, used for estimating chunk size.
+            By default it's `len(tasks)`, if available.
+
+        Yields
+        -------
+        Tuple[int, Any]
+            Index of the task and its result, in order of completion.
+        """
+
+        if total is None and hasattr(tasks, '__len__'):
+            total = len(tasks)
+
+        pending = {}
+        chunks = self.__chunk(enumerate(tasks), total)
+
+        def submit(count: int):
+            for chunk in islice(chunks, count):
+                indices = [index for index, _ in chunk]
+                future = self.__submit_chunk(func, [args for _, args in chunk])
+                pending[future] = indices
+
+        try:
+            submit(self.__window)
+
+            while pending:
+                done, _ = futures.wait(
+                    pending,
+                    return_when=futures.FIRST_COMPLETED
+                )
+
+                for future in done:
+                    indices = pending.pop(future)
+                    results = future.result()
+
+                    # ? Workers are kept busy, while results are consumed.
+                    if self.ahead:
+                        submit(1)
+
+                    yield from zip(indices, results)
+
+                    if not self.ahead:
+                        submit(1)
+
+        finally:
+            for future in pending:
+                future.cancel()
+
+    async def aimap_unordered(
+        self,
+        func: Callable,
+        tasks: Iterable[tuple],
+        total: int = None
+    ) -> AsyncIterator[Tuple[int, Any]]:
+        """
+        Same as `imap_unordered`, but awaits results within event loop,
+        instead of blocking it. Pending chunks are cancelled, when iterator
+        is closed or its task is cancelled.
+
+        Parameters
+        ----------
+        func : Callable
+            Must be picklable for process based backends.
+        tasks : Iterable[tuple]
+            Arguments for each call.
+        total : int, optional
+            Expected number of tasks, used for estimating chunk size.
+            By default it's `len(tasks)`, if available.
+
+        Yields
+        -------
+        Tuple[int, Any]
+            Index of the task and its result, in order of completion.
+        """
+
+        if total is None and hasattr(tasks, '__len__'):
+            total = len(tasks)
+
+        pending = {}
+        chunks = self.__chunk(enumerate(tasks), total)
+
+        def submit(count: int):
+            for chunk in islice(chunks, count):
+                indices = [index for index, _ in chunk]
+                future = self.__submit_chunk(func, [args for _, args in chunk])
+
+                # ? Cancelling wrapped future cancels the pool's one.
+                pending[asyncio.wrap_future(future)] = indices
+
+        try:
+            submit(self.__window)
+
+            while pending:
+                done, _ = await asyncio.wait(
+                    pending,
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+
+                for future in done:
+                    indices = pending.pop(future)
+                    results = future.result()
+
+                    if self.ahead:
+                        submit(1)
+
+                    for item in zip(indices, results):
+                        yield item
+
+                    if not self.ahead:
+                        submit(1)
+
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def close(self):
+        """
+        Shuts down worker pool. It will be recreated on next use.
+        """
+
+        if self.__pool is not None:
+            self.__finalizer()
+            self.__pool = None
+            self.__finalizer = None
+
+    def terminate(self):
+        """
+        Shuts down worker pool without waiting, pending tasks are cancelled
+        and workers, that run tasks, are stopped, if backend allows.
+        It will be recreated on next use.
+        """
+
+        if self.__pool is not None:
+            pool = self.__pool
+            self.__finalizer.detach()
+            self.__pool = None
+            self.__finalizer = None
+            self._terminate_pool(pool)
+
+    def _terminate_pool(self, pool: futures.Executor):
+        # ? Threads can't be stopped, running tasks are left to finish.
+        _cancel(pool)
+
+    def __submit_chunk(self, func: Callable, chunk: List[tuple]):
+        return self.submit(_run_chunk, func, chunk, time.time())
+
+    @property
+    def __window(self) -> int:
+        return 2 * self.n_jobs if self.ahead else 1
+
+    def __chunk(
+        self,
+        tasks: Iterable[tuple],
+        total: int = None
+    ) -> Iterator[List[tuple]]:
+        chunksize = self.chunksize
+
+        if not chunksize and total:
+            chunksize = max(1, ceil(total / (4 * self.n_jobs)))
+
+        chunksize = chunksize or 1
+
+        # ? Chunk is pickled at once, so objects shared by its tasks
+        # ? (batch, data) are serialized only once per chunk.
+        tasks = iter(tasks)
+        chunk = list(islice(tasks, chunksize))
+
+        while chunk:
+            yield chunk
+            chunk = list(islice(tasks, chunksize))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_Executor__pool'] = None
+        state['_Executor__finalizer'] = None
+        return state
+
+
+class Serial(Executor):
+    """
+    Runs every task in the calling thread.
+    """
+
+    ahead = False
+
+    def __init__(self):
+        super().__init__(n_jobs=1, chunksize=1)
+
+    def _create_pool(self) -> futures.Executor:
+        return _SerialPool()
+
+
+class Thread(Executor):
+    """
+    Thread pool. Useful for estimators that release GIL.
+    """
+
+    def _create_pool(self) -> futures.Executor:
+        return futures.ThreadPoolExecutor(max_workers=self.n_jobs)
+
+
+class Process(Executor):
+    """
+    Process pool from standard library.
+    """
+
+    processes = True
+
+    def _create_pool(self) -> futures.Executor:
+        return futures.ProcessPoolExecutor(max_workers=self.n_jobs)
+
+    def _terminate_pool(self, pool: futures.Executor):
+        # ? Taken before shutdown, which forgets them.
+        workers = list((getattr(pool, '_processes', None) or {}).values())
+        _cancel(pool)
+
+        for worker in workers:
+            worker.terminate()
+
+
+class Loky(Executor):
+    """
+    Reusable `loky` process pool shipped with `joblib`.
+    It's robust to worker crashes and shared with `joblib.Parallel`.
+    """
+
+    processes = True
+
+    def __init__(
+        self,
+        n_jobs: int = None,
+        chunksize: int = None,
+        idle_worker_timeout: int = 300
+    ):
+        """
+        Parameters
+        ----------
+        n_jobs : int, optional
+            Number of workers. `None` or negative value means all cores.
+        chunksize : int, optional
+            Number of tasks submitted to a worker at once.
+        idle_worker_timeout : int, optional
+            Seconds after which idle workers are shut down by loky.
+        """
+
+        super().__init__(n_jobs, chunksize)
+        self.idle_worker_timeout = idle_worker_timeout
+
+    def _create_pool(self) -> futures.Executor:
+        from joblib.externals.loky import get_reusable_executor
+
+        return get_reusable_executor(
+            max_workers=self.n_jobs,
+            timeout=self.idle_worker_timeout
+        )
+
+    def _terminate_pool(self, pool: futures.Executor):
+        pool.shutdown(wait=False, kill_workers=True)
+
+
+class _SerialPool(futures.Executor):
+
+    def submit(self, func: Callable, *args, **kwargs) -> futures.Future:
+        future = futures.Future()
+        future.set_running_or_notify_cancel()
+
+        try:
+            future.set_result(func(*args, **kwargs))
+        except Exception as exception:
+            future.set_exception(exception)
+
+        return future
+
+
+def dispatched() -> Optional[float]:
+    """
+    Epoch time, when task currently running in this thread
+    was submitted by `Executor.starmap`. Tasks of the same chunk,
+    but the first one, are dispatched once the previous one is done.
+
+    Returns
+    -------
+    Optional[float]
+        `None` outside of executor's tasks.
+    """
+
+    return getattr(_dispatch, 'time', None)
+
+
+def _run_chunk(
+    func: Callable,
+    chunk: Iterable[tuple],
+    submitted: float = None
+) -> List[Any]:
+    results = []
+
+    try:
+        for args in chunk:
+            _dispatch.time = submitted
+            results.append(func(*args))
+
+            # ? Following tasks of the chunk wait for no one but this one,
+            # ? its compute isn't their queue.
+            submitted = time.time()
+
+        return results
+    finally:
+        _dispatch.time = None
+
+
+def _shutdown(pool: futures.Executor):
+    pool.shutdown(wait=True)
+
+
+def _cancel(pool: futures.Executor):
+    try:
+        pool.shutdown(wait=False, cancel_futures=True)
+    except TypeError:
+        # ? `cancel_futures` is there since Python 3.9.
+        pool.shutdown(wait=False)
@@ -1,2 +1,2 @@
 # flake8: noqa 
-from . import csv
+from . import csv, feather, npy, parquet, sparse
@@ -1,11 +1,20 @@
 import json
 from abc import ABC, abstractmethod, abstractproperty
+from hashlib import blake2b
+from inspect import signature
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Iterator, List
 
+import numpy as np
+import pandas as pd
 from lazy import lazy
 from tqdm.auto import tqdm
 
+from coltrane.util import fingerprint
+from coltrane.util.summary import Statistics
+
+from .schema import BOOL, FLOAT, INTEGER, Column, from_dtype, infer
+
 
 class Data(ABC):
     """
@@ -25,6 +34,7 @@ class Data(ABC):
 
         super().__init__()
         self.path = path
+        self.preprocessing: List[str] = []
 
     @abstractproperty
     def name(self):
@@ -63,6 +73,170 @@ class Data(ABC):
     def drop_duplicates(self):
         pass
 
+    @lazy
+    def attributes(self) -> np.ndarray:
+        """
+        Names of attributes, columns of `x`.
+        """
+
+        return np.array([str(index) for index in range(self.x.shape[1])])
+
+    @lazy
+    def label(self) -> str:
+        """
+        Name of ground truth column.
+        """
+
+        return 'y'
+
+    @lazy
+    def schema(self) -> Dict[str, Column]:
+        """
+        Type info of each attribute. It's computed once, from dtypes.
+
+        Returns
+        -------
+        Dict[str, Column]
+            Type info by attribute name.
+        """
+
+        x = self.x
+
+        if x.dtype != object:
+            return from_dtype(self.attributes, x.dtype)
+
+        attributes = [str(attribute) for attribute in self.attributes]
+        return infer(pd.DataFrame(x, columns=attributes))
+
+    @lazy
+    def statistics(self) -> Statistics:
+        """
+        Statistics of the data set, gathered in a single pass over `chunks`.
+
+        Returns
+        -------
+        Statistics
+        """
+
+        numerical = [
+            attribute
+            for attribute, column in self.schema.items()
+            if column.kind in (INTEGER, FLOAT, BOOL)
+        ]
+
+        return Statistics.of(
+            self.chunks(),
+            self.attributes,
+            numerical,
+            self.label
+        )
+
+    def chunks(self, chunksize: int = 100000) -> Iterator[pd.DataFrame]:
+        """
+        Iterates over data set in chunks.
+
+        Parameters
+        ----------
+        chunksize : int, optional
+            Number of records in chunk.
+
+        Yields
+        -------
+        pd.DataFrame
+            Attributes along with ground truth column.
+        """
+
+        x, y = self.x, self.y
+        attributes = [str(attribute) for attribute in self.attributes]
+
+        for start in range(0, len(x), chunksize):
+            end = start + chunksize
+            chunk = pd.DataFrame(x[start:end], columns=attributes)
+            chunk[self.label] = y[start:end]
+            yield chunk
+
+    def count_missing(self) -> int:
+        """
+        Counts missing values of attributes and ground truth.
+
+        Returns
+        -------
+        int
+        """
+
+        return self.statistics.missing_count
+
+    @lazy
+    def file_digest(self) -> str:
+        """
+        Content hash of the file, or of every file within the folder,
+        pointed by `path`.
+
+        Returns
+        -------
+        str
+        """
+
+        path = Path(self.path)
+        files = sorted(path.rglob('*')) if path.is_dir() else [path]
+        digest = blake2b(digest_size=16)
+
+        for file in files:
+            if not file.is_file():
+                continue
+
+            digest.update(str(file.relative_to(path)).encode('utf-8'))
+
+            with open(file, 'rb') as stream:
+                for block in iter(lambda: stream.read(1 << 20), b''):
+                    digest.update(block)
+
+        return digest.hexdigest()
+
+    @property
+    def loader(self) -> Dict:
+        """
+        Loader type along with its options, constructor arguments
+        other than `path`.
+
+        Returns
+        -------
+        Dict
+        """
+
+        parameters = signature(type(self).__init__).parameters
+
+        return {
+            'type': type(self),
+            'options': {
+                name: getattr(self, name, parameter.default)
+                for name, parameter in parameters.items()
+                if name not in ('self', 'path')
+            }
+        }
+
+    @property
+    def digest(self) -> str:
+        """
+        Identifies data set contents, along with preprocessing applied
+        after loading, e.g. `dropna`.
+
+        Returns
+        -------
+        str
+        """
+
+        digest = blake2b(self.file_digest.encode('utf-8'), digest_size=16)
+
+        # ? Same file read by other loader, or with other options,
+        # ? e.g. `x_dtype`, holds other records.
+        digest.update(fingerprint.digest(self.loader).encode('utf-8'))
+
+        for step in self.preprocessing:
+            digest.update(step.encode('utf-8'))
+
+        return digest.hexdigest()
+
     @lazy
     def as_dict(self) -> Dict:
         return {
@@ -0,0 +1,83 @@
+from typing import Dict, Iterable, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+def compact(
+    frame: pd.DataFrame,
+    columns: Iterable[str],
+    max_categories: int = 255
+) -> Tuple[pd.DataFrame, Dict[str, Dict]]:
+    """
+    Shrinks columns to the smallest dtype, that holds their values exactly.
+    Integers are downcast, floats go to `float32` if no precision is lost,
+    booleans become `uint8`.
+    Textual columns of low cardinality are replaced by integer codes,
+    missing values stay `nan`.
+
+    Parameters
+    ----------
+    frame : pd.DataFrame
+        Table to compact. It's not modified.
+    columns : Iterable[str]
+        Columns to compact, e.g. attributes.
+    max_categories : int, optional
+        Textual columns holding more distinct values are kept as they are.
+
+    Returns
+    -------
+    Tuple[pd.DataFrame, Dict[str, Dict]]
+        Compacted table and integer codes of textual columns, by column.
+    """
+
+    compacted = {}
+    categories = {}
+
+    for column in columns:
+        values = frame[column]
+        dtype = values.dtype
+
+        # ? Left as is, they'd turn mixed records into `object` array.
+        if pd.api.types.is_bool_dtype(dtype):
+            compacted[column] = values.astype(np.uint8)
+            continue
+
+        if pd.api.types.is_datetime64_any_dtype(dtype):
+            continue
+
+        if pd.api.types.is_integer_dtype(dtype):
+            compacted[column] = pd.to_numeric(values, downcast='integer')
+
+        elif pd.api.types.is_float_dtype(dtype):
+            compacted[column] = _downcast_float(values)
+
+        elif pd.api.types.is_numeric_dtype(dtype):
+            continue
+
+        elif values.nunique() <= max_categories:
+            codes, uniques = pd.factorize(values, sort=True)
+            codes = pd.Series(codes, index=values.index)
+
+            if (codes < 0).any():
+                codes = codes.where(codes >= 0).astype(np.float32)
+            else:
+                codes = pd.to_numeric(codes, downcast='integer')
+
+            compacted[column] = codes
+            categories[column] = {
+                value: code
+                for code, value in enumerate(uniques)
+            }
+
+    return frame.assign(**compacted), categories
+
+
+def _downcast_float(values: pd.Series) -> pd.Series:
+    downcast = values.astype(np.float32)
+
+    # ? `equals` considers missing values in the same place equal.
+    if downcast.astype(values.dtype).equals(values):
+        return downcast
+
+    return values
@@ -1,2 +1,2 @@
 # flake8: noqa 
-from . import single
+from . import cached, single, stream
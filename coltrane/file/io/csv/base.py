@@ -1,12 +1,15 @@
 from abc import abstractmethod, abstractproperty
 from pathlib import Path
-from typing import Callable, Dict
+from typing import Callable, Dict, Iterator
 
 import numpy as np
 import pandas as pd
 from lazy import lazy
 
 from .. import base
+from ..compact import compact
+from ..duplicates import Duplicates, find_duplicates, hash_rows
+from ..schema import STRING, Column, infer
 
 
 class Data(base.Data):
@@ -18,7 +21,12 @@ class Data(base.Data):
     First column for the record ID.
     """
 
-    def __init__(self, path: Path):
+    def __init__(
+        self,
+        path: Path,
+        compact: bool = False,
+        max_categories: int = 255
+    ):
         """
         Base abstract class for `csv` based data.
 
@@ -26,12 +34,68 @@ class Data(base.Data):
         ----------
         path : Path
             Path to your data `csv` file.
+        compact : bool, optional
+            Whether attributes are shrunk to the smallest exact dtypes,
+            with textual ones replaced by integer codes,
+            so `x` is homogeneous numerical array. See `categories`.
+        max_categories : int, optional
+            Textual attributes holding more distinct values
+            aren't encoded, when compacting.
         """
 
         super().__init__(path)
+        self.compact = compact
+        self.max_categories = max_categories
+
+        if compact:
+            self.preprocessing.append('compact')
 
     @lazy
     def __data_set(self) -> pd.DataFrame:
+        data_set = self._read()
+
+        if not self.compact:
+            self.categories = {}
+            return data_set
+
+        attributes = data_set.columns[1:-1]
+        data_set, self.categories = compact(
+            data_set,
+            attributes,
+            self.max_categories
+        )
+
+        return data_set
+
+    @lazy
+    def duplicates(self) -> Duplicates:
+        """
+        Outcome of `drop_duplicates`, nothing's dropped before it's called.
+        """
+
+        records = len(self.__data_set)
+        return Duplicates(np.ones(records, dtype=bool), 0, 0)
+
+    @lazy
+    def categories(self) -> Dict[str, Dict]:
+        """
+        Integer codes of textual attributes, by attribute.
+        Empty, unless data set is compacted.
+        """
+
+        self.__data_set
+        return self.__dict__['categories']
+
+    def _read(self) -> pd.DataFrame:
+        """
+        Loads the whole table. Override it to support other file formats,
+        sharing the same layout.
+
+        Returns
+        -------
+        pd.DataFrame
+        """
+
         return pd.read_csv(self.path)
 
     @lazy
@@ -47,7 +111,12 @@ class Data(base.Data):
         return self.__extract_X()
 
     def __extract_X(self):
-        return self.__data_set.iloc[:, 1:-1].values
+        x = self.__data_set.iloc[:, 1:-1].values
+
+        if self.compact:
+            x = np.ascontiguousarray(x)
+
+        return x
 
     @abstractproperty
     def y(self):
@@ -61,12 +130,32 @@ class Data(base.Data):
     def attributes(self):
         return self.__data_set.columns[1:-1].values
 
+    @lazy
+    def label(self) -> str:
+        return self.__data_set.columns[-1]
+
+    @lazy
+    def schema(self) -> Dict[str, Column]:
+        schema = infer(self.__data_set[self.attributes])
+
+        # ? Encoded attributes are still categorical.
+        for attribute, codes in self.categories.items():
+            schema[str(attribute)] = Column(STRING, 'object', len(codes))
+
+        return schema
+
     @lazy
     def as_dict(self) -> Dict:
         as_dict = super().as_dict
         as_dict['path'] = self.path.name
         return as_dict
 
+    def chunks(self, chunksize: int = 100000) -> Iterator[pd.DataFrame]:
+        data_set = self.__data_set
+
+        for start in range(0, len(data_set), chunksize):
+            yield data_set.iloc[start:start + chunksize, 1:]
+
     def isna(self) -> np.ndarray:
         """
         Detect missing values.
@@ -89,9 +178,11 @@ class Data(base.Data):
 
         def wrapper(self, *args, **kwargs):
             func(self)
-            self.x = self.__extract_X()
-            self.y = self.__extract_y()
-            return
+            self.preprocessing.append(func.__name__)
+
+            # ? Arrays are extracted again, once they're needed.
+            for cached in ('x', 'y', 'xy', 'schema', 'statistics'):
+                self.__dict__.pop(cached, None)
 
         return wrapper
 
@@ -111,21 +202,20 @@ class Data(base.Data):
         Considering same records, that share also class, first occurrence
         will be kept.
         Considering same records, but when class differs, none will be kept.
+        Records are compared by 64-bit hashes of their values,
+        see `duplicates` for the counts.
 
         """
 
-        # ? This will keep first of duplicated records, that share class.
-        columns = self.__data_set.columns[1:]
-        self.__data_set.drop_duplicates(subset=columns, inplace=True)
+        data_set = self.__data_set
 
-        # ? This will drop duplicate records, that doesn't share class.
-        # ? It's considered to be contradictory knowledge.
-        self.__data_set.drop_duplicates(
-            subset=self.attributes,
-            keep=False,
-            inplace=True
+        self.duplicates = find_duplicates(
+            hash_rows(data_set[self.attributes]),
+            hash_rows(data_set[[self.label]])
         )
 
+        self.__data_set = data_set[self.duplicates.keep]
+
     def describe(self):
         features = self.__data_set[self.attributes]
         return features.describe()
@@ -0,0 +1,129 @@
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Dict
+
+from lazy import lazy
+
+from .. import npy
+from . import single
+
+_SOURCE = 'source.json'
+
+
+class Data(npy.Data):
+    """
+    Handles old school data sets, parsing them only once.
+    Layout is the same as for `csv.single.Data`.
+    First row for the header.
+    Ground truth value in the last column.
+    First column for the record ID.
+
+    On first load table is converted into memory mapped `.npy` sidecar
+    folder. It's reused as long as the `csv` file is unchanged.
+    """
+
+    def __init__(self, path: Path, cache: Path = None, verify: bool = False):
+        """
+        Initiates data set.
+
+        Parameters
+        ----------
+        path : Path
+            Path to your data `csv` file.
+        cache : Path, optional
+            Sidecar folder. Defaults to `.<file name>.coltrane`
+            next to the `csv` file.
+        verify : bool, optional
+            Compare file contents digest, instead of modification time
+            and size, to detect changes.
+        """
+
+        super().__init__(path)
+        self.cache = cache
+        self.verify = verify
+
+    @lazy
+    def folder(self) -> Path:
+        folder = self.cache
+
+        if folder is None:
+            name = '.{}.coltrane'.format(self.path.name)
+            folder = Path(self.path.parent, name)
+
+        folder = Path(folder)
+
+        if not self.__is_fresh(folder):
+            self.__convert(folder)
+
+        return folder
+
+    @lazy
+    def file_digest(self) -> str:
+        return self.__source(self.folder)['digest']
+
+    def __stat(self) -> Dict:
+        stat = os.stat(self.path)
+
+        return {
+            'mtime': stat.st_mtime_ns,
+            'size': stat.st_size
+        }
+
+    def __source(self, folder: Path) -> Dict:
+        with open(Path(folder, _SOURCE), 'r') as source:
+            return json.load(source)
+
+    def __is_fresh(self, folder: Path) -> bool:
+        if not Path(folder, _SOURCE).exists():
+            return False
+
+        source = self.__source(folder)
+
+        if self.verify:
+            return source['digest'] == super().file_digest
+
+        return source['stat'] == self.__stat()
+
+    def __convert(self, folder: Path):
+        data = single.Data(self.path)
+
+        # ? Written aside and swapped, readers never see partial sidecar.
+        # ? Each process writes its own, concurrent first loads don't clash.
+        partial = folder.with_name(
+            '{}.{}.partial'.format(folder.name, os.getpid())
+        )
+
+        shutil.rmtree(partial, ignore_errors=True)
+        npy.dump(data, partial)
+
+        source = {
+            'stat': self.__stat(),
+            'digest': data.file_digest
+        }
+
+        with open(Path(partial, _SOURCE), 'w') as file:
+            json.dump(source, file)
+
+        if self.__is_fresh(folder):
+            # ? Other writer was first, sidecars are identical.
+            shutil.rmtree(partial, ignore_errors=True)
+            return
+
+        stale = folder.with_name(
+            '{}.{}.stale'.format(folder.name, os.getpid())
+        )
+
+        try:
+            os.rename(folder, stale)
+        except OSError:
+            pass
+
+        try:
+            os.rename(partial, folder)
+        except OSError:
+            # ? Other writer was first, sidecars are identical.
+            shutil.rmtree(partial, ignore_errors=True)
+
+        shutil.rmtree(stale, ignore_errors=True)
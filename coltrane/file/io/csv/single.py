@@ -13,7 +13,12 @@ class Data(base.Data):
     First column for the record ID.
     """
 
-    def __init__(self, path: Path):
+    def __init__(
+        self,
+        path: Path,
+        compact: bool = False,
+        max_categories: int = 255
+    ):
         """
         Initiates data set.
 
@@ -21,9 +26,15 @@ class Data(base.Data):
         ----------
         path : Path
             Path to your data `csv` file.
+        compact : bool, optional
+            Whether attributes are shrunk to the smallest exact dtypes,
+            with textual ones replaced by integer codes.
+        max_categories : int, optional
+            Textual attributes holding more distinct values
+            aren't encoded, when compacting.
         """
 
-        super().__init__(path)
+        super().__init__(path, compact, max_categories)
 
     @lazy
     def y(self):
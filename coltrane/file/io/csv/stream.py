@@ -0,0 +1,432 @@
+from dataclasses import dataclass
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Dict, Iterator, List, Union
+
+import numpy as np
+import pandas as pd
+from lazy import lazy
+
+from coltrane.util.mapped import detach
+from coltrane.util.summary import Statistics
+
+from .. import base, npy
+from ..duplicates import Duplicates, find_duplicates, hash_rows
+from ..schema import STRING, Column, from_dtype
+
+
+@dataclass
+class _Scan:
+    records: int
+    missing: np.ndarray
+    feature_hashes: np.ndarray
+    label_hashes: np.ndarray
+    categories: Dict[str, Dict[str, int]]
+    label_width: int
+
+
+class Data(base.Data):
+    """
+    Handles `csv` data sets larger than memory.
+    Layout is the same as for `csv.single.Data`.
+    First row for the header.
+    Ground truth value in the last column.
+    First column for the record ID.
+
+    File is read in chunks. Statistics, missing values and duplicates are
+    computed incrementally, records and labels are written once into
+    memory mapped `.npy` files.
+    Textual attributes are stored in `x` as integer codes,
+    see `categories` for mapping.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        chunksize: int = 100000,
+        dtype: Union[type, Dict[str, type]] = None,
+        x_dtype: type = np.float64,
+        folder: Path = None
+    ):
+        """
+        Initiates data set. File isn't read until it's needed.
+
+        Parameters
+        ----------
+        path : Path
+            Path to your data `csv` file.
+        chunksize : int, optional
+            Number of records read at once.
+        dtype : Union[type, Dict[str, type]], optional
+            Column types, as accepted by `pandas.read_csv`.
+            By default they're inferred from the first chunk,
+            with integer attributes widened to float, so missing values
+            in further chunks don't break parsing.
+        x_dtype : type, optional
+            Type of memory mapped records.
+        folder : Path, optional
+            Where memory mapped arrays are stored.
+            Temporary folder is used by default.
+        """
+
+        super().__init__(path)
+        self.chunksize = chunksize
+        self.dtype = dtype
+        self.x_dtype = x_dtype
+        self.folder = folder
+        self.__version = 0
+
+    @lazy
+    def name(self) -> str:
+        return self.path.stem
+
+    @lazy
+    def columns(self) -> List[str]:
+        return list(pd.read_csv(self.path, nrows=0).columns)
+
+    @lazy
+    def attributes(self) -> np.ndarray:
+        return np.array(self.columns[1:-1], dtype=object)
+
+    @lazy
+    def label(self) -> str:
+        return self.columns[-1]
+
+    @lazy
+    def dtypes(self) -> Dict[str, type]:
+        """
+        Column types used for parsing every chunk.
+        """
+
+        if self.dtype is not None and not isinstance(self.dtype, dict):
+            return {column: self.dtype for column in self.columns}
+
+        head = pd.read_csv(self.path, nrows=self.chunksize)
+        dtypes = {}
+
+        for column in self.columns:
+            dtype = head[column].dtype
+
+            if not pd.api.types.is_numeric_dtype(dtype):
+                dtype = np.dtype(object)
+
+            elif column != self.label and pd.api.types.is_integer_dtype(dtype):
+                dtype = np.dtype(np.float64)
+
+            dtypes[column] = dtype
+
+        dtypes.update(self.dtype or {})
+
+        return dtypes
+
+    @lazy
+    def numerical(self) -> List[str]:
+        """
+        Attributes, that are parsed as numbers.
+        """
+
+        return [
+            attribute
+            for attribute in self.attributes
+            if pd.api.types.is_numeric_dtype(self.dtypes[attribute])
+        ]
+
+    @lazy
+    def categories(self) -> Dict[str, Dict[str, int]]:
+        """
+        Integer codes of textual attributes, by attribute.
+        """
+
+        return self.__scan.categories
+
+    @lazy
+    def schema(self) -> Dict[str, Column]:
+        """
+        Type info of each attribute, from parsing dtypes.
+        Cardinality of textual attributes counts every record in file.
+        """
+
+        schema = {}
+
+        for attribute in self.attributes:
+            if attribute in self.categories:
+                cardinality = len(self.categories[attribute])
+                column = Column(STRING, 'object', cardinality)
+            else:
+                dtype = self.dtypes[attribute]
+                column = from_dtype([attribute], dtype)[attribute]
+
+            schema[attribute] = column
+
+        return schema
+
+    @lazy
+    def mask(self) -> np.ndarray:
+        """
+        Records, that weren't dropped.
+        """
+
+        return np.ones(self.__scan.records, dtype=bool)
+
+    @lazy
+    def duplicates(self) -> Duplicates:
+        """
+        Outcome of `drop_duplicates`, nothing's dropped before it's called.
+        """
+
+        return Duplicates(self.mask, 0, 0)
+
+    @lazy
+    def x(self) -> np.ndarray:
+        return self.__mapped.x
+
+    @lazy
+    def y(self) -> np.ndarray:
+        return self.__mapped.y
+
+    @lazy
+    def xy(self) -> pd.DataFrame:
+        """
+        Records along with labels. It's loaded into memory.
+        """
+
+        xy = pd.DataFrame(np.asarray(self.x), columns=self.attributes)
+        xy[self.label] = np.asarray(self.y)
+        return xy
+
+    @lazy
+    def as_dict(self) -> Dict:
+        as_dict = super().as_dict
+        as_dict['path'] = self.path.name
+        as_dict['type'] = __name__
+        return as_dict
+
+    def chunks(self, chunksize: int = None) -> Iterator[pd.DataFrame]:
+        """
+        Iterates over records, that weren't dropped, reading file in chunks.
+
+        Parameters
+        ----------
+        chunksize : int, optional
+            Number of records read at once, `chunksize` of data set
+            by default.
+
+        Yields
+        -------
+        pd.DataFrame
+            Attributes along with ground truth column.
+        """
+
+        for chunk in self.__read(chunksize):
+            yield chunk[self.mask[chunk.index]].iloc[:, 1:]
+
+    @lazy
+    def statistics(self) -> Statistics:
+        self.__scan
+
+        # ? First scan gathers statistics of all records,
+        # ? once some are dropped, another pass is needed.
+        if 'statistics' in self.__dict__:
+            return self.__dict__['statistics']
+
+        return super().statistics
+
+    def isna(self) -> pd.DataFrame:
+        """
+        Detect missing values in records. It's loaded into memory,
+        use `count_missing` for the summary.
+
+        Returns
+        -------
+        pd.DataFrame[bool]
+        """
+
+        return pd.DataFrame(np.asarray(self.x), columns=self.attributes).isna()
+
+    def describe(self) -> pd.DataFrame:
+        """
+        Statistics of numerical attributes.
+        Quantiles are estimated from bounded sample.
+
+        Returns
+        -------
+        pd.DataFrame
+        """
+
+        return self.statistics.describe()
+
+    def dropna(self):
+        """
+        Drops records, that hold missing value.
+
+        """
+
+        self.__keep(self.mask & (self.__scan.missing == 0), 'dropna')
+
+    def drop_duplicates(self):
+        """
+        Drops every duplicate occurrence.
+        Considering same records, that share also class, first occurrence
+        will be kept.
+        Considering same records, but when class differs, none will be kept.
+        Records are compared by 64-bit hashes of their values,
+        see `duplicates` for the counts.
+
+        """
+
+        index = np.flatnonzero(self.mask)
+
+        duplicates = find_duplicates(
+            self.__scan.feature_hashes[index],
+            self.__scan.label_hashes[index]
+        )
+
+        mask = np.zeros_like(self.mask)
+        mask[index[duplicates.keep]] = True
+
+        self.duplicates = Duplicates(
+            mask,
+            duplicates.dropped,
+            duplicates.contradictory
+        )
+
+        self.__keep(mask, 'drop_duplicates')
+
+    def __keep(self, mask: np.ndarray, step: str):
+        self.mask = mask
+        self.preprocessing.append(step)
+
+        for cached in ('x', 'y', 'xy', 'statistics', '_Data__mapped'):
+            self.__dict__.pop(cached, None)
+
+    def __read(self, chunksize: int = None) -> Iterator[pd.DataFrame]:
+        chunks = pd.read_csv(
+            self.path,
+            chunksize=chunksize or self.chunksize,
+            dtype=self.dtypes
+        )
+
+        start = 0
+
+        # ? Chunks are indexed by record position within the file.
+        for chunk in chunks:
+            chunk.index = pd.RangeIndex(start, start + len(chunk))
+            start += len(chunk)
+            yield chunk
+
+    @lazy
+    def __scan(self) -> _Scan:
+        statistics = Statistics(self.attributes, self.numerical, self.label)
+        missing, feature_hashes, label_hashes = [], [], []
+        textual = [
+            attribute
+            for attribute in self.attributes
+            if attribute not in self.numerical
+        ]
+        categories = {attribute: {} for attribute in textual}
+        label_width = 0
+        records = 0
+
+        for chunk in self.__read():
+            records += len(chunk)
+            statistics.update(chunk.iloc[:, 1:])
+
+            missing.append(chunk.isna().sum(axis=1).values.astype(np.int32))
+
+            feature_hashes.append(hash_rows(chunk[self.attributes]))
+            label_hashes.append(hash_rows(chunk[[self.label]]))
+
+            labels = chunk[self.label]
+
+            if labels.dtype == object:
+                width = labels.dropna().astype(str).str.len().max()
+                label_width = max(label_width, int(width or 0))
+
+            for attribute in textual:
+                codes = categories[attribute]
+
+                for value in chunk[attribute].dropna().unique():
+                    codes.setdefault(value, len(codes))
+
+        self.statistics = statistics
+
+        return _Scan(
+            records=records,
+            missing=np.concatenate(missing or [np.empty(0, np.int32)]),
+            feature_hashes=np.concatenate(
+                feature_hashes or [np.empty(0, np.uint64)]
+            ),
+            label_hashes=np.concatenate(
+                label_hashes or [np.empty(0, np.uint64)]
+            ),
+            categories=categories,
+            label_width=label_width
+        )
+
+    @lazy
+    def __root(self) -> Path:
+        if self.folder is not None:
+            return Path(self.folder)
+
+        # ? Kept private, `folder` option is a part of data set digest.
+        self.__temporary = TemporaryDirectory(prefix='coltrane-')
+        return Path(self.__temporary.name)
+
+    @lazy
+    def __mapped(self) -> npy.Data:
+        # ? Each mask gets its own files, arrays mapped before stay valid.
+        self.__version += 1
+        folder = Path(self.__root, str(self.__version))
+        folder.mkdir(parents=True, exist_ok=True)
+
+        records = int(self.mask.sum())
+        attributes = len(self.attributes)
+
+        label_dtype = self.dtypes[self.label]
+
+        if label_dtype == object:
+            label_dtype = '<U{}'.format(max(self.__scan.label_width, 1))
+
+        x = np.lib.format.open_memmap(
+            Path(folder, npy.X),
+            mode='w+',
+            dtype=self.x_dtype,
+            shape=(records, attributes)
+        )
+
+        y = np.lib.format.open_memmap(
+            Path(folder, npy.Y),
+            mode='w+',
+            dtype=label_dtype,
+            shape=(records,)
+        )
+
+        start = 0
+
+        for chunk in self.chunks():
+            features = chunk[self.attributes].assign(**{
+                attribute: chunk[attribute].map(codes)
+                for attribute, codes in self.categories.items()
+            })
+
+            end = start + len(chunk)
+            x[start:end] = features.values.astype(self.x_dtype)
+            y[start:end] = chunk[self.label].values
+            start = end
+
+        x.flush()
+        y.flush()
+        del x, y
+
+        npy.save_meta(folder, self.name, self.attributes, self.label)
+
+        return npy.Data(folder)
+
+    def __getstate__(self):
+        return detach(
+            self.__dict__,
+            skipped=(
+                'x', 'y', 'mask', 'statistics',
+                '_Data__scan', '_Data__temporary'
+            )
+        )
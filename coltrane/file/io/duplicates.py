@@ -0,0 +1,94 @@
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class Duplicates:
+    """
+    Outcome of duplicates removal.
+
+    Attributes
+    ----------
+    keep : np.ndarray
+        Mask of records, that are kept.
+    dropped : int
+        Number of repeated records, that shared class with the first one.
+    contradictory : int
+        Number of records, that were dropped since same features
+        occurred with different classes.
+    """
+
+    keep: np.ndarray
+    dropped: int
+    contradictory: int
+
+
+def hash_rows(frame: pd.DataFrame) -> np.ndarray:
+    """
+    64-bit hash of each row's values.
+
+    Parameters
+    ----------
+    frame : pd.DataFrame
+
+    Returns
+    -------
+    np.ndarray[uint64]
+    """
+
+    return pd.util.hash_pandas_object(frame, index=False).values
+
+
+def find_duplicates(
+    feature_hashes: np.ndarray,
+    label_hashes: np.ndarray
+) -> Duplicates:
+    """
+    Finds duplicates in a single pass over row hashes.
+    Considering same records, that share also class, first occurrence
+    is kept.
+    Considering same records, but when class differs, none is kept,
+    it's considered to be contradictory knowledge.
+
+    Parameters
+    ----------
+    feature_hashes : np.ndarray[uint64]
+        Hash of each record's attributes.
+    label_hashes : np.ndarray[uint64]
+        Hash of each record's class.
+
+    Returns
+    -------
+    Duplicates
+    """
+
+    records = len(feature_hashes)
+
+    if not records:
+        return Duplicates(np.ones(0, dtype=bool), 0, 0)
+
+    # ? Codes are numbered in order of first occurrence.
+    codes, uniques = pd.factorize(feature_hashes)
+
+    seen = np.maximum.accumulate(codes)
+    first = np.empty(records, dtype=bool)
+    first[0] = True
+    first[1:] = codes[1:] > seen[:-1]
+
+    first_labels = np.empty(len(uniques), dtype=label_hashes.dtype)
+    first_labels[codes[first]] = label_hashes[first]
+
+    conflicting = np.zeros(len(uniques), dtype=bool)
+    conflicting[codes[label_hashes != first_labels[codes]]] = True
+    conflicting = conflicting[codes]
+
+    keep = first & ~conflicting
+    contradictory = int(conflicting.sum())
+
+    return Duplicates(
+        keep=keep,
+        dropped=records - int(keep.sum()) - contradictory,
+        contradictory=contradictory
+    )
@@ -0,0 +1,48 @@
+from pathlib import Path
+
+import pandas as pd
+from lazy import lazy
+
+from .csv import single
+
+
+class Data(single.Data):
+    """
+    Handles data sets stored as Arrow `.feather` table.
+    Layout is the same as for `csv.single.Data`.
+    First column for the record ID.
+    Ground truth value in the last column.
+    Requires `pyarrow`.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        compact: bool = False,
+        max_categories: int = 255
+    ):
+        """
+        Initiates data set.
+
+        Parameters
+        ----------
+        path : Path
+            Path to your data `.feather` file.
+        compact : bool, optional
+            Whether attributes are shrunk to the smallest exact dtypes,
+            with textual ones replaced by integer codes.
+        max_categories : int, optional
+            Textual attributes holding more distinct values
+            aren't encoded, when compacting.
+        """
+
+        super().__init__(path, compact, max_categories)
+
+    def _read(self) -> pd.DataFrame:
+        return pd.read_feather(self.path)
+
+    @lazy
+    def as_dict(self):
+        base = super().as_dict
+        base['type'] = __name__
+        return base
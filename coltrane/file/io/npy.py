@@ -0,0 +1,210 @@
+import json
+from pathlib import Path
+from typing import Dict, Iterable
+
+import numpy as np
+import pandas as pd
+from lazy import lazy
+
+from coltrane.util.mapped import detach
+
+from . import base
+from .duplicates import Duplicates, find_duplicates, hash_rows
+
+X = 'x.npy'
+Y = 'y.npy'
+_META = 'meta.json'
+
+
+class Data(base.Data):
+    """
+    Data set stored as `.npy` arrays within a folder.
+    Arrays are memory mapped, so every process reading them
+    shares the same pages instead of holding its own copy.
+    Pickled instance carries only the path, workers attach by it.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Initiates data set.
+
+        Parameters
+        ----------
+        path : Path
+            Folder created by `dump`.
+        """
+
+        super().__init__(path)
+
+    @lazy
+    def folder(self) -> Path:
+        """
+        Folder holding the arrays.
+        """
+
+        return Path(self.path)
+
+    @lazy
+    def meta(self) -> Dict:
+        with open(Path(self.folder, _META), 'r') as meta:
+            return json.load(meta)
+
+    @lazy
+    def name(self) -> str:
+        return self.meta['name']
+
+    @lazy
+    def attributes(self) -> np.ndarray:
+        return np.array(self.meta['attributes'], dtype=object)
+
+    @lazy
+    def label(self) -> str:
+        return self.meta['label']
+
+    @lazy
+    def x(self) -> np.ndarray:
+        return _load(Path(self.folder, X))
+
+    @lazy
+    def y(self) -> np.ndarray:
+        return _load(Path(self.folder, Y))
+
+    @lazy
+    def duplicates(self) -> Duplicates:
+        """
+        Outcome of `drop_duplicates`, nothing's dropped before it's called.
+        """
+
+        return Duplicates(np.ones(len(self.y), dtype=bool), 0, 0)
+
+    @lazy
+    def xy(self) -> pd.DataFrame:
+        xy = pd.DataFrame(self.x, columns=self.attributes)
+        xy[self.label] = self.y
+        return xy
+
+    @lazy
+    def as_dict(self) -> Dict:
+        as_dict = super().as_dict
+        as_dict['path'] = self.path.name
+        return as_dict
+
+    def isna(self) -> pd.DataFrame:
+        return pd.DataFrame(self.x).isna()
+
+    def describe(self) -> pd.DataFrame:
+        features = pd.DataFrame(self.x, columns=self.attributes)
+        return features.describe()
+
+    def dropna(self):
+        """
+        Drops records, that hold missing feature value.
+        Arrays are loaded into memory.
+
+        """
+
+        self.__keep(~self.isna().any(axis=1).values)
+        self.preprocessing.append('dropna')
+
+    def drop_duplicates(self):
+        """
+        Drops every duplicate occurrence.
+        Considering same records, that share also class, first occurrence
+        will be kept.
+        Considering same records, but when class differs, none will be kept.
+        Arrays are loaded into memory.
+        Records are compared by 64-bit hashes of their values,
+        see `duplicates` for the counts.
+
+        """
+
+        self.duplicates = find_duplicates(
+            hash_rows(pd.DataFrame(self.x)),
+            hash_rows(pd.DataFrame(self.y))
+        )
+
+        self.__keep(self.duplicates.keep)
+        self.preprocessing.append('drop_duplicates')
+
+    def __keep(self, mask: np.ndarray):
+        self.x = np.asarray(self.x[mask])
+        self.y = np.asarray(self.y[mask])
+        self.__dict__.pop('xy', None)
+        self.__dict__.pop('schema', None)
+        self.__dict__.pop('statistics', None)
+
+    def __getstate__(self):
+        return detach(self.__dict__)
+
+
+def dump(data: base.Data, path: Path) -> Data:
+    """
+    Writes records and labels of any data set into `.npy` folder.
+
+    Parameters
+    ----------
+    data : base.Data
+        Source data set.
+    path : Path
+        Destination folder. It will be created if needed.
+
+    Returns
+    -------
+    Data
+        Memory mapped data set.
+    """
+
+    path.mkdir(parents=True, exist_ok=True)
+
+    np.save(Path(path, X), _compact(data.x), allow_pickle=True)
+    np.save(Path(path, Y), _compact(data.y), allow_pickle=True)
+
+    save_meta(path, data.name, data.attributes, data.label)
+
+    return Data(path)
+
+
+def save_meta(path: Path, name: str, attributes: Iterable, label: str):
+    """
+    Describes arrays stored within `.npy` folder.
+    Use it when writing `x.npy` and `y.npy` by yourself.
+
+    Parameters
+    ----------
+    path : Path
+        Destination folder.
+    name : str
+        Data set name.
+    attributes : Iterable
+        Names of columns in `x`.
+    label : str
+        Name of `y`.
+    """
+
+    meta = {
+        'name': name,
+        'attributes': [str(attribute) for attribute in attributes],
+        'label': str(label)
+    }
+
+    with open(Path(path, _META), 'w') as file:
+        json.dump(meta, file)
+
+
+def _compact(values: np.ndarray) -> np.ndarray:
+    values = np.asarray(values)
+
+    # ? Pure string arrays can be mapped as fixed width unicode.
+    if values.dtype == object:
+        if pd.api.types.infer_dtype(values.ravel()) == 'string':
+            values = values.astype(str)
+
+    return values
+
+
+def _load(path: Path) -> np.ndarray:
+    try:
+        return np.load(path, mmap_mode='r')
+    except ValueError:
+        # ? object arrays are pickled, they can't be mapped
+        return np.load(path, allow_pickle=True)
@@ -0,0 +1,130 @@
+from dataclasses import dataclass
+from typing import Dict, Iterable
+
+import numpy as np
+import pandas as pd
+
+INTEGER = 'integer'
+FLOAT = 'float'
+BOOL = 'bool'
+DATETIME = 'datetime'
+STRING = 'string'
+MIXED = 'mixed'
+
+_INFERRED = {
+    'empty': FLOAT,
+    'integer': INTEGER,
+    'floating': FLOAT,
+    'mixed-integer-float': FLOAT,
+    'decimal': FLOAT,
+    'boolean': BOOL,
+    'datetime64': DATETIME,
+    'datetime': DATETIME,
+    'date': DATETIME,
+    'string': STRING,
+    'bytes': STRING,
+    'categorical': STRING
+}
+
+
+@dataclass(frozen=True)
+class Column:
+    """
+    Type info of single attribute.
+    """
+
+    kind: str
+    dtype: str
+    cardinality: int = None
+
+    @property
+    def categorical(self) -> bool:
+        """
+        Attribute holds text values.
+        """
+
+        return self.kind in (STRING, MIXED)
+
+
+def infer(frame: pd.DataFrame) -> Dict[str, Column]:
+    """
+    Classifies columns by their dtype.
+    Only `object` columns are inspected value by value, in C.
+    Cardinality is counted for categorical and boolean columns.
+
+    Parameters
+    ----------
+    frame : pd.DataFrame
+        Attributes of the data set.
+
+    Returns
+    -------
+    Dict[str, Column]
+        Type info by attribute name.
+    """
+
+    return {
+        str(name): _infer_column(frame[name])
+        for name in frame.columns
+    }
+
+
+def from_dtype(
+    attributes: Iterable[str],
+    dtype: np.dtype
+) -> Dict[str, Column]:
+    """
+    Schema of homogeneous records, e.g. numerical array.
+
+    Parameters
+    ----------
+    attributes : Iterable[str]
+        Attribute names.
+    dtype : np.dtype
+        Type shared by every attribute.
+
+    Returns
+    -------
+    Dict[str, Column]
+        Type info by attribute name.
+    """
+
+    column = Column(_kind(dtype), str(dtype))
+    return {str(attribute): column for attribute in attributes}
+
+
+def _infer_column(values: pd.Series) -> Column:
+    kind = _kind(values.dtype)
+    cardinality = None
+
+    if kind == MIXED:
+        inferred = pd.api.types.infer_dtype(values, skipna=True)
+        kind = _INFERRED.get(inferred, MIXED)
+
+        # ? Mixed column is categorical, only if any value is text.
+        if kind == MIXED and not values.map(type).eq(str).any():
+            kind = FLOAT
+
+    if kind in (STRING, MIXED, BOOL):
+        cardinality = int(values.nunique())
+
+    return Column(kind, str(values.dtype), cardinality)
+
+
+def _kind(dtype: np.dtype) -> str:
+    if pd.api.types.is_bool_dtype(dtype):
+        return BOOL
+
+    if pd.api.types.is_integer_dtype(dtype):
+        return INTEGER
+
+    if pd.api.types.is_float_dtype(dtype):
+        return FLOAT
+
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        return DATETIME
+
+    if pd.api.types.is_string_dtype(dtype) and dtype != object:
+        return STRING
+
+    return MIXED
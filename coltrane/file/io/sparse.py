@@ -0,0 +1,370 @@
+import json
+from pathlib import Path
+from typing import Dict, Iterator, Tuple
+
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+from lazy import lazy
+from sklearn.datasets import load_svmlight_file
+
+from coltrane.util.mapped import detach
+from coltrane.util.summary import Statistics
+
+from . import base
+from .duplicates import find_duplicates, hash_rows
+
+DATA = 'data.npy'
+INDICES = 'indices.npy'
+INDPTR = 'indptr.npy'
+Y = 'y.npy'
+_META = 'meta.json'
+
+
+class Data(base.Data):
+    """
+    Data set with records held in `scipy.sparse` CSR matrix,
+    for wide attributes, that are mostly zeros, e.g. one-hot or text.
+    Records are never densified, folds are sliced by rows.
+
+    Reads svmlight / libsvm files, `.npz` files written by `save_npz`,
+    and folders written by `dump`. Arrays of the latter are memory mapped,
+    so every process reading them shares the same pages.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        n_features: int = None,
+        chunksize: int = 100000
+    ):
+        """
+        Initiates data set. File isn't read until it's needed.
+
+        Parameters
+        ----------
+        path : Path
+            svmlight file, `.npz` file or folder created by `dump`.
+        n_features : int, optional
+            Number of attributes of svmlight file,
+            inferred from the highest index by default.
+        chunksize : int, optional
+            Number of records summarized at once.
+        """
+
+        super().__init__(path)
+        self.n_features = n_features
+        self.chunksize = chunksize
+
+    @lazy
+    def meta(self) -> Dict:
+        """
+        Description of folder created by `dump`, empty for other files.
+        """
+
+        path = Path(self.path, _META)
+
+        if not path.exists():
+            return {}
+
+        with open(path, 'r') as meta:
+            return json.load(meta)
+
+    @lazy
+    def name(self) -> str:
+        return self.meta.get('name', Path(self.path).stem)
+
+    @lazy
+    def attributes(self) -> np.ndarray:
+        if 'attributes' in self.meta:
+            return np.array(self.meta['attributes'], dtype=object)
+
+        return super().attributes
+
+    @lazy
+    def label(self) -> str:
+        return self.meta.get('label', 'y')
+
+    @lazy
+    def x(self) -> sp.csr_matrix:
+        x, self.y = self.__load()
+        return x
+
+    @lazy
+    def y(self) -> np.ndarray:
+        self.x
+        return self.__dict__['y']
+
+    @lazy
+    def xy(self) -> pd.DataFrame:
+        """
+        Records along with labels, in sparse columns.
+        """
+
+        return self.__frame(self.x, self.y)
+
+    @lazy
+    def statistics(self) -> Statistics:
+        """
+        Statistics gathered from stored entries, without densifying.
+        Every attribute is numerical.
+
+        Returns
+        -------
+        Statistics
+        """
+
+        statistics = Statistics(
+            self.attributes,
+            self.attributes,
+            self.label,
+            sparse=True
+        )
+
+        x, y = self.x, self.y
+
+        for start in range(0, x.shape[0], self.chunksize):
+            end = start + self.chunksize
+            statistics.update_sparse(x[start:end], y[start:end])
+
+        return statistics
+
+    @lazy
+    def as_dict(self) -> Dict:
+        as_dict = super().as_dict
+        as_dict['path'] = Path(self.path).name
+        as_dict['type'] = __name__
+        return as_dict
+
+    def chunks(self, chunksize: int = None) -> Iterator[pd.DataFrame]:
+        """
+        Iterates over data set in chunks of sparse columns.
+
+        Parameters
+        ----------
+        chunksize : int, optional
+            Number of records in chunk, `chunksize` of data set by default.
+
+        Yields
+        -------
+        pd.DataFrame
+            Attributes along with ground truth column.
+        """
+
+        chunksize = chunksize or self.chunksize
+
+        for start in range(0, self.x.shape[0], chunksize):
+            end = start + chunksize
+            yield self.__frame(self.x[start:end], self.y[start:end])
+
+    def isna(self) -> sp.csr_matrix:
+        """
+        Detect missing values. Only stored entries can be missing,
+        so the mask stays sparse.
+
+        Returns
+        -------
+        sp.csr_matrix[bool]
+        """
+
+        x = self.x
+        # ? Indices are copied, dropping zeros rewrites them in place.
+        mask = sp.csr_matrix(
+            (np.isnan(x.data), x.indices, x.indptr),
+            shape=x.shape,
+            copy=True
+        )
+
+        mask.eliminate_zeros()
+
+        return mask
+
+    def describe(self) -> pd.DataFrame:
+        """
+        Statistics of attributes.
+        Quantiles are estimated from bounded sample of records.
+
+        Returns
+        -------
+        pd.DataFrame
+        """
+
+        return self.statistics.describe()
+
+    def dropna(self):
+        """
+        Drops records, that hold missing value.
+
+        """
+
+        missing = self.isna().getnnz(axis=1) > 0
+        missing |= pd.isna(self.y)
+
+        self.__keep(~missing)
+        self.preprocessing.append('dropna')
+
+    def drop_duplicates(self):
+        """
+        Drops every duplicate occurrence.
+        Considering same records, that share also class, first occurrence
+        will be kept.
+        Considering same records, but when class differs, none will be kept.
+        Records are compared by 64-bit hashes of their stored entries,
+        see `duplicates` for the counts.
+
+        """
+
+        self.duplicates = find_duplicates(
+            _hash_rows(self.x),
+            hash_rows(pd.DataFrame({self.label: self.y}))
+        )
+
+        self.__keep(self.duplicates.keep)
+        self.preprocessing.append('drop_duplicates')
+
+    def __keep(self, mask: np.ndarray):
+        self.x = self.x[mask]
+        self.y = np.asarray(self.y[mask])
+
+        for cached in ('xy', 'schema', 'statistics'):
+            self.__dict__.pop(cached, None)
+
+    def __frame(self, x: sp.spmatrix, y: np.ndarray) -> pd.DataFrame:
+        attributes = [str(attribute) for attribute in self.attributes]
+        frame = pd.DataFrame.sparse.from_spmatrix(x, columns=attributes)
+        frame[self.label] = y
+        return frame
+
+    def __load(self) -> Tuple[sp.csr_matrix, np.ndarray]:
+        path = Path(self.path)
+
+        if path.is_dir():
+            return _load_mapped(path, self.meta['shape'])
+
+        if path.suffix == '.npz':
+            with np.load(path) as archive:
+                y = archive['y']
+
+            return sp.load_npz(path).tocsr(), y
+
+        x, y = load_svmlight_file(str(path), n_features=self.n_features)
+        return x, y
+
+    def __getstate__(self):
+        return detach(self.__dict__)
+
+
+def save_npz(x: sp.spmatrix, y: np.ndarray, path: Path):
+    """
+    Writes records and labels into single `.npz` file.
+    Records are readable by `scipy.sparse.load_npz` as well.
+
+    Parameters
+    ----------
+    x : sp.spmatrix
+        Records.
+    y : np.ndarray
+        Labels.
+    path : Path
+        Destination file.
+    """
+
+    x = sp.csr_matrix(x)
+
+    np.savez(
+        path,
+        format=np.array('csr'),
+        shape=np.array(x.shape),
+        data=x.data,
+        indices=x.indices,
+        indptr=x.indptr,
+        y=_labels(y)
+    )
+
+
+def dump(data: base.Data, path: Path) -> Data:
+    """
+    Writes records of any data set as CSR arrays, along with labels,
+    into `.npy` folder.
+
+    Parameters
+    ----------
+    data : base.Data
+        Source data set.
+    path : Path
+        Destination folder. It will be created if needed.
+
+    Returns
+    -------
+    Data
+        Memory mapped data set.
+    """
+
+    path.mkdir(parents=True, exist_ok=True)
+
+    x = sp.csr_matrix(data.x)
+
+    np.save(Path(path, DATA), x.data)
+    np.save(Path(path, INDICES), x.indices)
+    np.save(Path(path, INDPTR), x.indptr)
+    np.save(Path(path, Y), _labels(data.y))
+
+    meta = {
+        'name': data.name,
+        'attributes': [str(attribute) for attribute in data.attributes],
+        'label': str(data.label),
+        'shape': list(x.shape)
+    }
+
+    with open(Path(path, _META), 'w') as file:
+        json.dump(meta, file)
+
+    return Data(path)
+
+
+def _load_mapped(
+    path: Path,
+    shape: Tuple[int, int]
+) -> Tuple[sp.csr_matrix, np.ndarray]:
+    arrays = [
+        np.load(Path(path, name), mmap_mode='r')
+        for name in (DATA, INDICES, INDPTR, Y)
+    ]
+
+    data, indices, indptr, y = arrays
+
+    # ? Constructor would view arrays as plain `ndarray`, or copy them.
+    x = sp.csr_matrix(tuple(shape), dtype=data.dtype)
+    x.data, x.indices, x.indptr = data, indices, indptr
+
+    return x, y
+
+
+def _labels(y: np.ndarray) -> np.ndarray:
+    y = np.asarray(y)
+
+    # ? Text labels are stored as fixed width unicode, so they can be mapped.
+    if y.dtype == object:
+        y = y.astype(str)
+
+    return y
+
+
+def _hash_rows(x: sp.csr_matrix) -> np.ndarray:
+    x = sp.csr_matrix(x, copy=True)
+    x.sum_duplicates()
+    x.eliminate_zeros()
+
+    # ? Rows are sums of their entries' hashes, so order doesn't matter.
+    entries = hash_rows(pd.DataFrame({
+        'index': x.indices,
+        'value': x.data
+    }))
+
+    hashes = np.zeros(x.shape[0], dtype=np.uint64)
+    filled = np.diff(x.indptr) > 0
+
+    if filled.any():
+        hashes[filled] = np.add.reduceat(entries, x.indptr[:-1][filled])
+
+    return hashes
@@ -0,0 +1,65 @@
+import shutil
+from pathlib import Path
+
+import numpy as np
+from pytest import fixture
+
+from coltrane.executor import Process
+from coltrane.file.io.csv import cached, single
+
+
+@fixture(scope='function')
+def path(tmp_path: Path, iris_path: Path) -> Path:
+    path = Path(tmp_path, iris_path.name)
+    shutil.copy(iris_path, path)
+    return path
+
+
+def test_conversion(path: Path):
+    data = cached.Data(path)
+    source = single.Data(path)
+
+    assert isinstance(data.x, np.memmap)
+    assert np.array_equal(data.x, source.x.astype(float))
+    assert np.array_equal(data.y, source.y)
+    assert data.name == source.name
+    assert data.file_digest == source.file_digest
+
+
+def test_reuse(path: Path):
+    folder = cached.Data(path).folder
+    converted = Path(folder, 'x.npy').stat().st_mtime_ns
+
+    data = cached.Data(path)
+    assert data.folder == folder
+    assert Path(folder, 'x.npy').stat().st_mtime_ns == converted
+
+
+def test_stale(path: Path):
+    cached.Data(path).folder
+
+    with open(path, 'a') as file:
+        file.write('\n151,5.9,3.0,5.1,1.8,Iris-virginica')
+
+    assert cached.Data(path).x.shape == (151, 4)
+    assert cached.Data(path, verify=True).x.shape == (151, 4)
+
+
+def _load(path: Path) -> tuple:
+    return cached.Data(path).x.shape
+
+
+def test_concurrent_conversion(path: Path):
+    lines = path.read_text().splitlines()
+    rows = lines[1:] * 500
+
+    with open(path, 'w') as file:
+        file.write('\n'.join([lines[0]] + rows))
+
+    with Process(n_jobs=4) as executor:
+        shapes = list(executor.starmap(_load, [(path,)] * 4))
+
+    assert shapes == [(len(rows), 4)] * 4
+    assert [folder.name for folder in path.parent.glob('.*')] == [
+        '.{}.coltrane'.format(path.name)
+    ]
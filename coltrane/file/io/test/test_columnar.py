@@ -0,0 +1,31 @@
+from pathlib import Path
+
+import numpy as np
+from pytest import importorskip
+
+from coltrane.file.io import feather, parquet
+from coltrane.file.io.csv import single
+
+
+def test_feather(tmp_path: Path, iris_path: Path):
+    importorskip('pyarrow')
+
+    source = single.Data(iris_path)
+    path = Path(tmp_path, 'iris.feather')
+    source._read().to_feather(path)
+
+    data = feather.Data(path)
+    assert np.array_equal(data.x, source.x)
+    assert np.array_equal(data.y, source.y)
+
+
+def test_parquet(tmp_path: Path, iris_path: Path):
+    importorskip('pyarrow')
+
+    source = single.Data(iris_path)
+    path = Path(tmp_path, 'iris.parquet')
+    source._read().to_parquet(path)
+
+    data = parquet.Data(path)
+    assert np.array_equal(data.x, source.x)
+    assert np.array_equal(data.y, source.y)
@@ -0,0 +1,83 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from pytest import fixture
+
+from ..compact import compact
+from ..csv.single import Data
+from ..schema import STRING
+
+
+@fixture(scope='function')
+def path(tmp_path: Path) -> Path:
+    frame = pd.DataFrame({
+        'id': range(6),
+        'count': [1, 2, 3, 4, 5, 6],
+        'ratio': [0.5, 0.25, np.nan, 1.0, 2.0, 0.125],
+        'precise': [0.1, 0.2, 0.3, 0.4, 0.5, 0.6],
+        'flag': [True, False, True, True, False, False],
+        'color': ['red', 'blue', None, 'red', 'green', 'blue'],
+        'class': ['a', 'b', 'a', 'b', 'a', 'b']
+    })
+
+    path = Path(tmp_path, 'table.csv')
+    frame.to_csv(path, index=False)
+
+    return path
+
+
+def test_compact_frame(path: Path):
+    frame = pd.read_csv(path)
+    compacted, categories = compact(frame, frame.columns[1:-1])
+
+    assert compacted['count'].dtype == np.int8
+    assert compacted['ratio'].dtype == np.float32
+    assert compacted['precise'].dtype == np.float64
+    assert compacted['flag'].dtype == np.uint8
+    assert categories == {'color': {'blue': 0, 'green': 1, 'red': 2}}
+    assert np.isnan(compacted['color'][2])
+
+    # ? Source frame is left intact.
+    assert frame['count'].dtype == np.int64
+
+
+def test_compact_data(path: Path):
+    data = Data(path, compact=True)
+    plain = Data(path)
+
+    assert data.x.dtype == np.float64
+    assert data.x.flags['C_CONTIGUOUS']
+    assert plain.x.dtype == object
+
+    assert data.categories['color']['red'] == 2
+    assert data.schema['color'].kind == STRING
+    assert data.schema['color'].cardinality == 3
+    assert data.digest != plain.digest
+
+    data.dropna()
+    assert len(data.x) == 5
+
+
+def test_max_categories(path: Path):
+    data = Data(path, compact=True, max_categories=2)
+
+    assert data.categories == {}
+    assert data.x.dtype == object
+
+
+def test_compact_bool(tmp_path: Path):
+    path = Path(tmp_path, 'flags.csv')
+
+    pd.DataFrame({
+        'id': range(4),
+        'flag': [True, False, True, False],
+        'count': [1, 2, 3, 4],
+        'ratio': [0.5, 0.25, 1.0, 2.0],
+        'class': ['a', 'b', 'a', 'b']
+    }).to_csv(path, index=False)
+
+    data = Data(path, compact=True)
+
+    assert data.x.dtype == np.float32
+    assert list(data.x[:, 0]) == [1, 0, 1, 0]
@@ -0,0 +1,59 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from coltrane.file.io.csv.single import Data
+
+from ..duplicates import find_duplicates, hash_rows
+
+
+def test_find_duplicates():
+    frame = pd.DataFrame({
+        'a': [1, 1, 2, 2, 3, 1, 4],
+        'b': ['x', 'x', 'y', 'y', 'z', 'x', np.nan],
+        'label': [0, 0, 0, 1, 1, 0, 1]
+    })
+
+    duplicates = find_duplicates(
+        hash_rows(frame[['a', 'b']]),
+        hash_rows(frame[['label']])
+    )
+
+    assert list(duplicates.keep) == [
+        True, False, False, False, True, False, True
+    ]
+
+    assert duplicates.dropped == 2
+    assert duplicates.contradictory == 2
+
+
+def test_matches_pandas(random_state: int):
+    random = np.random.RandomState(random_state)
+
+    frame = pd.DataFrame({
+        'a': random.randint(0, 4, size=1000),
+        'b': random.randint(0, 4, size=1000),
+        'label': random.randint(0, 2, size=1000)
+    })
+
+    duplicates = find_duplicates(
+        hash_rows(frame[['a', 'b']]),
+        hash_rows(frame[['label']])
+    )
+
+    expected = frame.drop_duplicates()
+    expected = expected.drop_duplicates(subset=['a', 'b'], keep=False)
+
+    assert list(frame.index[duplicates.keep]) == list(expected.index)
+
+
+def test_data_counts(iris_path: Path):
+    data = Data(path=iris_path)
+    records = len(data.y)
+
+    data.drop_duplicates()
+
+    assert data.duplicates.dropped == 3
+    assert data.duplicates.contradictory == 0
+    assert len(data.y) == len(data.x) == records - 3
@@ -0,0 +1,43 @@
+import pickle
+from pathlib import Path
+
+import numpy as np
+from pytest import fixture
+
+from coltrane.file.io import npy
+from coltrane.file.io.csv.single import Data
+
+
+@fixture(scope='function')
+def data(tmp_path: Path, iris_path: Path) -> npy.Data:
+    return npy.dump(Data(path=iris_path), tmp_path)
+
+
+def test_dump(data: npy.Data, iris_path: Path):
+    source = Data(path=iris_path)
+
+    assert isinstance(data.x, np.memmap)
+    assert np.array_equal(data.x, source.x.astype(float))
+    assert np.array_equal(data.y, source.y)
+    assert list(data.attributes) == list(source.attributes)
+    assert data.name == source.name
+
+
+def test_pickle_without_arrays(data: npy.Data):
+    data.x
+    data.y
+
+    dumped = pickle.dumps(data)
+    assert len(dumped) < data.x.nbytes
+
+    attached = pickle.loads(dumped)
+    assert np.array_equal(attached.x, data.x)
+
+
+def test_drop_duplicates(data: npy.Data, iris_path: Path):
+    data.drop_duplicates()
+
+    source = Data(path=iris_path)
+    source.drop_duplicates()
+
+    assert data.x.shape == source.x.shape
@@ -0,0 +1,46 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from coltrane.file.io import npy, schema
+from coltrane.file.io.csv import single, stream
+
+
+def test_infer():
+    frame = pd.DataFrame({
+        'integer': [1, 2, 3],
+        'float': [1.0, np.nan, 3.0],
+        'bool': [True, False, True],
+        'datetime': pd.to_datetime(['2020-01-01', '2020-01-02', None]),
+        'string': ['a', 'b', 'a'],
+        'mixed': ['a', 1, 2.0],
+        'numbers': pd.Series([1, 2.5, None], dtype=object)
+    })
+
+    inferred = schema.infer(frame)
+
+    assert inferred['integer'].kind == schema.INTEGER
+    assert inferred['float'].kind == schema.FLOAT
+    assert inferred['bool'].kind == schema.BOOL
+    assert inferred['datetime'].kind == schema.DATETIME
+    assert inferred['string'].kind == schema.STRING
+    assert inferred['string'].cardinality == 2
+    assert inferred['mixed'].categorical
+    assert not inferred['numbers'].categorical
+
+
+def test_loaders(tmp_path: Path, iris_path: Path):
+    source = single.Data(iris_path)
+
+    loaders = [
+        source,
+        stream.Data(iris_path),
+        npy.dump(source, tmp_path)
+    ]
+
+    for data in loaders:
+        assert list(data.schema) == list(source.attributes)
+
+        for column in data.schema.values():
+            assert column.kind == schema.FLOAT
@@ -0,0 +1,150 @@
+import pickle
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+from pytest import fixture
+from sklearn.datasets import dump_svmlight_file
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import accuracy_score, make_scorer
+from sklearn.model_selection import RepeatedStratifiedKFold
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import MaxAbsScaler
+
+from coltrane import Batch
+from coltrane.classification import Inspector, Processor
+from coltrane.executor import Process
+from coltrane.util.summary import Statistics
+
+from .. import sparse
+
+
+@fixture(scope='function')
+def records(random_state: int):
+    x = sp.random(
+        300,
+        50,
+        density=0.05,
+        format='csr',
+        random_state=random_state
+    )
+
+    x.data = np.ceil(x.data * 4)
+    sums = np.asarray(x.sum(axis=1)).ravel()
+    y = (sums > np.median(sums)).astype(np.float64)
+
+    return x, y
+
+
+@fixture(scope='function')
+def data(records, tmp_path: Path) -> sparse.Data:
+    x, y = records
+    path = Path(tmp_path, 'records.svm')
+    dump_svmlight_file(x, y, str(path))
+
+    return sparse.Data(path, n_features=x.shape[1], chunksize=64)
+
+
+def test_svmlight(data: sparse.Data, records):
+    x, y = records
+
+    assert sp.isspmatrix_csr(data.x)
+    assert (data.x != x).nnz == 0
+    assert np.array_equal(data.y, y)
+    assert len(data.schema) == x.shape[1]
+    assert data.name == 'records'
+
+
+def test_npz(records, tmp_path: Path):
+    x, y = records
+    path = Path(tmp_path, 'records.npz')
+    sparse.save_npz(x, y, path)
+
+    data = sparse.Data(path)
+
+    assert (data.x != x).nnz == 0
+    assert (sp.load_npz(path) != x).nnz == 0
+    assert np.array_equal(data.y, y)
+
+
+def test_dump(data: sparse.Data, tmp_path: Path):
+    mapped = sparse.dump(data, Path(tmp_path, 'mapped'))
+
+    assert isinstance(mapped.x.data, np.memmap)
+    assert (mapped.x != data.x).nnz == 0
+    assert list(mapped.attributes) == list(data.attributes)
+
+    dumped = pickle.dumps(mapped)
+    assert len(dumped) < mapped.x.data.nbytes
+
+    attached = pickle.loads(dumped)
+    assert (attached.x != data.x).nnz == 0
+
+
+def test_statistics(data: sparse.Data):
+    attributes = list(data.attributes)
+
+    dense = pd.DataFrame(data.x.toarray(), columns=attributes)
+    dense[data.label] = data.y
+
+    expected = Statistics.of(
+        [dense],
+        attributes,
+        attributes,
+        data.label,
+        sample_size=1000
+    )
+
+    assert np.allclose(data.describe(), expected.describe(), equal_nan=True)
+    assert data.statistics.cardinality == expected.cardinality
+    assert data.statistics.class_balance == expected.class_balance
+
+
+def test_preprocessing(data: sparse.Data):
+    x, y = data.x.copy(), data.y.copy()
+
+    duplicated = sp.vstack([x, x[:10], x[10:12]], format='lil')
+    duplicated[0, 0] = np.nan
+
+    data.x = duplicated.tocsr()
+    data.y = np.concatenate([y, y[:10], 1 - y[10:12]])
+
+    data.dropna()
+
+    assert data.x.shape[0] == len(data.y) == len(y) + 11
+
+    records = pd.DataFrame(data.x.toarray())
+    expected = records.assign(label=data.y).drop_duplicates()
+    expected = expected.drop_duplicates(subset=records.columns, keep=False)
+
+    data.drop_duplicates()
+
+    assert data.x.shape[0] == len(data.y) == len(expected)
+    assert data.duplicates.dropped >= 9
+    assert data.duplicates.contradictory >= 4
+
+
+def test_processing(data: sparse.Data, random_state: int, tmp_path: Path):
+    Inspector(headless=True).inspect(data, output=tmp_path)
+
+    batch = Batch(
+        data,
+        pipeline=Pipeline(steps=[
+            ('max-abs-scaler', MaxAbsScaler()),
+            ('logistic', LogisticRegression())
+        ]),
+        selection=RepeatedStratifiedKFold(
+            n_splits=3,
+            n_repeats=1,
+            random_state=random_state
+        ),
+        scorers={'accuracy': make_scorer(accuracy_score)},
+        multiprocessing=True
+    )
+
+    with Processor(executor=Process(n_jobs=2), headless=True) as processor:
+        stats = processor.process(batch, output=tmp_path)
+
+    assert len(stats.splits) == 3
+    assert sp.issparse(data.x)
@@ -0,0 +1,70 @@
+import pickle
+from pathlib import Path
+
+import numpy as np
+from pytest import fixture
+
+from coltrane.classification import Inspector
+from coltrane.file.io.csv import single, stream
+
+__LOG = Path('log')
+
+
+@fixture(scope='function')
+def data(iris_path: Path) -> stream.Data:
+    return stream.Data(path=iris_path, chunksize=40)
+
+
+def test_records(data: stream.Data, iris_path: Path):
+    source = single.Data(path=iris_path)
+
+    assert isinstance(data.x, np.memmap)
+    assert np.allclose(data.x, source.x.astype(float))
+    assert np.array_equal(data.y, source.y)
+
+
+def test_statistics(data: stream.Data, iris_path: Path):
+    source = single.Data(path=iris_path)
+
+    assert np.allclose(data.describe(), source.describe())
+    assert data.count_missing() == source.count_missing()
+    assert data.statistics.class_balance == {
+        'Iris-setosa': 50,
+        'Iris-versicolor': 50,
+        'Iris-virginica': 50
+    }
+
+
+def test_drop_duplicates(data: stream.Data, iris_path: Path):
+    source = single.Data(path=iris_path)
+
+    data.drop_duplicates()
+    source.drop_duplicates()
+
+    assert np.allclose(data.x, source.x.astype(float))
+    assert np.allclose(data.describe(), source.describe())
+
+
+def test_pickle_without_arrays(data: stream.Data):
+    data.x
+    data.y
+
+    dumped = pickle.dumps(data)
+    assert len(dumped) < data.x.nbytes
+
+    attached = pickle.loads(dumped)
+    assert np.array_equal(attached.x, data.x)
+
+
+def test_inspection(data: stream.Data):
+    inspector = Inspector()
+    inspector.inspect(data, output=__LOG)
+
+
+def test_digest_after_loading(data: stream.Data):
+    digest = data.digest
+    data.x
+
+    # ? Temporary folder of mapped records isn't a part of the digest.
+    assert data.folder is None
+    assert data.digest == digest
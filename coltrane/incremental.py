@@ -0,0 +1,210 @@
+from dataclasses import dataclass
+from functools import wraps
+from inspect import signature
+from typing import Any, Iterator, Tuple
+
+import numpy as np
+from sklearn.pipeline import Pipeline
+
+# ? Methods, whose outputs are gathered chunk by chunk.
+_METHODS = (
+    'predict',
+    'predict_proba',
+    'predict_log_proba',
+    'decision_function'
+)
+
+
+class Rows:
+    """
+    Records of data set selected by index. They're read only chunk by chunk,
+    so memory mapped records are never loaded whole.
+    """
+
+    def __init__(self, x: Any, index: np.ndarray, batch_size: int):
+        """
+        Parameters
+        ----------
+        x : Any
+            Records of data set, e.g. memory mapped `np.ndarray`
+            or `scipy.sparse` matrix.
+        index : np.ndarray
+            Selected records.
+        batch_size : int
+            Number of records in chunk.
+        """
+
+        self.x = x
+        self.index = index
+        self.batch_size = batch_size
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return (len(self.index),) + tuple(self.x.shape[1:])
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __iter__(self) -> Iterator[Any]:
+        for start in range(0, len(self.index), self.batch_size):
+            yield self.x[self.index[start:start + self.batch_size]]
+
+
+@dataclass(frozen=True)
+class Incremental:
+    """
+    Out-of-core learning, for estimators with `partial_fit`, e.g.
+    `SGDClassifier`, `MiniBatchKMeans`, naive Bayes or `IncrementalPCA`.
+    Training records are read from data set in mini-batches,
+    test records are scored chunk by chunk, so neither fold
+    is ever held in memory whole. Labels, single column, are sliced as usual.
+
+    Steps are fitted one after another, each by its own pass
+    over training records, transformed by steps already fitted.
+    Final estimator makes `epochs` passes.
+
+    Parameters
+    ----------
+    batch_size : int, optional
+        Number of records in mini-batch.
+    epochs : int, optional
+        Number of passes of final estimator over training records.
+    """
+
+    batch_size: int = 1000
+    epochs: int = 1
+
+    def __post_init__(self):
+        if self.batch_size < 1:
+            raise ValueError('Mini-batch must hold at least one record.')
+
+        if self.epochs < 1:
+            raise ValueError('At least one epoch must be run.')
+
+    def rows(self, x: Any, index: np.ndarray) -> Rows:
+        """
+        Lazily selects records.
+
+        Parameters
+        ----------
+        x : Any
+            Records of data set.
+        index : np.ndarray
+            Selected records.
+
+        Returns
+        -------
+        Rows
+        """
+
+        return Rows(x, index, self.batch_size)
+
+    def fit(
+        self,
+        pipeline: Pipeline,
+        x: Rows,
+        y: np.ndarray,
+        classes: np.ndarray = None
+    ) -> Pipeline:
+        """
+        Fits pipeline by `partial_fit` of its steps.
+
+        Parameters
+        ----------
+        pipeline : Pipeline
+            Unfitted pipeline. Each step must implement `partial_fit`.
+        x : Rows
+            Training records.
+        y : np.ndarray
+            Training labels.
+        classes : np.ndarray, optional
+            Every class of data set, passed to the first `partial_fit`
+            of classifiers, as some of them may be absent from it.
+
+        Returns
+        -------
+        Pipeline
+            Fitted pipeline.
+        """
+
+        steps = [
+            step
+            for _, step in pipeline.steps
+            if step is not None and step != 'passthrough'
+        ]
+
+        for step in steps:
+            if not hasattr(step, 'partial_fit'):
+                raise TypeError(
+                    '{} can\'t be fitted incrementally, '
+                    'it has no partial_fit.'.format(type(step).__name__)
+                )
+
+        *transformers, estimator = steps
+
+        for index, transformer in enumerate(transformers):
+            for x_batch, y_batch in self.__batches(x, y, transformers[:index]):
+                transformer.partial_fit(x_batch, y_batch)
+
+        kwargs = {}
+
+        if classes is not None:
+            parameters = signature(estimator.partial_fit).parameters
+
+            if 'classes' in parameters:
+                kwargs['classes'] = classes
+
+        for _ in range(self.epochs):
+            for x_batch, y_batch in self.__batches(x, y, transformers):
+                estimator.partial_fit(x_batch, y_batch, **kwargs)
+
+        return pipeline
+
+    def __batches(
+        self,
+        x: Rows,
+        y: np.ndarray,
+        transformers: list
+    ) -> Iterator[Tuple[Any, np.ndarray]]:
+
+        for start, x_batch in zip(range(0, len(x), x.batch_size), x):
+            for transformer in transformers:
+                x_batch = transformer.transform(x_batch)
+
+            yield x_batch, y[start:start + x.batch_size]
+
+
+class ChunkedPredictions:
+    """
+    Fitted estimator proxy, that predicts `Rows` chunk by chunk.
+    Only predictions are gathered, records are released after each chunk.
+    Everything else is delegated to the estimator.
+    """
+
+    def __init__(self, estimator: Any):
+        """
+        Parameters
+        ----------
+        estimator : Any
+            Fitted estimator, e.g. pipeline.
+        """
+
+        self.estimator = estimator
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self.estimator, name)
+
+        if name not in _METHODS:
+            return attribute
+
+        @wraps(attribute)
+        def chunked(x, *args, **kwargs):
+            if not isinstance(x, Rows):
+                return attribute(x, *args, **kwargs)
+
+            return np.concatenate([
+                attribute(chunk, *args, **kwargs)
+                for chunk in x
+            ])
+
+        return chunked
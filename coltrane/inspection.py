@@ -1,20 +1,30 @@
 from abc import ABC, abstractmethod
+from dataclasses import asdict
 from pathlib import Path
+from typing import Iterable
 
-import numpy as np
 import pandas as pd
 from austen import Logger
 
+from coltrane.executor import Executor, Serial
 from coltrane.file.io.base import Data
 from coltrane.util import Plot
+from coltrane.util.summary import Statistics
 
 
 class Inspector(ABC):
 
-    def __init__(self):
+    def __init__(self, headless: bool = False):
+        """
+        Parameters
+        ----------
+        headless : bool, optional
+            Whether plotting is skipped, so `plotly` is never imported.
+        """
+
         super(Inspector, self).__init__()
 
-        self.plot = Plot()
+        self.plot = Plot(headless=headless)
 
     def inspect(self, data: Data, output: Path):
         """
@@ -37,35 +47,86 @@ class Inspector(ABC):
         with Logger(log_dir) as logger:
             logger.add_entry('data', data.as_dict)
 
-            x = data.x
+            # ? Single pass over the data set.
+            statistics = data.statistics
+            schema = data.schema
 
             summary = {}
-            x_count, attributes_count = x.shape
 
             summary['records'] = {}
-            summary['records']['count'] = x_count
+            summary['records']['count'] = statistics.records
 
-            missing_values = np.count_nonzero(data.isna())
+            missing_values = statistics.missing_count
             summary['records']['missing-values'] = missing_values
 
             summary['attributes'] = {}
-            summary['attributes']['count'] = attributes_count
-
-            categorical_attributes = self.__get_categorical_attributes(data)
-            summary['attributes']['categorical'] = categorical_attributes
-
-            numerical_attributes = self.__get_numerical_attributes(data)
-            summary['attributes']['numerical'] = numerical_attributes
+            summary['attributes']['count'] = len(schema)
+
+            summary['attributes']['categorical'] = [
+                attribute
+                for attribute, column in schema.items()
+                if column.categorical
+            ]
+
+            summary['attributes']['numerical'] = [
+                attribute
+                for attribute, column in schema.items()
+                if not column.categorical
+            ]
+
+            summary['attributes']['schema'] = {
+                attribute: asdict(column)
+                for attribute, column in schema.items()
+            }
+
+            summary['attributes']['cardinality'] = {
+                attribute: statistics.cardinality[str(attribute)]
+                for attribute in schema
+            }
 
             summary['post'] = self.__post_inspect(data, logger)
 
-            description = data.describe().to_dict()
+            description = statistics.describe().to_dict()
 
             logger.save_json(description, 'description')
             logger.save_json(summary, 'summary')
 
             return summary
 
+    def summarize(
+        self,
+        partitions: Iterable[Data],
+        executor: Executor = None
+    ) -> Statistics:
+        """
+        Gathers statistics of data set split into partitions,
+        e.g. separate files. Each partition is summarized by the executor,
+        results are merged.
+
+        Parameters
+        ----------
+        partitions : Iterable[Data]
+            Parts of the data set, sharing attributes.
+        executor : Executor, optional
+            Runs partitions in parallel. Serial by default.
+
+        Returns
+        -------
+        Statistics
+        """
+
+        executor = executor or Serial()
+        tasks = [(partition,) for partition in partitions]
+        statistics = None
+
+        for partial in executor.starmap(_statistics, tasks):
+            if statistics is None:
+                statistics = partial
+            else:
+                statistics.merge(partial)
+
+        return statistics
+
     def calculate_correlation(self, data: Data, method: str = 'pearson'):
         data = data.xy
         corr = data.corr(method=method)
@@ -85,27 +146,6 @@ class Inspector(ABC):
     def __post_inspect(self, data: Data, logger: Logger):
         pass
 
-    def __get_numerical_attributes(self, data: Data):
-        numerical = []
-
-        for attribute, values in zip(data.attributes, data.x.T):
-            any_categorical = self.__any_categorical(values)
-
-            if not any_categorical:
-                numerical.append(attribute)
-
-        return numerical
-
-    def __get_categorical_attributes(self, data: Data):
-        categorical = []
-
-        for attribute, values in zip(data.attributes, data.x.T):
-            any_categorical = self.__any_categorical(values)
-
-            if any_categorical:
-                categorical.append(attribute)
-
-        return categorical
 
-    def __any_categorical(self, values):
-        return any(type(value) is str for value in values)
+def _statistics(data: Data) -> Statistics:
+    return data.statistics
@@ -1,27 +1,119 @@
-import itertools
+import asyncio
+import warnings
 from abc import ABC, abstractmethod
-from copy import deepcopy
-from multiprocessing import Pool
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from timeit import default_timer
-from typing import Dict, List
+from tempfile import TemporaryDirectory
+from typing import (AsyncIterator, Callable, Dict, Iterable, Iterator, List,
+                    Mapping, Set, Tuple, Union)
 
+import numpy as np
+import scipy.sparse as sp
 from austen import Logger
+from sklearn.base import clone, is_classifier
 from sklearn.metrics._scorer import _BaseScorer
 from sklearn.pipeline import Pipeline
 from tqdm.auto import tqdm
 
 from coltrane import Batch
+from coltrane.executor import Executor, Process, Serial, Thread
+from coltrane.file.io import npy, sparse
 from coltrane.file.io.base import Data
-from coltrane.util import Plot
+from coltrane.incremental import ChunkedPredictions
+from coltrane.racing import Racing
+from coltrane.util import Plot, PrefixCache, SplitCache
+from coltrane.util.fingerprint import digest, digest_array
+from coltrane.util.profile import Timings, instrument
+from coltrane.util.plan import SplitPlan
+from coltrane.util.retention import Retention
+from coltrane.util.scoring import CachedPredictions
+from coltrane.util.sink import LogSink, Records
 from coltrane.util.stats import BatchStats, SplitStats
 
+# ? Gets batch and its stats, as splits complete. `True` stops the batch.
+Callback = Callable[[Batch, BatchStats], bool]
+
+
+@dataclass
+class _Progress:
+    """
+    State of batches being processed, shared by sync and async loops.
+    """
+
+    batches: List[Batch]
+    shared: List[Batch]
+    loggers: List[Logger]
+    models: List[Path]
+    splits: SplitPlan
+    splits_stats: List[Dict[int, SplitStats]]
+    live: List[BatchStats]
+    executor: Executor
+    sink: LogSink
+    rungs: List[int]
+    callback: Callback = None
+    racing: Racing = None
+    alive: List[int] = field(default_factory=list)
+    stopped: Set[int] = field(default_factory=set)
+    scheduled: List[Tuple[int, int]] = field(default_factory=list)
+
 
 class Processor(ABC):
 
-    def __init__(self):
+    def __init__(
+        self,
+        executor: Executor = None,
+        cache: SplitCache = None,
+        prefix_cache: PrefixCache = None,
+        retention: Retention = None,
+        trace_memory: bool = False,
+        headless: bool = False,
+        shard: Tuple[int, int] = None,
+        plans: Path = None
+    ):
+        """
+        Parameters
+        ----------
+        executor : Executor, optional
+            Backend used for batches with `multiprocessing` enabled.
+            Defaults to process pool over all cores.
+            Its workers are reused across batches,
+            call `close` or use processor as context manager to shut them down.
+        cache : SplitCache, optional
+            Already processed splits are loaded from it instead of refitting.
+            Newly processed ones are stored there.
+        prefix_cache : PrefixCache, optional
+            Transformers preceding final estimator are taken from it,
+            when already fitted on the same training data.
+        retention : Retention, optional
+            Which fitted pipelines are persisted, each split's by default.
+            Stats refer to them on disk, instead of holding copies.
+        trace_memory : bool, optional
+            Whether peak memory of each split is traced.
+            It slows down allocations, so it's disabled by default.
+        headless : bool, optional
+            Whether plotting is skipped, so `plotly` is never imported.
+        shard : Tuple[int, int], optional
+            Index and count of shards, e.g. `(0, 4)`.
+            (pipeline, split) tasks are dealt among shards deterministically,
+            only tasks of this one are run. Combine with `cache` shared
+            by all shards, to gather their results.
+            Racing and early stopping aren't supported.
+        plans : Path, optional
+            Folder of split plans, keyed by data fingerprint and selection,
+            so splits are computed once across runs, see `SplitPlan`.
+            Plans live in temporary folder for a single run by default.
+        """
+
         super(Processor, self).__init__()
-        self.plot = Plot()
+        self.plot = Plot(headless=headless)
+        self.executor = executor or Process()
+        self.cache = cache
+        self.prefix_cache = prefix_cache
+        self.retention = retention or Retention()
+        self.trace_memory = trace_memory
+        self.shard = shard
+        self.plans = plans
 
     @abstractmethod
     def __post_split(
@@ -35,102 +127,720 @@ class Processor(ABC):
     ):
         pass
 
-    def process(self, batch: Batch, output: Path) -> BatchStats:
+    def process(
+        self,
+        batch: Batch,
+        output: Path,
+        callback: Callback = None
+    ) -> BatchStats:
+        """
+        Evaluates batch pipeline over every split of its data.
+
+        Parameters
+        ----------
+        batch : Batch
+            Defines data, pipeline, selection and scorers.
+        output : Path
+            Batch is logged under its hash.
+        callback : Callback, optional
+            Called with batch and its stats, as each split completes.
+            Returning `True` stops scheduling remaining splits.
+
+        Returns
+        -------
+        BatchStats
+            Stats of processed splits, in split order.
+        """
 
         # batch.pprint()
 
-        log_dir = Path(output, batch.data.name, batch.as_nice_hash)
-        with Logger(log_dir) as logger:
+        stats, = self._process_batches([batch], output, callback)
+
+        # self.plot.scores(stats.grouped_scores)
+
+        return stats
 
+    def sweep(
+        self,
+        batch: Batch,
+        pipelines: Union[Mapping[str, Pipeline], Iterable],
+        output: Path,
+        callback: Callback = None
+    ) -> Dict[str, BatchStats]:
+        """
+        Evaluates many pipelines against batch data, in a single run.
+        Data is loaded, labels encoded and split only once,
+        every (pipeline, split) pair is scheduled on the same executor.
+
+        Parameters
+        ----------
+        batch : Batch
+            Defines data, selection, scorers and base pipeline.
+        pipelines : Union[Mapping[str, Pipeline], Iterable]
+            Named pipelines, list of pipelines, or parameter grid
+            applied to batch pipeline. See `Batch.sweep`.
+        output : Path
+            Each configuration is logged under its own hash.
+        callback : Callback, optional
+            Called with configuration's batch and its stats,
+            as each split completes.
+            Returning `True` stops scheduling its remaining splits.
+
+        Returns
+        -------
+        Dict[str, BatchStats]
+            Stats of each configuration, in the order of `pipelines`.
+        """
+
+        batches = batch.sweep(pipelines)
+        stats = self._process_batches(
+            list(batches.values()),
+            output,
+            callback
+        )
+
+        return dict(zip(batches.keys(), stats))
+
+    def race(
+        self,
+        batch: Batch,
+        pipelines: Union[Mapping[str, Pipeline], Iterable],
+        output: Path,
+        racing: Racing,
+        callback: Callback = None
+    ) -> Dict[str, BatchStats]:
+        """
+        Sweep, that prunes worse configurations as it goes.
+        Every configuration is evaluated on the first rung of splits,
+        only the best ones advance to further rungs, see `Racing`.
+
+        Parameters
+        ----------
+        batch : Batch
+            Defines data, selection, scorers and base pipeline.
+        pipelines : Union[Mapping[str, Pipeline], Iterable]
+            Named pipelines, list of pipelines, or parameter grid
+            applied to batch pipeline. See `Batch.sweep`.
+        output : Path
+            Each configuration is logged under its own hash.
+        racing : Racing
+            Rungs and pruning policy.
+        callback : Callback, optional
+            Called with configuration's batch and its stats,
+            as each split completes.
+            Returning `True` stops scheduling its remaining splits.
+
+        Returns
+        -------
+        Dict[str, BatchStats]
+            Stats of each configuration, in the order of `pipelines`.
+            Pruned ones hold only splits of rungs they took part in.
+        """
+
+        batches = batch.sweep(pipelines)
+
+        stats = self._process_batches(
+            list(batches.values()),
+            output,
+            callback,
+            racing
+        )
+
+        return dict(zip(batches.keys(), stats))
+
+    def _process_batches(
+        self,
+        batches: List[Batch],
+        output: Path,
+        callback: Callback = None,
+        racing: Racing = None
+    ) -> List[BatchStats]:
+        """
+        Processes batches sharing data, encoder and selection.
+        Splits are run in rungs, when racing.
+        """
+
+        with ExitStack() as stack:
+            progress = self.__open(stack, batches, output, callback, racing)
+
+            for tasks, total in self.__rungs(progress):
+                results = progress.executor.imap_unordered(
+                    self._process_split,
+                    tasks,
+                    total=total
+                )
+
+                processed = tqdm(results, desc='Splits', total=total)
+
+                for task_index, result in processed:
+                    if self.__collect(progress, task_index, result):
+                        break
+
+                # ? Cancels splits, that haven't started yet.
+                results.close()
+                processed.close()
+
+            return self.__close(progress)
+
+    async def process_async(
+        self,
+        batch: Batch,
+        output: Path,
+        callback: Callback = None,
+        terminate: bool = False
+    ) -> AsyncIterator[SplitStats]:
+        """
+        Evaluates batch pipeline over every split of its data,
+        without blocking the event loop. Splits run on processor's executor,
+        so concurrent batches share its workers.
+        Batches without `multiprocessing` run on a single thread.
+
+        ```py
+        async for stats in processor.process_async(batch, output):
+            print(stats.scores)
+        ```
+
+        Closing the iterator, or cancelling the task iterating it,
+        cancels splits, that haven't started yet.
+
+        Parameters
+        ----------
+        batch : Batch
+            Defines data, pipeline, selection and scorers.
+        output : Path
+            Batch is logged under its hash.
+        callback : Callback, optional
+            Called with batch and its stats, as each split completes.
+            Returning `True` stops scheduling remaining splits.
+        terminate : bool, optional
+            Whether cancellation shuts down executor's workers as well,
+            stopping splits, that are already running, see
+            `Executor.terminate`. Thread workers can't be stopped,
+            their running splits are left to finish in background.
+            Other batches sharing the executor are interrupted too.
+
+        Yields
+        -------
+        SplitStats
+            Stats of each split, in order of completion.
+        """
+
+        loop = asyncio.get_running_loop()
+
+        with ExitStack() as stack:
+            # ? Loading data and writing split plan happen off the loop.
+            progress = await loop.run_in_executor(
+                None,
+                self.__open,
+                stack,
+                [batch],
+                output,
+                callback
+            )
+
+            # ? Serial executor would run splits within the loop.
+            if isinstance(progress.executor, Serial):
+                progress.executor = stack.enter_context(Thread(n_jobs=1))
+
+            try:
+                for tasks, total in self.__rungs(progress):
+                    results = progress.executor.aimap_unordered(
+                        self._process_split,
+                        tasks,
+                        total=total
+                    )
+
+                    try:
+                        async for task_index, result in results:
+                            done = self.__collect(progress, task_index, result)
+                            stats, _ = result
+                            yield stats
+
+                            if done:
+                                break
+                    finally:
+                        # ? Cancels splits, that haven't started yet.
+                        await results.aclose()
+
+            except (asyncio.CancelledError, GeneratorExit):
+                if terminate:
+                    # ? Stopping workers mustn't block the loop.
+                    await loop.run_in_executor(
+                        None,
+                        progress.executor.terminate
+                    )
+
+                raise
+
+            await loop.run_in_executor(None, self.__close, progress)
+
+    def __open(
+        self,
+        stack: ExitStack,
+        batches: List[Batch],
+        output: Path,
+        callback: Callback = None,
+        racing: Racing = None
+    ) -> '_Progress':
+        """
+        Prepares loggers, encoder, split plan and cached splits.
+        Contexts are entered into the stack.
+        """
+
+        base = batches[0]
+
+        # ? Each shard would decide on its own partial results.
+        if self.shard and racing is not None:
+            raise ValueError('Racing can\'t be sharded.')
+
+        if self.shard and any(batch.stopping for batch in batches):
+            raise ValueError('Early stopping can\'t be sharded.')
+
+        if not base.deterministic:
+            # ? Shards would split records differently.
+            if self.shard:
+                raise ValueError(
+                    'Sharded selection must be deterministic, '
+                    'set integer random_state.'
+                )
+
+            if self.cache:
+                warnings.warn(
+                    'Selection isn\'t deterministic, splits aren\'t cached. '
+                    'Set integer random_state to cache them.'
+                )
+
+        loggers = []
+        models = []
+
+        for batch in batches:
+            log_dir = Path(output, batch.data.name, batch.as_nice_hash)
+            logger = stack.enter_context(Logger(log_dir))
             logger.save_json(batch.as_dict, 'batch')
+            loggers.append(logger)
+            models.append(Path(log_dir, 'models'))
 
-            stats = self._process_batch(batch, logger)
+        if base.encoder:
+            base.encoder.fit(base.data.y)
 
-            # self.plot.scores(stats.grouped_scores)
+            for logger in loggers:
+                logger.save_obj(base.encoder, 'encoder')
 
-            return stats
+        # ? Workers get split index, they read indices from the plan.
+        splits = stack.enter_context(self.__plan(base))
 
-    def _process_batch(
-        self,
-        batch: Batch,
-        logger: Logger
-    ) -> BatchStats:
+        splits_stats = [{} for _ in batches]
 
-        if batch.encoder:
-            batch.encoder.fit(batch.data.y)
-            logger.save_obj(batch.encoder, 'encoder')
+        if self.cache and base.deterministic:
+            for split_index in range(len(splits)):
+                for batch_index, batch in enumerate(batches):
+                    stats = self.cache.get(batch.fingerprint, split_index)
+
+                    if stats is None:
+                        continue
+
+                    # ? Model might have been pruned since it was cached.
+                    if stats.model and not stats.model.exists:
+                        stats.model = None
+
+                    splits_stats[batch_index][split_index] = stats
+
+        live = [
+            BatchStats(list(stats.values()), total=len(splits))
+            for stats in splits_stats
+        ]
 
-        splits = batch.selection.split(batch.data.x, batch.data.y)
+        missing = sum(len(splits) - len(stats) for stats in splits_stats)
 
-        splits = [
-            (batch, split_index, train_index, test_index, logger) for
-            split_index, (train_index, test_index) in enumerate(splits)
+        if not base.multiprocessing or not missing:
+            executor = Serial()
+        else:
+            executor = self.executor
+
+        rungs = [len(splits)]
+
+        if racing:
+            rungs = racing.rungs(len(splits), base.repeat_size)
+
+        # ? Closed before loggers, so every record gets written.
+        sink = stack.enter_context(LogSink())
+
+        data = stack.enter_context(self.__share(base.data, executor))
+
+        return _Progress(
+            batches=batches,
+            shared=[self.__with_data(batch, data) for batch in batches],
+            loggers=loggers,
+            models=models,
+            splits=splits,
+            splits_stats=splits_stats,
+            live=live,
+            executor=executor,
+            sink=sink,
+            rungs=rungs,
+            callback=callback,
+            racing=racing,
+            alive=list(range(len(batches)))
+        )
+
+    def __rungs(
+        self,
+        progress: '_Progress'
+    ) -> Iterator[Tuple[Iterator[tuple], int]]:
+        """
+        Tasks of each rung, along with their count.
+        Survivors are picked before each rung, when racing.
+        """
+
+        start = 0
+
+        for rung, stop in enumerate(progress.rungs):
+            if rung and progress.racing:
+                progress.alive = progress.racing.survivors(
+                    progress.live,
+                    progress.alive
+                )
+
+            # ? Split-major order, so pipelines sharing preprocessing
+            # ? can reuse prefix fitted on the same split.
+            pending = [
+                (batch_index, split_index)
+                for split_index in range(start, stop)
+                for batch_index in progress.alive
+                if split_index not in progress.splits_stats[batch_index]
+                and self.__in_shard(
+                    split_index * len(progress.batches) + batch_index
+                )
+            ]
+
+            start = stop
+            progress.scheduled = []
+
+            yield self.__tasks(progress, pending), len(pending)
+
+            progress.alive = [
+                index
+                for index in progress.alive
+                if index not in progress.stopped
+            ]
+
+            if not progress.alive:
+                break
+
+    def __tasks(
+        self,
+        progress: '_Progress',
+        pending: List[Tuple[int, int]]
+    ) -> Iterator[tuple]:
+        # ? Taken lazily by the executor,
+        # ? so splits of stopped batches are never scheduled.
+        for batch_index, split_index in pending:
+            if batch_index in progress.stopped:
+                continue
+
+            progress.scheduled.append((batch_index, split_index))
+
+            # ? Taken as late as possible, so worse models aren't dumped
+            # ? by workers only to be pruned afterwards.
+            threshold = self.retention.threshold(
+                list(progress.splits_stats[batch_index].values())
+            )
+
+            yield (
+                progress.shared[batch_index],
+                split_index,
+                progress.splits,
+                progress.models[batch_index],
+                threshold
+            )
+
+    def __collect(
+        self,
+        progress: '_Progress',
+        task_index: int,
+        result: Tuple[SplitStats, Records]
+    ) -> bool:
+        """
+        Stores stats of processed split.
+        Returns `True`, once every batch of the rung is stopped.
+        """
+
+        stats, records = result
+        batch_index, split_index = progress.scheduled[task_index]
+        batch = progress.batches[batch_index]
+
+        progress.sink.put(progress.loggers[batch_index], records)
+        progress.splits_stats[batch_index][split_index] = stats
+        progress.live[batch_index].add(stats)
+
+        if self.cache and batch.deterministic:
+            self.cache.put(batch.fingerprint, split_index, stats)
+
+        # ? Worse models are removed as soon as better arrive,
+        # ? so disk usage is bounded by `k`.
+        self.retention.prune(
+            list(progress.splits_stats[batch_index].values())
+        )
+
+        if batch_index in progress.stopped:
+            return False
+
+        live = progress.live[batch_index]
+
+        if self.__stop(batch, live):
+            progress.stopped.add(batch_index)
+
+        elif progress.callback and progress.callback(batch, live):
+            progress.stopped.add(batch_index)
+
+        return progress.stopped.issuperset(progress.alive)
+
+    def __close(self, progress: '_Progress') -> List[BatchStats]:
+        """
+        Waits for logs and gathers stats of each batch, in split order.
+        """
+
+        progress.sink.close()
+
+        batches_stats = [
+            BatchStats(
+                [stats[index] for index in sorted(stats)],
+                total=len(progress.splits)
+            )
+            for stats in progress.splits_stats
         ]
 
-        splits_iter = tqdm(splits, desc='Splits')
+        suffix = ''
 
-        starmap = itertools.starmap
+        if self.shard:
+            suffix = '-{}-of-{}'.format(*self.shard)
 
-        if batch.multiprocessing:
-            pool = Pool()
-            starmap = pool.starmap
+        for logger, stats in zip(progress.loggers, batches_stats):
+            logger.save_json(stats.profile, 'profile' + suffix)
+            logger.save_json(stats.trace, 'trace' + suffix)
 
-        splits_stats = starmap(self._process_split, splits_iter)
+        return batches_stats
 
-        return BatchStats(list(splits_stats))
+    def __in_shard(self, position: int) -> bool:
+        if self.shard is None:
+            return True
+
+        index, count = self.shard
+        return position % count == index
+
+    def __stop(self, batch: Batch, stats: BatchStats) -> bool:
+        if batch.stopping is None:
+            return False
+
+        return batch.stopping.done(stats, batch.repeat_size)
+
+    @contextmanager
+    def __plan(self, batch: Batch) -> SplitPlan:
+        """
+        Split plan of batch data and selection, written if it's missing.
+        """
+
+        data = batch.data
+        splits = batch.selection.split(data.x, data.y)
+
+        # ? Splits of non deterministic selection aren't reused.
+        if self.plans is None or not batch.deterministic:
+            with TemporaryDirectory(prefix='coltrane-') as directory:
+                plan = SplitPlan(Path(directory, 'plan'))
+                yield plan.write(splits, len(data.y))
+            return
+
+        key = digest({
+            'data': batch.data_fingerprint,
+            'selection': repr(batch.selection)
+        })
+
+        plan = SplitPlan(Path(self.plans, key))
+
+        if not plan.exists:
+            plan.write(splits, len(data.y))
+
+        yield plan
+
+    @contextmanager
+    def __share(self, data: Data, executor: Executor):
+        """
+        Publishes data set as memory mapped `.npy` files for process workers.
+        They attach to it by path, instead of unpickling full copy each.
+        Files are removed once batch is done.
+        """
+
+        # ? Sparse records are published as CSR arrays, never densified.
+        dump = sparse.dump if sp.issparse(data.x) else npy.dump
+        x = data.x.data if sp.issparse(data.x) else data.x
+
+        # ? Already mapped data sets are attached by workers themselves.
+        mapped = isinstance(x, np.memmap)
+        mapped &= isinstance(data.y, np.memmap)
+
+        if not executor.processes or mapped:
+            yield data
+            return
+
+        with TemporaryDirectory(prefix='coltrane-') as directory:
+            yield dump(data, Path(directory))
+
+    def __with_data(self, batch: Batch, data: Data) -> Batch:
+        if data is batch.data:
+            return batch
+
+        shared = replace(batch, data=data)
+
+        # ? Fingerprints describe the original data set,
+        # ? not its temporary copy.
+        shared.__dict__['fingerprint'] = batch.fingerprint
+        shared.__dict__['data_fingerprint'] = batch.data_fingerprint
+
+        return shared
 
     def _process_split(
         self,
         batch: Batch,
         split_index: int,
-        train_index: List[int],
-        test_index: List[int],
-        logger: Logger
-    ) -> SplitStats:
+        plan: SplitPlan,
+        models: Path,
+        threshold: float = None
+    ) -> Tuple[SplitStats, Records]:
+
+        timings = Timings.begin()
+
+        # ? Written by main process, see `LogSink`.
+        logger = Records(str(split_index))
 
-        with logger.get_child(str(split_index)) as logger:
+        with timings.trace_memory(self.trace_memory):
 
             data = batch.data
-            pipeline = batch.pipeline
             scorers = batch.scorers
             encoder = batch.encoder
 
-            x_train = data.x[train_index]
-            y_train = data.y[train_index]
+            # ? Thread workers mustn't fit the very same instance.
+            pipeline = clone(batch.pipeline)
 
-            x_test = data.x[test_index]
-            y_test = data.y[test_index]
+            incremental = batch.incremental
 
-            if encoder:
-                y_train = encoder.transform(y_train)
-                y_test = encoder.transform(y_test)
+            with timings.stage('slice'):
+                train_index, test_index = plan[split_index]
 
-            start = default_timer()
-            pipeline.fit(x_train, y_train)
-            end = default_timer()
-            dt_fit = end - start
+                if incremental:
+                    # ? Records are read mini-batch by mini-batch.
+                    x_train = incremental.rows(data.x, train_index)
+                    x_test = incremental.rows(data.x, test_index)
+                else:
+                    x_train = data.x[train_index]
+                    x_test = data.x[test_index]
 
-            scores = self.__evaluate_metrics(scorers, pipeline, x_test, y_test)
+                y_train = data.y[train_index]
+                y_test = data.y[test_index]
 
-            logger.add_entry('scores', scores)
-            logger.save_obj(pipeline, 'pipeline')
+            if encoder:
+                with timings.stage('encode'):
+                    y_train = encoder.transform(y_train)
+                    y_test = encoder.transform(y_test)
+
+            with timings.stage('fit'):
+                if incremental:
+                    with instrument(pipeline, timings.steps):
+                        incremental.fit(
+                            pipeline,
+                            x_train,
+                            y_train,
+                            self.__classes(batch, pipeline)
+                        )
+                elif self.prefix_cache:
+                    data_key = digest([
+                        batch.data_fingerprint,
+                        digest_array(train_index)
+                    ])
+
+                    self.prefix_cache.fit(
+                        pipeline,
+                        x_train,
+                        y_train,
+                        data_key,
+                        timings.steps
+                    )
+                else:
+                    with instrument(pipeline, timings.steps):
+                        pipeline.fit(x_train, y_train)
+
+            dt_fit = timings.stages['fit']
+
+            with timings.stage('score'), instrument(pipeline, timings.steps):
+                scores = self.__evaluate_metrics(
+                    scorers,
+                    ChunkedPredictions(pipeline) if incremental else pipeline,
+                    x_test,
+                    y_test,
+                    timings
+                )
+
+            with timings.stage('log'):
+                logger.add_entry('scores', scores)
+
+            # ? Only reference travels back, model stays on disk.
+            with timings.stage('save'):
+                path = Path(models, '{}.joblib'.format(split_index))
+                model = self.retention.save(
+                    pipeline,
+                    path,
+                    scores,
+                    threshold
+                )
 
             # self.__post_split(data, y_test, pred_y, logger)
 
-            return SplitStats(scores, deepcopy(pipeline), dt_fit)
+        timings.end()
+
+        return SplitStats(scores, model, dt_fit, timings), logger
+
+    def close(self):
+        """
+        Shuts down executor's workers.
+        """
+
+        self.executor.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __classes(self, batch: Batch, pipeline: Pipeline) -> np.ndarray:
+        # ? Mini-batches may lack some classes, classifiers get all upfront.
+        if not is_classifier(pipeline):
+            return None
+
+        classes = np.unique(batch.data.y)
+
+        if batch.encoder:
+            classes = batch.encoder.transform(classes)
+
+        return classes
 
     def __evaluate_metrics(
         self,
         scorers: Dict[str, _BaseScorer],
         pipeline: Pipeline,
         x_test,
-        y_test
+        y_test,
+        timings: Timings
     ):
         stats = {}
 
+        # ? Scorers share predictions, they're computed once per method.
+        predictions = CachedPredictions(pipeline)
+
         for name, scorer in scorers.items():
 
-            score = scorer(pipeline, x_test, y_test)
+            with timings.scorer(name):
+                score = scorer(predictions, x_test, y_test)
+
             stats[name] = score
 
         return stats
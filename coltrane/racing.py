@@ -0,0 +1,106 @@
+from dataclasses import dataclass
+from math import ceil
+from typing import List
+
+import numpy as np
+
+from coltrane.util.stats import BatchStats
+
+
+@dataclass(frozen=True)
+class Racing:
+    """
+    Successive halving across configurations evaluated on the same data.
+    Every configuration gets the first rung of splits,
+    only the best `1 / eta` of them advance to the next,
+    `eta` times larger rung, until splits run out or a single one is left.
+
+    Parameters
+    ----------
+    metric : str
+        Scorer's name, configurations are ranked by its mean.
+    eta : int, optional
+        Rung growth and pruning factor.
+    min_splits : int, optional
+        Number of splits in the first rung.
+        A single repeat of cross-validation by default.
+    greater_is_better : bool, optional
+        Whether greater score means better configuration.
+    """
+
+    metric: str
+    eta: int = 2
+    min_splits: int = None
+    greater_is_better: bool = True
+
+    def __post_init__(self):
+        if self.eta < 2:
+            raise ValueError('Eta must be at least 2.')
+
+    def rungs(self, n_splits: int, repeat_size: int) -> List[int]:
+        """
+        Number of splits evaluated by the end of each rung.
+
+        Parameters
+        ----------
+        n_splits : int
+            Number of all splits.
+        repeat_size : int
+            Number of splits in a single repeat.
+
+        Returns
+        -------
+        List[int]
+        """
+
+        size = self.min_splits or repeat_size
+        rungs = []
+
+        while size < n_splits:
+            rungs.append(size)
+            size *= self.eta
+
+        rungs.append(n_splits)
+
+        return rungs
+
+    def survivors(
+        self,
+        stats: List[BatchStats],
+        alive: List[int]
+    ) -> List[int]:
+        """
+        Configurations advancing to the next rung.
+
+        Parameters
+        ----------
+        stats : List[BatchStats]
+            Stats of every configuration.
+        alive : List[int]
+            Indices of configurations, that took part in the rung.
+
+        Returns
+        -------
+        List[int]
+            Indices of the best ones, in original order.
+        """
+
+        means = []
+
+        for index in alive:
+            running = stats[index].running
+
+            if self.metric not in running.metrics:
+                raise KeyError('Unknown metric: {}'.format(self.metric))
+
+            means.append(running.mean[running.metrics.index(self.metric)])
+
+        means = np.array(means)
+
+        if not self.greater_is_better:
+            means = -means
+
+        keep = max(1, ceil(len(alive) / self.eta))
+        best = np.argsort(-means, kind='stable')[:keep]
+
+        return [alive[index] for index in sorted(best)]
@@ -6,8 +6,8 @@ from coltrane.inspection import Inspector as Base
 
 class Inspector(Base):
 
-    def __init__(self):
-        return super().__init__()
+    def __init__(self, *args, **kwargs):
+        return super().__init__(*args, **kwargs)
 
     def __post_inspect(self, data: Data, logger: Logger):
         pass
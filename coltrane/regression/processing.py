@@ -6,8 +6,8 @@ from coltrane.file.io.base import Data
 
 class Processor(BaseProcessor):
 
-    def __init__(self):
-        return super().__init__()
+    def __init__(self, *args, **kwargs):
+        return super().__init__(*args, **kwargs)
 
     def __post_split(
         self,
@@ -0,0 +1,136 @@
+import json
+from importlib import import_module
+from pathlib import Path
+from typing import Any, Dict, Mapping, Tuple, Union
+
+from sklearn.metrics import get_scorer, make_scorer
+from sklearn.model_selection import ParameterGrid
+from sklearn.pipeline import Pipeline
+
+from coltrane import Batch
+from coltrane.file.io.base import Data
+
+__DATA = 'coltrane.file.io.csv.single.Data'
+
+
+def load(path: Path) -> Dict:
+    """
+    Reads batch specification from `.json` or `.yaml` file.
+    YAML requires `PyYAML`, install `coltrane[yaml]`.
+
+    Parameters
+    ----------
+    path : Path
+        Specification file.
+
+    Returns
+    -------
+    Dict
+    """
+
+    path = Path(path)
+
+    with open(path, 'r') as stream:
+        if path.suffix in ('.yaml', '.yml'):
+            import yaml
+            return yaml.safe_load(stream)
+
+        return json.load(stream)
+
+
+def build(spec: Dict) -> Tuple[Batch, Union[ParameterGrid, list, None]]:
+    """
+    Instantiates batch described by the specification.
+
+    Objects are given either by dotted path, e.g.
+    `sklearn.naive_bayes.GaussianNB`, or as a mapping of `class`
+    and `params`. Scorers are given either by `sklearn` scorer name,
+    or as a mapping of `metric` function and its `params`.
+
+    ```yaml
+    data:
+      path: coltrane/test/data/iris.csv
+      preprocessing: [dropna, drop_duplicates]
+    pipeline:
+      - name: standard-scaler
+        class: sklearn.preprocessing.StandardScaler
+      - name: naive-bayes
+        class: sklearn.naive_bayes.GaussianNB
+    selection:
+      class: sklearn.model_selection.RepeatedStratifiedKFold
+      params: {n_splits: 5, n_repeats: 2, random_state: 42}
+    scorers:
+      accuracy: accuracy
+      f1: {metric: sklearn.metrics.f1_score, params: {average: macro}}
+    encoder: sklearn.preprocessing.LabelEncoder
+    sweep:
+      naive-bayes__var_smoothing: [1.0e-9, 1.0e-3]
+    ```
+
+    Parameters
+    ----------
+    spec : Dict
+        Loaded specification.
+
+    Returns
+    -------
+    Tuple[Batch, Union[ParameterGrid, list, None]]
+        Batch and its sweep, either parameter grid or list of params,
+        `None` if there's no sweep.
+    """
+
+    pipeline = Pipeline(steps=[
+        (step['name'], _instance(step))
+        for step in spec['pipeline']
+    ])
+
+    encoder = spec.get('encoder')
+
+    batch = Batch(
+        _data(spec['data']),
+        pipeline=pipeline,
+        selection=_instance(spec['selection']),
+        scorers={
+            name: _scorer(scorer)
+            for name, scorer in spec['scorers'].items()
+        },
+        encoder=_instance(encoder) if encoder else None,
+        multiprocessing=spec.get('multiprocessing', False)
+    )
+
+    sweep = spec.get('sweep')
+
+    if isinstance(sweep, Mapping):
+        sweep = ParameterGrid(dict(sweep))
+
+    return batch, sweep
+
+
+def _data(spec: Dict) -> Data:
+    loader = _import(spec.get('class', __DATA))
+    data = loader(Path(spec['path']), **spec.get('params', {}))
+
+    for step in spec.get('preprocessing', []):
+        getattr(data, step)()
+
+    return data
+
+
+def _scorer(spec: Union[str, Dict]):
+    if isinstance(spec, str):
+        return get_scorer(spec)
+
+    metric = _import(spec['metric'])
+    return make_scorer(metric, **spec.get('params', {}))
+
+
+def _instance(spec: Union[str, Dict]) -> Any:
+    if isinstance(spec, str):
+        return _import(spec)()
+
+    return _import(spec['class'])(**spec.get('params', {}))
+
+
+def _import(path: str) -> Any:
+    module, _, name = path.rpartition('.')
+    return getattr(import_module(module), name)
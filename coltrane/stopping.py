@@ -0,0 +1,85 @@
+from dataclasses import dataclass
+
+from coltrane.util.stats import BatchStats
+
+
+@dataclass(frozen=True)
+class Stopping:
+    """
+    Adaptive selection. Further repeats of cross-validation
+    aren't scheduled, once chosen metric has converged,
+    or configuration is clearly worse than the baseline.
+    It's checked whenever another repeat's worth of splits is done.
+
+    Parameters
+    ----------
+    metric : str
+        Scorer's name.
+    width : float, optional
+        Stop once confidence interval of metric's mean is that narrow.
+    baseline : float, optional
+        Stop once whole confidence interval is worse than that score.
+    confidence : float, optional
+        Confidence level of the interval.
+    min_repeats : int, optional
+        Number of repeats always run.
+    greater_is_better : bool, optional
+        Whether greater score means better configuration.
+    """
+
+    metric: str
+    width: float = None
+    baseline: float = None
+    confidence: float = 0.95
+    min_repeats: int = 2
+    greater_is_better: bool = True
+
+    def __post_init__(self):
+        if self.width is None and self.baseline is None:
+            raise ValueError('Either width or baseline is required.')
+
+        if self.min_repeats < 1:
+            raise ValueError('At least one repeat must be run.')
+
+    def done(self, stats: BatchStats, repeat_size: int) -> bool:
+        """
+        Whether remaining repeats may be skipped.
+
+        Parameters
+        ----------
+        stats : BatchStats
+            Splits processed so far.
+        repeat_size : int
+            Number of splits in a single repeat.
+
+        Returns
+        -------
+        bool
+        """
+
+        completed = len(stats.splits)
+
+        if completed % repeat_size:
+            return False
+
+        if completed < self.min_repeats * repeat_size:
+            return False
+
+        running = stats.running
+
+        if self.metric not in running.metrics:
+            raise KeyError('Unknown metric: {}'.format(self.metric))
+
+        index = running.metrics.index(self.metric)
+        low, high = running.interval(self.confidence)[index]
+
+        if self.width is not None and high - low <= self.width:
+            return True
+
+        if self.baseline is None:
+            return False
+
+        if self.greater_is_better:
+            return high < self.baseline
+
+        return low > self.baseline
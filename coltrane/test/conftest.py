@@ -0,0 +1,44 @@
+from pathlib import Path
+
+from pytest import fixture
+from sklearn.metrics import (accuracy_score, f1_score, make_scorer,
+                             precision_score, recall_score)
+from sklearn.model_selection import RepeatedStratifiedKFold
+from sklearn.naive_bayes import GaussianNB
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import LabelEncoder, StandardScaler
+
+from coltrane import Batch
+from coltrane.file.io.csv.single import Data
+
+
+@fixture(scope='function')
+def data(iris_path: Path) -> Data:
+    return Data(path=iris_path)
+
+
+@fixture(scope='function')
+def batch(data: Data, random_state: int) -> Batch:
+
+    return Batch(
+        data,
+        pipeline=Pipeline(
+            steps=[
+                ('standard-scaler', StandardScaler()),
+                ('naive-bayes', GaussianNB())
+            ],
+        ),
+        selection=RepeatedStratifiedKFold(
+            n_splits=5,
+            n_repeats=2,
+            random_state=random_state
+        ),
+        scorers={
+            'accuracy': make_scorer(accuracy_score),
+            'precision': make_scorer(precision_score, average='macro'),
+            'recall': make_scorer(recall_score, average='macro'),
+            'f1': make_scorer(f1_score, average='macro')
+        },
+        encoder=LabelEncoder(),
+        multiprocessing=True
+    )
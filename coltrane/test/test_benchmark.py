@@ -0,0 +1,87 @@
+import json
+from pathlib import Path
+
+import pandas as pd
+from pytest import raises
+
+from coltrane import benchmark
+from coltrane.cli import main
+
+
+def test_generate(tmp_path: Path):
+    case = benchmark.Case(benchmark.CLASSIFICATION, rows=250, columns=4)
+    path = benchmark.generate(case, tmp_path, chunksize=100)
+
+    frame = pd.read_csv(path)
+
+    assert frame.shape == (250, 6)
+    assert list(frame['id']) == list(range(250))
+    assert frame['label'].nunique() == 3
+    assert benchmark.generate(case, tmp_path) == path
+
+
+def test_run(tmp_path: Path):
+    cases = benchmark.grid(rows=[200], columns=[5])
+    results = benchmark.run(cases, tmp_path, n_jobs=2)
+
+    assert len(results) == 2
+
+    for stages in results.values():
+        assert list(stages) == [
+            benchmark.LOAD,
+            benchmark.INSPECT,
+            benchmark.SERIAL,
+            benchmark.PARALLEL
+        ]
+
+        for measures in stages.values():
+            assert measures[benchmark.TIME] > 0
+            assert measures[benchmark.PEAK_MEMORY] > 0
+
+    assert not benchmark.compare(results, results)
+
+    baseline = {
+        case: {
+            stage: {
+                measure: value / 2
+                for measure, value in measures.items()
+            }
+            for stage, measures in stages.items()
+        }
+        for case, stages in results.items()
+    }
+
+    regressions = benchmark.compare(results, baseline, tolerance=0.5)
+
+    assert len(regressions) == 2 * 4 * 2
+    assert all(regression.ratio == 2 for regression in regressions)
+
+
+def test_command(tmp_path: Path):
+    baseline = Path(tmp_path, 'baseline.json')
+
+    args = [
+        'benchmark',
+        '--tasks', 'regression',
+        '--rows', '200',
+        '--columns', '5',
+        '--jobs', '2',
+        '--folder', str(tmp_path),
+        '--baseline', str(baseline)
+    ]
+
+    main(args + ['--update'])
+
+    with open(baseline) as stream:
+        results = json.load(stream)
+
+    # ? Nothing can be that fast.
+    for stages in results.values():
+        for measures in stages.values():
+            measures[benchmark.TIME] = 1e-9
+
+    with open(baseline, 'w') as stream:
+        json.dump(results, stream)
+
+    with raises(SystemExit):
+        main(args)
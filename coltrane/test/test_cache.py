@@ -0,0 +1,100 @@
+from dataclasses import replace
+from pathlib import Path
+
+import numpy as np
+from pytest import mark, raises, warns
+from sklearn.model_selection import KFold, RepeatedStratifiedKFold
+from sklearn.naive_bayes import GaussianNB
+from sklearn.pipeline import Pipeline
+
+from coltrane import Batch
+from coltrane.classification import Processor
+from coltrane.file.io.csv import stream
+from coltrane.file.io.csv.single import Data
+from coltrane.util import PrefixCache, SplitCache
+
+
+def test_fingerprint(batch: Batch, iris_path: Path):
+    same = replace(batch, data=Data(path=iris_path))
+
+    assert batch.fingerprint == same.fingerprint
+    assert batch.as_nice_hash == same.as_nice_hash
+
+    other = replace(
+        batch,
+        pipeline=Pipeline(steps=[('naive-bayes', GaussianNB())])
+    )
+
+    assert batch.fingerprint != other.fingerprint
+
+
+def test_fingerprint_loader(batch: Batch, iris_path: Path):
+    compact = replace(batch, data=Data(path=iris_path, compact=True))
+    streamed = replace(batch, data=stream.Data(path=iris_path))
+
+    assert batch.fingerprint != compact.fingerprint
+    assert batch.fingerprint != streamed.fingerprint
+
+
+@mark.parametrize(
+    'selection, deterministic',
+    [
+        (KFold(n_splits=5), True),
+        (KFold(n_splits=5, shuffle=True), False),
+        (KFold(n_splits=5, shuffle=True, random_state=0), True),
+        (RepeatedStratifiedKFold(n_splits=5), False),
+        (RepeatedStratifiedKFold(random_state=np.random.RandomState(0)), False)
+    ]
+)
+def test_deterministic(batch: Batch, selection, deterministic: bool):
+    assert replace(batch, selection=selection).deterministic == deterministic
+
+
+def test_sweep_collision(batch: Batch):
+    grid = [{'naive-bayes__var_smoothing': 1e-3}] * 2
+
+    with raises(ValueError):
+        batch.sweep(grid)
+
+
+def test_cached_splits(batch: Batch, tmp_path: Path):
+    batch = replace(batch, multiprocessing=False)
+    cache = SplitCache(tmp_path / 'cache')
+    processor = Processor(cache=cache)
+
+    stats = processor.process(batch, output=tmp_path / 'log')
+    assert cache.get(batch.fingerprint, 9) is not None
+
+    cached = processor.process(batch, output=tmp_path / 'log')
+    assert cached.grouped_scores == stats.grouped_scores
+    assert len(cached.splits) == 10
+
+    cache.clear(batch.fingerprint)
+    assert cache.get(batch.fingerprint, 0) is None
+
+
+def test_cache_shuffled(batch: Batch, tmp_path: Path):
+    batch = replace(
+        batch,
+        selection=RepeatedStratifiedKFold(n_splits=5),
+        multiprocessing=False
+    )
+
+    cache = SplitCache(tmp_path / 'cache')
+
+    with warns(UserWarning):
+        Processor(cache=cache).process(batch, output=tmp_path / 'log')
+
+    assert cache.get(batch.fingerprint, 0) is None
+
+
+def test_processor_prefix_cache(batch: Batch, tmp_path: Path):
+    batch = replace(batch, multiprocessing=False)
+    cache = PrefixCache(tmp_path / 'prefix')
+    processor = Processor(prefix_cache=cache)
+
+    stats = processor.process(batch, output=tmp_path / 'log')
+    assert len(list(cache.path.glob('*.joblib'))) == 10
+
+    plain = Processor().process(batch, output=tmp_path / 'log')
+    assert stats.grouped_scores == plain.grouped_scores
@@ -0,0 +1,99 @@
+import json
+from pathlib import Path
+
+from pytest import fixture, raises
+
+from coltrane.cli import main
+
+
+@fixture(scope='function')
+def spec(tmp_path: Path, random_state: int, iris_path: Path) -> Path:
+    spec = {
+        'data': {
+            'path': str(iris_path),
+            'preprocessing': ['dropna']
+        },
+        'pipeline': [
+            {
+                'name': 'standard-scaler',
+                'class': 'sklearn.preprocessing.StandardScaler'
+            },
+            {
+                'name': 'naive-bayes',
+                'class': 'sklearn.naive_bayes.GaussianNB'
+            }
+        ],
+        'selection': {
+            'class': 'sklearn.model_selection.RepeatedStratifiedKFold',
+            'params': {
+                'n_splits': 5,
+                'n_repeats': 2,
+                'random_state': random_state
+            }
+        },
+        'scorers': {
+            'accuracy': 'accuracy',
+            'f1': {
+                'metric': 'sklearn.metrics.f1_score',
+                'params': {'average': 'macro'}
+            }
+        },
+        'encoder': 'sklearn.preprocessing.LabelEncoder',
+        'sweep': {
+            'naive-bayes__var_smoothing': [1e-9, 1e-3]
+        }
+    }
+
+    path = Path(tmp_path, 'batch.json')
+
+    with open(path, 'w') as stream:
+        json.dump(spec, stream)
+
+    return path
+
+
+def test_shards(spec: Path, tmp_path: Path):
+    output = Path(tmp_path, 'log')
+
+    for shard in ('0/3', '1/3', '2/3'):
+        main([
+            'run', str(spec),
+            '--output', str(output),
+            '--shard', shard,
+            '--executor', 'serial'
+        ])
+
+    main(['merge', str(spec), '--output', str(output)])
+
+    with open(Path(output, 'report.json')) as stream:
+        report = json.load(stream)
+
+    assert len(report) == 2
+
+    for batch in report.values():
+        assert batch['splits'] == batch['total'] == 10
+        assert batch['scores']['f1']['count'] == 10
+
+
+def test_partial_merge(spec: Path, tmp_path: Path):
+    output = Path(tmp_path, 'log')
+
+    main([
+        'run', str(spec),
+        '--output', str(output),
+        '--shard', '0/2',
+        '--executor', 'serial'
+    ])
+
+    main(['merge', str(spec), '--output', str(output)])
+
+    with open(Path(output, 'report.json')) as stream:
+        report = json.load(stream)
+
+    # ? Shards are dealt (pipeline, split) tasks round robin.
+    assert sum(batch['splits'] for batch in report.values()) == 10
+
+
+def test_invalid_shard(spec: Path):
+    with raises(SystemExit):
+        main(['run', str(spec), '--shard', '2/2'])
@@ -0,0 +1,129 @@
+import asyncio
+import time
+from operator import mul
+
+from pytest import mark
+
+from coltrane.executor import (Executor, Loky, Process, Serial, Thread,
+                               dispatched)
+
+__TASKS = [(index, 2) for index in range(50)]
+
+
+@mark.parametrize(
+    'executor',
+    [Serial(), Thread(n_jobs=2), Process(n_jobs=2), Loky(n_jobs=2)]
+)
+def test_starmap(executor: Executor):
+    with executor:
+        results = list(executor.starmap(mul, __TASKS))
+        assert results == [index * 2 for index in range(50)]
+
+        # ? pool is reused for the next batch
+        pool = executor.pool
+        list(executor.starmap(mul, __TASKS))
+        assert executor.pool is pool
+
+
+def test_chunksize():
+    with Process(n_jobs=2, chunksize=7) as executor:
+        results = list(executor.starmap(mul, __TASKS))
+        assert results == [index * 2 for index in range(50)]
+
+
+def _waited(duration: float) -> float:
+    queue = time.time() - dispatched()
+    time.sleep(duration)
+    return queue
+
+
+def test_dispatched_within_chunk():
+    with Thread(n_jobs=1, chunksize=3) as executor:
+        queues = list(executor.starmap(_waited, [(0.1,)] * 3))
+
+    # ? Compute of previous tasks in the chunk doesn't count as queue.
+    assert max(queues) < 0.05
+
+
+@mark.parametrize(
+    'executor',
+    [Serial(), Thread(n_jobs=2), Process(n_jobs=2)]
+)
+def test_imap_unordered(executor: Executor):
+    with executor:
+        results = dict(executor.imap_unordered(mul, __TASKS))
+        assert results == {index: index * 2 for index in range(50)}
+
+
+def test_serial_not_ahead():
+    calls = []
+
+    def call(index: int) -> int:
+        calls.append(index)
+        return index
+
+    tasks = [(index,) for index in range(5)]
+
+    with Serial() as executor:
+        results = executor.imap_unordered(call, tasks)
+
+        assert next(results) == (0, 0)
+        results.close()
+
+    # ? Next task is run only once the consumer asks for it.
+    assert calls == [0]
+
+
+def test_imap_unordered_lazy_tasks():
+    taken = []
+
+    def tasks():
+        for task in __TASKS:
+            taken.append(task)
+            yield task
+
+    with Thread(n_jobs=1, chunksize=1) as executor:
+        results = executor.imap_unordered(mul, tasks())
+
+        next(results)
+        results.close()
+
+    # ? Only tasks, that fit into the window, were taken.
+    assert len(taken) < len(__TASKS)
+
+
+@mark.parametrize('executor', [Thread(n_jobs=2), Process(n_jobs=2)])
+def test_aimap_unordered(executor: Executor):
+
+    async def collect():
+        return {
+            index: result
+            async for index, result in executor.aimap_unordered(mul, __TASKS)
+        }
+
+    with executor:
+        results = asyncio.run(collect())
+        assert results == {index: index * 2 for index in range(50)}
+
+
+def test_aimap_unordered_cancel():
+    taken = []
+
+    def tasks():
+        for task in __TASKS:
+            taken.append(task)
+            yield task
+
+    async def first():
+        results = executor.aimap_unordered(mul, tasks())
+
+        async for result in results:
+            await results.aclose()
+            return result
+
+    with Thread(n_jobs=1, chunksize=1) as executor:
+        # ? Tasks completed at once may come in any order.
+        index, result = asyncio.run(first())
+        assert result == index * 2
+
+    assert len(taken) < len(__TASKS)
@@ -1,51 +1,27 @@
+import asyncio
+import time
+from dataclasses import replace
 from pathlib import Path
 
-from pytest import fixture
-from sklearn.metrics import (accuracy_score, f1_score, make_scorer,
-                             precision_score, recall_score)
-from sklearn.model_selection import RepeatedStratifiedKFold
+import numpy as np
+from pytest import approx, mark, raises
+from sklearn.linear_model import SGDClassifier
+from sklearn.model_selection import ParameterGrid, RepeatedStratifiedKFold
 from sklearn.naive_bayes import GaussianNB
 from sklearn.pipeline import Pipeline
-from sklearn.preprocessing import LabelEncoder, StandardScaler
+from sklearn.preprocessing import FunctionTransformer, StandardScaler
 
 from coltrane import Batch
 from coltrane.classification import Inspector, Processor
+from coltrane.executor import Process
+from coltrane.file.io.csv import stream
 from coltrane.file.io.csv.single import Data
+from coltrane.incremental import Incremental
+from coltrane.racing import Racing
+from coltrane.stopping import Stopping
+from coltrane.util.stats import BatchStats
 
 __LOG = Path('log')
-__DATA_IRIS = Path('coltrane/test/data/iris.csv')
-
-
-@fixture(scope='function')
-def data() -> Data:
-    return Data(path=__DATA_IRIS)
-
-
-@fixture(scope='function')
-def batch(data: Data, random_state: int) -> Batch:
-
-    return Batch(
-        data,
-        pipeline=Pipeline(
-            steps=[
-                ('standard-scaler', StandardScaler()),
-                ('naive-bayes', GaussianNB())
-            ],
-        ),
-        selection=RepeatedStratifiedKFold(
-            n_splits=5,
-            n_repeats=2,
-            random_state=random_state
-        ),
-        scorers={
-            'accuracy': make_scorer(accuracy_score),
-            'precision': make_scorer(precision_score, average='macro'),
-            'recall': make_scorer(recall_score, average='macro'),
-            'f1': make_scorer(f1_score, average='macro')
-        },
-        encoder=LabelEncoder(),
-        multiprocessing=True
-    )
 
 
 def test_inspection(data: Data):
@@ -54,5 +30,305 @@ def test_inspection(data: Data):
 
 
 def test_classification(batch: Batch):
-    processor = Processor()
-    processor.process(batch, output=__LOG)
+    with Processor(executor=Process(n_jobs=2)) as processor:
+        processor.process(batch, output=__LOG)
+
+
+def test_sweep(batch: Batch):
+    grid = ParameterGrid({'naive-bayes__var_smoothing': [1e-9, 1e-3, 1e-1]})
+
+    with Processor(executor=Process(n_jobs=2)) as processor:
+        stats = processor.sweep(batch, grid, output=__LOG)
+
+    assert len(stats) == 3
+
+    for batch_stats in stats.values():
+        assert len(batch_stats.splits) == 10
+
+
+def test_split_plans(batch: Batch, tmp_path: Path):
+    plans = Path(tmp_path, 'plans')
+    batch = replace(batch, multiprocessing=False)
+
+    with Processor(headless=True, plans=plans) as processor:
+        stats = processor.process(batch, output=__LOG)
+
+    folders = list(plans.iterdir())
+    assert len(folders) == 1
+
+    modified = [path.stat().st_mtime_ns for path in folders[0].iterdir()]
+
+    with Processor(headless=True, plans=plans) as processor:
+        again = processor.process(batch, output=__LOG)
+
+    assert list(plans.iterdir()) == folders
+    assert modified == [
+        path.stat().st_mtime_ns for path in folders[0].iterdir()
+    ]
+
+    assert again.grouped_scores.keys() == stats.grouped_scores.keys()
+
+    for metric, scores in stats.grouped_scores.items():
+        assert list(again.grouped_scores[metric]) == list(scores)
+
+
+def test_process_async(batch: Batch):
+    grid = ParameterGrid({'naive-bayes__var_smoothing': [1e-3]})
+    other, = batch.sweep(grid).values()
+
+    async def collect(processor: Processor, batch: Batch):
+        return [
+            stats
+            async for stats in processor.process_async(batch, output=__LOG)
+        ]
+
+    async def concurrent(processor: Processor):
+        return await asyncio.gather(*[
+            collect(processor, batch)
+            for batch in (batch, other)
+        ])
+
+    with Processor(executor=Process(n_jobs=2), headless=True) as processor:
+        results = asyncio.run(concurrent(processor))
+        expected = processor.process(batch, output=__LOG)
+
+    assert [len(stats) for stats in results] == [10, 10]
+
+    scores = sorted(stats.scores['accuracy'] for stats in results[0])
+    assert scores == sorted(expected.grouped_scores['accuracy'])
+
+
+@mark.parametrize('terminate', [False, True])
+def test_process_async_cancel(batch: Batch, terminate: bool):
+
+    async def first(processor: Processor):
+        results = processor.process_async(
+            batch,
+            output=__LOG,
+            terminate=terminate
+        )
+
+        async for stats in results:
+            await results.aclose()
+            return stats
+
+    executor = Process(n_jobs=1, chunksize=1)
+
+    with Processor(executor=executor, headless=True) as processor:
+        pool = executor.pool
+        assert asyncio.run(first(processor)) is not None
+
+        # ? Shared pool survives, unless termination was requested.
+        assert (executor.pool is pool) != terminate
+
+
+class SlowNB(GaussianNB):
+
+    def fit(self, x, y):
+        time.sleep(60)
+        return super().fit(x, y)
+
+
+def test_process_async_terminate(batch: Batch, tmp_path: Path):
+    batch = replace(
+        batch,
+        pipeline=Pipeline(steps=[('naive-bayes', SlowNB())])
+    )
+
+    async def cancel(processor: Processor) -> float:
+        async def consume():
+            async for _ in processor.process_async(
+                batch,
+                output=tmp_path,
+                terminate=True
+            ):
+                pass
+
+        ticks = [time.monotonic()]
+
+        async def tick():
+            while True:
+                await asyncio.sleep(0.01)
+                ticks.append(time.monotonic())
+
+        ticker = asyncio.ensure_future(tick())
+        task = asyncio.ensure_future(consume())
+
+        # ? Workers are fitting by now.
+        await asyncio.sleep(2)
+        task.cancel()
+
+        with raises(asyncio.CancelledError):
+            await task
+
+        ticker.cancel()
+
+        return max(np.diff(ticks))
+
+    executor = Process(n_jobs=2, chunksize=1)
+    start = time.monotonic()
+
+    with Processor(executor=executor, headless=True) as processor:
+        gap = asyncio.run(cancel(processor))
+
+    # ? Running splits were stopped, loop kept ticking meanwhile.
+    assert time.monotonic() - start < 30
+    assert gap < 0.5
+
+
+def test_callback(batch: Batch, tmp_path: Path):
+    batch = replace(batch, multiprocessing=False)
+    progress = []
+
+    def callback(batch: Batch, stats: BatchStats) -> bool:
+        progress.append(len(stats.splits))
+        return len(stats.splits) >= 3
+
+    with Processor() as processor:
+        stats = processor.process(batch, output=tmp_path, callback=callback)
+
+    assert progress == [1, 2, 3]
+    assert len(stats.splits) == 3
+
+    # ? Serial splits aren't fitted ahead, no model is left behind.
+    assert len(list(tmp_path.rglob('*.joblib'))) == 3
+
+    summary = stats.running.summary()
+    low, high = summary['accuracy']['interval']
+    assert low <= summary['accuracy']['mean'] <= high
+
+
+@mark.parametrize(
+    'stopping',
+    [
+        Stopping(metric='accuracy', width=1.0),
+        Stopping(metric='accuracy', baseline=1.1)
+    ]
+)
+def test_stopping(batch: Batch, random_state: int, stopping: Stopping):
+    selection = RepeatedStratifiedKFold(
+        n_splits=5,
+        n_repeats=5,
+        random_state=random_state
+    )
+
+    batch = replace(
+        batch,
+        selection=selection,
+        multiprocessing=False,
+        stopping=stopping
+    )
+
+    with Processor() as processor:
+        stats = processor.process(batch, output=__LOG)
+
+    assert 10 <= len(stats.splits) < 25
+
+
+def test_stopping_config():
+    with raises(ValueError):
+        Stopping(metric='accuracy')
+
+
+def test_race(batch: Batch, random_state: int):
+    selection = RepeatedStratifiedKFold(
+        n_splits=5,
+        n_repeats=4,
+        random_state=random_state
+    )
+
+    batch = replace(batch, selection=selection)
+    grid = ParameterGrid({
+        'naive-bayes__var_smoothing': [1e-9, 1e-3, 1e-1, 10.0]
+    })
+
+    racing = Racing(metric='accuracy')
+    assert racing.rungs(20, 5) == [5, 10, 20]
+
+    with Processor(executor=Process(n_jobs=2)) as processor:
+        stats = processor.race(batch, grid, output=__LOG, racing=racing)
+
+    assert len(stats) == 4
+
+    splits = sorted(len(batch_stats.splits) for batch_stats in stats.values())
+    assert splits == [5, 5, 10, 20]
+
+
+def test_sharded_decisions(batch: Batch):
+    grid = ParameterGrid({'naive-bayes__var_smoothing': [1e-9, 1e-3]})
+    racing = Racing(metric='accuracy')
+    stopping = Stopping(metric='accuracy', width=1.0)
+
+    with Processor(shard=(0, 2)) as processor:
+        with raises(ValueError):
+            processor.race(batch, grid, output=__LOG, racing=racing)
+
+        with raises(ValueError):
+            processor.process(replace(batch, stopping=stopping), output=__LOG)
+
+
+def test_incremental(batch: Batch, tmp_path: Path, iris_path: Path):
+    with Processor() as processor:
+        expected = processor.process(
+            replace(batch, multiprocessing=False),
+            output=tmp_path
+        )
+
+    # ? Naive Bayes and scaler learn exactly the same from mini-batches.
+    batch = replace(
+        batch,
+        data=stream.Data(path=iris_path, chunksize=32),
+        incremental=Incremental(batch_size=16)
+    )
+
+    assert batch.fingerprint != replace(batch, incremental=None).fingerprint
+
+    with Processor(executor=Process(n_jobs=2)) as processor:
+        stats = processor.process(batch, output=tmp_path)
+
+    assert len(stats.splits) == 10
+    assert 'partial_fit' in stats.splits[0].timings.steps['naive-bayes']
+
+    for name, scores in stats.grouped_scores.items():
+        assert sorted(scores) == approx(sorted(expected.grouped_scores[name]))
+
+
+def test_incremental_sgd(batch: Batch, random_state: int):
+    pipeline = Pipeline(steps=[
+        ('standard-scaler', StandardScaler()),
+        ('sgd', SGDClassifier(random_state=random_state))
+    ])
+
+    batch = replace(
+        batch,
+        pipeline=pipeline,
+        incremental=Incremental(batch_size=10, epochs=5)
+    )
+
+    with Processor() as processor:
+        stats = processor.process(batch, output=__LOG)
+
+    assert stats.running.summary()['accuracy']['mean'] > 0.7
+
+
+def test_incremental_config(batch: Batch):
+    with raises(ValueError):
+        Incremental(batch_size=0)
+
+    with raises(ValueError):
+        Incremental(epochs=0)
+
+    pipeline = Pipeline(steps=[
+        ('identity', FunctionTransformer()),
+        ('naive-bayes', GaussianNB())
+    ])
+
+    batch = replace(
+        batch,
+        pipeline=pipeline,
+        multiprocessing=False,
+        incremental=Incremental()
+    )
+
+    with raises(TypeError), Processor() as processor:
+        processor.process(batch, output=__LOG)
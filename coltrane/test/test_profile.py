@@ -0,0 +1,51 @@
+import json
+from dataclasses import replace
+from pathlib import Path
+
+from sklearn.model_selection import RepeatedStratifiedKFold
+
+from coltrane import Batch
+from coltrane.classification import Processor
+from coltrane.executor import Thread
+
+
+def test_profile(batch: Batch, random_state: int, tmp_path: Path):
+    batch = replace(
+        batch,
+        selection=RepeatedStratifiedKFold(
+            n_splits=5,
+            n_repeats=1,
+            random_state=random_state
+        ),
+        encoder=None
+    )
+
+    processor = Processor(executor=Thread(n_jobs=2), trace_memory=True)
+
+    with processor:
+        stats = processor.process(batch, output=tmp_path)
+
+    for split in stats.splits:
+        timings = split.timings
+
+        assert set(timings.stages) == {'slice', 'fit', 'score', 'log', 'save'}
+        assert timings.stages['fit'] == split.dt_fit
+        assert timings.compute >= sum(timings.stages.values())
+        assert timings.queue >= 0
+
+    profile = stats.profile
+
+    assert profile['splits'] == 5
+    assert 'accuracy' in profile['scorers']
+    assert 'predict' in profile['steps']['naive-bayes']
+    assert profile['wall'] >= profile['compute']['max']
+
+    events = stats.trace['traceEvents']
+    assert {event['cat'] for event in events} == {
+        'queue', 'split', 'stage', 'scorer'
+    }
+
+    log_dir = Path(tmp_path, batch.data.name, batch.as_nice_hash)
+    json.dumps(profile)
+    json.dumps(stats.trace)
+    assert log_dir.exists()
@@ -0,0 +1,93 @@
+from dataclasses import replace
+from pathlib import Path
+
+import joblib
+from pytest import fixture
+from sklearn.model_selection import RepeatedStratifiedKFold
+from sklearn.naive_bayes import GaussianNB
+from sklearn.pipeline import Pipeline
+
+from coltrane import Batch
+from coltrane.classification import Processor
+from coltrane.util import Retention
+
+
+@fixture(scope='function')
+def batch(batch: Batch, random_state: int) -> Batch:
+    return replace(
+        batch,
+        pipeline=Pipeline(steps=[('naive-bayes', GaussianNB())]),
+        selection=RepeatedStratifiedKFold(
+            n_splits=5,
+            n_repeats=1,
+            random_state=random_state
+        ),
+        multiprocessing=False
+    )
+
+
+def test_retain_all(batch: Batch, tmp_path: Path):
+    retention = Retention(compress=3)
+    stats = Processor(retention=retention).process(batch, output=tmp_path)
+
+    for split in stats.splits:
+        assert split.model.exists
+        assert split.pipeline.predict(batch.data.x[:1]).shape == (1,)
+
+
+def test_retain_none(batch: Batch, tmp_path: Path):
+    retention = Retention(policy='none')
+    stats = Processor(retention=retention).process(batch, output=tmp_path)
+
+    assert all(split.model is None for split in stats.splits)
+    assert all(split.pipeline is None for split in stats.splits)
+    assert not list(tmp_path.rglob('*.joblib'))
+
+
+def test_retain_best(batch: Batch, tmp_path: Path):
+    retention = Retention(policy='best', k=2, metric='accuracy')
+    stats = Processor(retention=retention).process(batch, output=tmp_path)
+
+    kept = [split for split in stats.splits if split.model is not None]
+    dropped = [split for split in stats.splits if split.model is None]
+
+    assert len(kept) == 2
+    assert len(list(tmp_path.rglob('*.joblib'))) == 2
+
+    worst_kept = min(split.scores['accuracy'] for split in kept)
+    assert all(
+        split.scores['accuracy'] <= worst_kept
+        for split in dropped
+    )
+
+
+def test_retain_best_dumps(batch: Batch, tmp_path: Path, monkeypatch):
+    dumped = []
+    dump = joblib.dump
+
+    def counted(value, path, **kwargs):
+        if path.parent.name == 'models':
+            dumped.append(path.stem)
+
+        return dump(value, path, **kwargs)
+
+    monkeypatch.setattr(joblib, 'dump', counted)
+
+    retention = Retention(policy='best', k=2, metric='accuracy')
+    stats = Processor(retention=retention).process(batch, output=tmp_path)
+
+    # ? Serial splits run one by one, only models entering `k` best so far
+    # ? are dumped.
+    best = []
+    expected = []
+
+    for index, split in enumerate(stats.splits):
+        score = split.scores['accuracy']
+
+        if len(best) < 2 or score > best[-1]:
+            expected.append(str(index))
+            best = sorted(best + [score], reverse=True)[:2]
+
+    assert dumped == expected
+    assert len(dumped) < len(stats.splits)
+    assert len(list(tmp_path.rglob('*.joblib'))) == 2
@@ -1,2 +1,5 @@
 # flake8: noqa
 from .plot import Plot
+from .cache import PrefixCache, SplitCache
+from .plan import SplitPlan
+from .retention import ModelRef, Retention
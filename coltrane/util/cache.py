@@ -0,0 +1,263 @@
+import os
+import shutil
+from pathlib import Path
+from timeit import default_timer
+from typing import Dict, Optional
+
+import joblib
+import numpy as np
+from sklearn.pipeline import Pipeline
+
+from coltrane.util.fingerprint import digest
+from coltrane.util.stats import SplitStats
+
+
+class SplitCache:
+    """
+    On-disk store of processed splits.
+    Results are keyed by batch fingerprint and split index,
+    so repeated or interrupted runs pick up where they've left.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Parameters
+        ----------
+        path : Path
+            Folder holding cached results. It will be created if needed.
+        """
+
+        self.path = Path(path)
+
+    def get(self, fingerprint: str, split_index: int) -> Optional[SplitStats]:
+        """
+        Looks up stats of already processed split.
+
+        Parameters
+        ----------
+        fingerprint : str
+            Batch fingerprint.
+        split_index : int
+            Index of the split within batch.
+
+        Returns
+        -------
+        Optional[SplitStats]
+            `None` when split hasn't been processed yet.
+        """
+
+        path = self.__path(fingerprint, split_index)
+
+        if not path.exists():
+            return None
+
+        return joblib.load(path)
+
+    def put(self, fingerprint: str, split_index: int, stats: SplitStats):
+        """
+        Stores stats of processed split.
+
+        Parameters
+        ----------
+        fingerprint : str
+            Batch fingerprint.
+        split_index : int
+            Index of the split within batch.
+        stats : SplitStats
+            Split results.
+        """
+
+        path = self.__path(fingerprint, split_index)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # ? Atomic rename, so interrupted write never leaves broken entry.
+        partial = path.with_suffix('.partial')
+        joblib.dump(stats, partial)
+        os.replace(partial, path)
+
+    def clear(self, fingerprint: str = None):
+        """
+        Removes cached results.
+
+        Parameters
+        ----------
+        fingerprint : str, optional
+            Removes results of single batch only.
+        """
+
+        path = self.path
+
+        if fingerprint is not None:
+            path = Path(self.path, fingerprint)
+
+        shutil.rmtree(path, ignore_errors=True)
+
+    def __path(self, fingerprint: str, split_index: int) -> Path:
+        return Path(self.path, fingerprint, '{}.joblib'.format(split_index))
+
+
+class PrefixCache:
+    """
+    On-disk store of fitted transformers, that precede final estimator.
+    Fitted steps along with transformed training records are keyed by
+    steps params and digest of training data, so pipelines sharing
+    preprocessing don't refit it, across splits and batches.
+    Least recently used entries are evicted over the size limit.
+
+    Transformers are assumed to be deterministic, set their `random_state`.
+    """
+
+    def __init__(self, path: Path, max_bytes: int = 2 ** 30):
+        """
+        Parameters
+        ----------
+        path : Path
+            Folder holding cached transformers. It will be created if needed.
+        max_bytes : int, optional
+            Size limit of the folder, 1 GiB by default.
+        """
+
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+
+    def fit(
+        self,
+        pipeline: Pipeline,
+        x_train: np.ndarray,
+        y_train: np.ndarray,
+        data_key: str,
+        timings: Dict[str, Dict[str, float]] = None
+    ) -> Pipeline:
+        """
+        Fits pipeline, taking longest already fitted prefix from the cache.
+
+        Parameters
+        ----------
+        pipeline : Pipeline
+            Pipeline to fit. Its steps are replaced by fitted ones.
+        x_train : np.ndarray
+            Training records.
+        y_train : np.ndarray
+            Training labels.
+        data_key : str
+            Identifies training data, e.g. batch data fingerprint
+            combined with split indices.
+        timings : Dict[str, Dict[str, float]], optional
+            Durations of fitted steps are added here, by step name.
+
+        Returns
+        -------
+        Pipeline
+            Fitted pipeline.
+        """
+
+        steps = list(pipeline.steps)
+        transformers = steps[:-1]
+
+        keys = [
+            digest({
+                'data': data_key,
+                'steps': [
+                    [name, step, self.__params(step)]
+                    for name, step in transformers[:length]
+                ]
+            })
+            for length in range(1, len(transformers) + 1)
+        ]
+
+        fitted, xt = 0, x_train
+
+        for length in range(len(transformers), 0, -1):
+            entry = self.__get(keys[length - 1])
+
+            if entry is not None:
+                steps[:length], xt = entry
+                fitted = length
+                break
+
+        timings = {} if timings is None else timings
+
+        for index in range(fitted, len(transformers)):
+            name, transformer = steps[index]
+
+            if transformer is not None and transformer != 'passthrough':
+                start = default_timer()
+
+                if hasattr(transformer, 'fit_transform'):
+                    xt = transformer.fit_transform(xt, y_train)
+                else:
+                    xt = transformer.fit(xt, y_train).transform(xt)
+
+                times = timings.setdefault(name, {})
+                times['fit_transform'] = default_timer() - start
+
+            self.__put(keys[index], (steps[:index + 1], xt))
+
+        name, estimator = steps[-1]
+
+        if estimator is not None and estimator != 'passthrough':
+            start = default_timer()
+            estimator.fit(xt, y_train)
+            timings.setdefault(name, {})['fit'] = default_timer() - start
+
+        pipeline.steps = steps
+
+        return pipeline
+
+    def clear(self):
+        """
+        Removes cached transformers.
+        """
+
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    def __params(self, step) -> Dict:
+        if hasattr(step, 'get_params'):
+            return step.get_params(deep=True)
+
+        return {}
+
+    def __get(self, key: str):
+        path = Path(self.path, '{}.joblib'.format(key))
+
+        try:
+            entry = joblib.load(path)
+            os.utime(path)
+        except (FileNotFoundError, EOFError):
+            return None
+
+        return entry
+
+    def __put(self, key: str, entry):
+        self.path.mkdir(parents=True, exist_ok=True)
+
+        path = Path(self.path, '{}.joblib'.format(key))
+        partial = Path(self.path, '{}.{}.partial'.format(key, os.getpid()))
+        joblib.dump(entry, partial)
+        os.replace(partial, path)
+
+        self.__evict()
+
+    def __evict(self):
+        entries = []
+
+        for path in self.path.glob('*.joblib'):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        size = sum(entry_size for _, entry_size, _ in entries)
+
+        for _, entry_size, path in sorted(entries):
+            if size <= self.max_bytes:
+                break
+
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+            size -= entry_size
@@ -0,0 +1,131 @@
+import json
+from functools import partial
+from hashlib import blake2b
+from types import CodeType
+from typing import Any
+
+import numpy as np
+from sklearn.base import BaseEstimator
+
+
+def describe(value: Any) -> Any:
+    """
+    Turns config values into stable, json serializable form.
+    Estimators are described by their class, as their params are listed
+    separately by `get_params(deep=True)`.
+
+    Parameters
+    ----------
+    value : Any
+        Config value, e.g. estimator params.
+
+    Returns
+    -------
+    Any
+        Json serializable description.
+    """
+
+    if isinstance(value, BaseEstimator) or isinstance(value, type):
+        value = value if isinstance(value, type) else type(value)
+        return '{}.{}'.format(value.__module__, value.__qualname__)
+
+    if isinstance(value, np.ndarray):
+        return digest_array(value)
+
+    # ? Its repr holds memory address, state is what matters.
+    if isinstance(value, np.random.RandomState):
+        return [describe(item) for item in value.get_state()]
+
+    if isinstance(value, dict):
+        return {str(key): describe(item) for key, item in value.items()}
+
+    if isinstance(value, (list, tuple)):
+        return [describe(item) for item in value]
+
+    if isinstance(value, partial):
+        return {
+            'func': describe(value.func),
+            'args': describe(value.args),
+            'keywords': describe(value.keywords)
+        }
+
+    if callable(value) and hasattr(value, '__qualname__'):
+        name = '{}.{}'.format(value.__module__, value.__qualname__)
+
+        # ? Lambdas and closures, e.g. `<lambda>` or `f.<locals>.g`,
+        # ? share names, so they're told apart by code and captured values.
+        if '<' in value.__qualname__ and hasattr(value, '__code__'):
+            return _describe_function(name, value)
+
+        return name
+
+    return repr(value)
+
+
+def digest(value: Any) -> str:
+    """
+    Stable hash of config value.
+
+    Parameters
+    ----------
+    value : Any
+        Config value, e.g. estimator params.
+
+    Returns
+    -------
+    str
+    """
+
+    encoded = json.dumps(describe(value), sort_keys=True).encode('utf-8')
+    return blake2b(encoded, digest_size=16).hexdigest()
+
+
+def digest_array(values: np.ndarray) -> str:
+    """
+    Hash of array contents, e.g. split indices.
+
+    Parameters
+    ----------
+    values : np.ndarray
+
+    Returns
+    -------
+    str
+    """
+
+    values = np.ascontiguousarray(values)
+    hashed = blake2b(str(values.dtype).encode('utf-8'), digest_size=16)
+    hashed.update(str(values.shape).encode('utf-8'))
+    hashed.update(values.tobytes())
+    return hashed.hexdigest()
+
+
+def _describe_function(name: str, function: Any) -> Any:
+    closure = []
+
+    for cell in function.__closure__ or ():
+        try:
+            closure.append(describe(cell.cell_contents))
+        except ValueError:
+            # ? Cell isn't filled yet.
+            closure.append(None)
+
+    return {
+        'name': name,
+        'code': _describe_code(function.__code__),
+        'defaults': describe(function.__defaults__ or ()),
+        'kwdefaults': describe(function.__kwdefaults__ or {}),
+        'closure': closure
+    }
+
+
+def _describe_code(code: CodeType) -> Any:
+    return {
+        'bytecode': blake2b(code.co_code, digest_size=16).hexdigest(),
+        'names': list(code.co_names),
+        'consts': [
+            _describe_code(const) if isinstance(const, CodeType)
+            else repr(const)
+            for const in code.co_consts
+        ]
+    }
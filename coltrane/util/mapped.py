@@ -0,0 +1,42 @@
+from typing import Any, Dict, Iterable
+
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+
+
+def detach(
+    state: Dict[str, Any],
+    skipped: Iterable[str] = ()
+) -> Dict[str, Any]:
+    """
+    Picklable state of object holding memory mapped arrays.
+    Mapped arrays, sparse matrices over them and frames are left out,
+    so only paths travel. Workers reopen them by path, on first access.
+
+    Parameters
+    ----------
+    state : Dict[str, Any]
+        Object's `__dict__`.
+    skipped : Iterable[str], optional
+        Other entries, that are recomputed by the worker.
+
+    Returns
+    -------
+    Dict[str, Any]
+    """
+
+    skipped = set(skipped)
+
+    return {
+        key: value
+        for key, value in state.items()
+        if key not in skipped and not _mapped(value)
+    }
+
+
+def _mapped(value: Any) -> bool:
+    if sp.issparse(value):
+        value = getattr(value, 'data', None)
+
+    return isinstance(value, (np.memmap, pd.DataFrame))
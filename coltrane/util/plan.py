@@ -0,0 +1,153 @@
+import os
+import shutil
+from pathlib import Path
+from typing import Iterable, Tuple
+
+import numpy as np
+from lazy import lazy
+
+from .mapped import detach
+
+_INDICES = 'indices.npy'
+_BOUNDS = 'bounds.npy'
+
+
+class SplitPlan:
+    """
+    Indices of every cross-validation split, computed once and stored in
+    memory mapped `.npy` files. Indices of all splits are concatenated
+    into a single `int32` array (`int64` for larger data sets),
+    so they take half the memory of `sklearn` ones.
+
+    Pickled plan carries only the path, workers attach by it
+    and read indices of their split only.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Parameters
+        ----------
+        path : Path
+            Folder holding the plan. It will be created if needed.
+        """
+
+        self.path = Path(path)
+
+    @property
+    def exists(self) -> bool:
+        """
+        Whether plan has been written already.
+        """
+
+        return Path(self.path, _BOUNDS).exists()
+
+    @lazy
+    def bounds(self) -> np.ndarray:
+        """
+        Where train and test indices of each split begin,
+        `2 * split_index` and `2 * split_index + 1` respectively.
+        """
+
+        return np.load(Path(self.path, _BOUNDS))
+
+    @lazy
+    def indices(self) -> np.ndarray:
+        return np.load(Path(self.path, _INDICES), mmap_mode='r')
+
+    def __len__(self) -> int:
+        return (len(self.bounds) - 1) // 2
+
+    def __getitem__(self, split_index: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Indices of split, read from memory mapped file.
+
+        Parameters
+        ----------
+        split_index : int
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            Train and test indices.
+        """
+
+        start, middle, end = self.bounds[2 * split_index:2 * split_index + 3]
+
+        return self.indices[start:middle], self.indices[middle:end]
+
+    def write(
+        self,
+        splits: Iterable[Tuple[np.ndarray, np.ndarray]],
+        n_records: int
+    ) -> 'SplitPlan':
+        """
+        Stores splits, as they're generated, so they're never held
+        in memory all at once.
+
+        Parameters
+        ----------
+        splits : Iterable[Tuple[np.ndarray, np.ndarray]]
+            Train and test indices of each split,
+            e.g. `selection.split(x, y)`.
+        n_records : int
+            Number of records in data set.
+
+        Returns
+        -------
+        SplitPlan
+            Self, written.
+        """
+
+        # ? Written aside and renamed, so concurrent writers, e.g. shards,
+        # ? never see incomplete plan.
+        folder = self.path.with_name(
+            '{}.{}.partial'.format(self.path.name, os.getpid())
+        )
+
+        folder.mkdir(parents=True, exist_ok=True)
+
+        dtype = np.int32 if n_records < 2 ** 31 else np.int64
+        bounds = [0]
+
+        # ? Total size is known only once every split is generated.
+        raw = Path(folder, _INDICES + '.raw')
+
+        with open(raw, 'wb') as stream:
+            for train_index, test_index in splits:
+                for index in (train_index, test_index):
+                    np.asarray(index, dtype=dtype).tofile(stream)
+                    bounds.append(bounds[-1] + len(index))
+
+        indices = np.lib.format.open_memmap(
+            Path(folder, _INDICES),
+            mode='w+',
+            dtype=dtype,
+            shape=(bounds[-1],)
+        )
+
+        step = 2 ** 24
+
+        with open(raw, 'rb') as stream:
+            for start in range(0, bounds[-1], step):
+                chunk = np.fromfile(stream, dtype=dtype, count=step)
+                indices[start:start + len(chunk)] = chunk
+
+        indices.flush()
+        del indices
+        os.remove(raw)
+
+        np.save(Path(folder, _BOUNDS), np.array(bounds, dtype=np.int64))
+
+        try:
+            os.rename(folder, self.path)
+        except OSError:
+            # ? Other writer was first, plans are identical.
+            shutil.rmtree(folder, ignore_errors=True)
+
+        self.__dict__.pop('bounds', None)
+        self.__dict__.pop('indices', None)
+
+        return self
+
+    def __getstate__(self):
+        return detach(self.__dict__)
@@ -3,29 +3,44 @@
 from typing import Dict, List
 
 import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-import plotly.io as pio
-import plotly.offline as pyo
-from sklearn.decomposition import PCA
+import scipy.sparse as sp
 
 
 class Plot:
+    """
+    Plots into the notebook. `plotly` is imported on first plot,
+    headless plot never imports it, nor renders anything.
+    """
 
     def __init__(
         self,
         image_width: int = 1200,
         image_height: int = 900,
-        debug_mode: bool = False
+        debug_mode: bool = False,
+        headless: bool = False
     ) -> None:
 
         self.IMAGE_WIDTH = image_width
         self.IMAGE_HEIGHT = image_height
         self.DEBUG_MODE = debug_mode
+        self.HEADLESS = headless
+        self.__notebook = False
 
-        if not self.DEBUG_MODE:
+    def __render(self, fig, filename: str):
+        import plotly.io as pio
+        import plotly.offline as pyo
+
+        if not self.DEBUG_MODE and not self.__notebook:
             pyo.init_notebook_mode(connected=False)
             pio.renderers.default = 'notebook'
+            self.__notebook = True
+
+        pyo.iplot(
+            fig,
+            filename=filename,
+            image_width=self.IMAGE_WIDTH,
+            image_height=self.IMAGE_HEIGHT
+        )
 
     def class_balance(
         self,
@@ -43,6 +58,11 @@ class Plot:
             Plotly artifact.
         """
 
+        if self.HEADLESS:
+            return
+
+        import plotly.graph_objects as go
+
         class_balance = dict(sorted(class_balance.items()))
 
         labels = list(class_balance.keys())
@@ -61,12 +81,7 @@ class Plot:
 
         fig.update_layout(title='Class balance')
 
-        pyo.iplot(
-            fig,
-            filename=filename,
-            image_width=self.IMAGE_WIDTH,
-            image_height=self.IMAGE_HEIGHT
-        )
+        self.__render(fig, filename)
 
     # TODO 3d scatter plot
     def features_distribution(
@@ -87,6 +102,16 @@ class Plot:
             Respective labels for each of the records.
         """
 
+        if self.HEADLESS:
+            return
+
+        import plotly.express as px
+        from sklearn.decomposition import PCA, TruncatedSVD
+
+        # ? Sparse records are decomposed without densifying.
+        if sp.issparse(x):
+            x = TruncatedSVD(n_components=2).fit_transform(x)
+
         if x.shape[1] > 2:
             decomposer = PCA(n_components=2)
             records = decomposer.fit(x).transform(x)
@@ -103,12 +128,7 @@ class Plot:
             legend_title='Label'
         )
 
-        pyo.iplot(
-            fig,
-            filename=filename,
-            image_width=self.IMAGE_WIDTH,
-            image_height=self.IMAGE_HEIGHT
-        )
+        self.__render(fig, filename)
 
 
     def heatmap(
@@ -119,6 +139,11 @@ class Plot:
         xlabel='',
         filename=''
     ):
+        if self.HEADLESS:
+            return
+
+        import plotly.graph_objects as go
+
         fig = go.Figure()
 
         heatmap = go.Heatmap(
@@ -134,12 +159,7 @@ class Plot:
             title=plot_name
         )
 
-        pyo.iplot(
-            fig,
-            filename=filename,
-            image_width=self.IMAGE_WIDTH,
-            image_height=self.IMAGE_HEIGHT
-        )
+        self.__render(fig, filename)
 
     def scores(self, scores: Dict[str, List[float]], filename: str = ''):
         """
@@ -151,6 +171,9 @@ class Plot:
             Grouped scores dictionary, by metric name.
         """
 
+        if self.HEADLESS:
+            return
+
         normalized = {}
         other = {}
 
@@ -175,6 +198,11 @@ class Plot:
 
     def boxplot(self, data: Dict[str, List[float]], filename: str = ''):
 
+        if self.HEADLESS:
+            return
+
+        import plotly.graph_objects as go
+
         fig = go.Figure()
 
         for metric, values in data.items():
@@ -186,14 +214,14 @@ class Plot:
                 )
             )
 
-        pyo.iplot(
-            fig,
-            filename=filename,
-            image_width=self.IMAGE_WIDTH,
-            image_height=self.IMAGE_HEIGHT
-        )
+        self.__render(fig, filename)
 
     def distribution(self, data: List[float], name: str='', filename: str = ''):
+        if self.HEADLESS:
+            return
+
+        import plotly.express as px
+
         fig = px.histogram(
             x=data,
             marginal='rug'
@@ -203,9 +231,4 @@ class Plot:
             title=name,
         )
 
-        pyo.iplot(
-            fig,
-            filename=filename,
-            image_width=self.IMAGE_WIDTH,
-            image_height=self.IMAGE_HEIGHT
-        )
+        self.__render(fig, filename)
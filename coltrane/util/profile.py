@@ -0,0 +1,315 @@
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import wraps
+from timeit import default_timer
+from typing import Callable, Dict, List, Tuple
+
+from sklearn.pipeline import Pipeline
+
+from coltrane.executor import dispatched
+
+# ? Methods of pipeline steps, that are timed.
+_METHODS = (
+    'fit',
+    'partial_fit',
+    'fit_transform',
+    'transform',
+    'predict',
+    'predict_proba',
+    'predict_log_proba',
+    'decision_function',
+    'score'
+)
+
+
+@dataclass
+class Timings:
+    """
+    Where wall time of a single split goes. Durations are in seconds.
+
+    Attributes
+    ----------
+    started : float
+        Epoch time, when worker started the split.
+    queue : float
+        Time since split was dispatched to the pool until it started,
+        pickling included.
+    compute : float
+        Time since split started until it was done.
+    stages : Dict[str, float]
+        Durations of split stages, e.g. `fit`, `score`, `log`.
+    steps : Dict[str, Dict[str, float]]
+        Durations of pipeline steps' methods, by step name.
+    scorers : Dict[str, float]
+        Durations of each scorer.
+    spans : List[Tuple[str, str, float, float]]
+        Category, name, offset since start and duration of each timed block.
+    worker : str
+        Process and thread, that ran the split.
+    peak_memory : int
+        Peak of memory traced while split was running, in bytes.
+        `None` if it wasn't traced.
+    """
+
+    started: float = 0.0
+    queue: float = 0.0
+    compute: float = 0.0
+    stages: Dict[str, float] = field(default_factory=dict)
+    steps: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    scorers: Dict[str, float] = field(default_factory=dict)
+    spans: List[Tuple[str, str, float, float]] = field(default_factory=list)
+    worker: str = ''
+    peak_memory: int = None
+
+    @classmethod
+    def begin(cls) -> 'Timings':
+        """
+        Starts timing a split, in the worker that runs it.
+
+        Returns
+        -------
+        Timings
+        """
+
+        started = time.time()
+        submitted = dispatched()
+
+        timings = cls(
+            started=started,
+            queue=max(0.0, started - submitted) if submitted else 0.0,
+            worker='{}/{}'.format(os.getpid(), threading.get_ident())
+        )
+
+        timings.__origin = default_timer()
+
+        return timings
+
+    def end(self):
+        self.compute = default_timer() - self.__origin
+
+    @contextmanager
+    def span(self, category: str, name: str, totals: Dict[str, float]):
+        """
+        Times a block, adding its duration to `totals` under `name`.
+        """
+
+        start = default_timer()
+
+        try:
+            yield
+        finally:
+            end = default_timer()
+            totals[name] = totals.get(name, 0.0) + end - start
+            offset = start - self.__origin
+            self.spans.append((category, name, offset, end - start))
+
+    def stage(self, name: str):
+        return self.span('stage', name, self.stages)
+
+    def scorer(self, name: str):
+        return self.span('scorer', name, self.scorers)
+
+    @contextmanager
+    def trace_memory(self, enabled: bool = True):
+        """
+        Traces peak memory allocated within the block.
+        It's skipped when memory is already traced, e.g. by another thread.
+        """
+
+        if not enabled or tracemalloc.is_tracing():
+            yield
+            return
+
+        tracemalloc.start()
+
+        try:
+            yield
+        finally:
+            _, self.peak_memory = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+
+@contextmanager
+def instrument(pipeline: Pipeline, steps: Dict[str, Dict[str, float]]):
+    """
+    Times methods of pipeline steps called within the block.
+    Methods are wrapped only for its duration,
+    don't pickle the pipeline in the meantime.
+
+    Parameters
+    ----------
+    pipeline : Pipeline
+        Its steps are instrumented.
+    steps : Dict[str, Dict[str, float]]
+        Durations are added here, by step name and method.
+    """
+
+    patched = []
+
+    try:
+        for name, step in pipeline.steps:
+            if step is None or step == 'passthrough':
+                continue
+
+            times = steps.setdefault(name, {})
+            active = []
+
+            for method in _METHODS:
+                bound = getattr(step, method, None)
+
+                if bound is None:
+                    continue
+
+                setattr(step, method, _timed(bound, method, times, active))
+                patched.append((step, method))
+
+        yield
+
+    finally:
+        for step, method in patched:
+            delattr(step, method)
+
+
+def aggregate(timings: List[Timings]) -> Dict:
+    """
+    Sums up timings of many splits.
+
+    Parameters
+    ----------
+    timings : List[Timings]
+
+    Returns
+    -------
+    Dict
+        JSON serializable summary.
+    """
+
+    summary = {
+        'splits': len(timings),
+        'wall': 0.0,
+        'queue': _moments([timing.queue for timing in timings]),
+        'compute': _moments([timing.compute for timing in timings]),
+        'stages': {},
+        'steps': {},
+        'scorers': {},
+        'peak-memory': None
+    }
+
+    if timings:
+        start = min(timing.started - timing.queue for timing in timings)
+        end = max(timing.started + timing.compute for timing in timings)
+        summary['wall'] = end - start
+
+    for timing in timings:
+        _add(summary['stages'], timing.stages)
+        _add(summary['scorers'], timing.scorers)
+
+        for name, methods in timing.steps.items():
+            _add(summary['steps'].setdefault(name, {}), methods)
+
+    peaks = [
+        timing.peak_memory
+        for timing in timings
+        if timing.peak_memory is not None
+    ]
+
+    if peaks:
+        summary['peak-memory'] = max(peaks)
+
+    return summary
+
+
+def chrome_trace(timings: Dict[str, Timings]) -> Dict:
+    """
+    Lays out timings of splits in Chrome's trace event format,
+    viewable with `chrome://tracing` or Perfetto.
+
+    Parameters
+    ----------
+    timings : Dict[str, Timings]
+        Timings by split name.
+
+    Returns
+    -------
+    Dict
+        JSON serializable trace.
+    """
+
+    events = []
+
+    for split, timing in timings.items():
+        pid, tid = (int(part) for part in timing.worker.split('/'))
+        start = timing.started - timing.queue
+
+        spans = [('queue', 'queue', start, timing.queue)]
+        spans.append(('split', split, timing.started, timing.compute))
+
+        spans.extend(
+            (category, name, timing.started + offset, duration)
+            for category, name, offset, duration in timing.spans
+        )
+
+        events.extend(
+            {
+                'name': name,
+                'cat': category,
+                'ph': 'X',
+                'ts': start * 1e6,
+                'dur': duration * 1e6,
+                'pid': pid,
+                'tid': tid,
+                'args': {'split': split}
+            }
+            for category, name, start, duration in spans
+        )
+
+    return {
+        'traceEvents': events,
+        'displayTimeUnit': 'ms'
+    }
+
+
+def _timed(
+    method: Callable,
+    name: str,
+    times: Dict[str, float],
+    active: List[str]
+) -> Callable:
+
+    @wraps(method)
+    def timed(*args, **kwargs):
+        # ? Nested calls, e.g. `fit` within `fit_transform`,
+        # ? are counted once, by the outer one.
+        if active:
+            return method(*args, **kwargs)
+
+        active.append(name)
+        start = default_timer()
+
+        try:
+            return method(*args, **kwargs)
+        finally:
+            active.pop()
+            times[name] = times.get(name, 0.0) + default_timer() - start
+
+    return timed
+
+
+def _moments(values: List[float]) -> Dict[str, float]:
+    if not values:
+        return {'total': 0.0, 'mean': 0.0, 'max': 0.0}
+
+    return {
+        'total': sum(values),
+        'mean': sum(values) / len(values),
+        'max': max(values)
+    }
+
+
+def _add(totals: Dict[str, float], values: Dict[str, float]):
+    for name, value in values.items():
+        totals[name] = totals.get(name, 0.0) + value
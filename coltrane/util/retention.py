@@ -0,0 +1,172 @@
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List
+
+import joblib
+from sklearn.pipeline import Pipeline
+
+NONE = 'none'
+BEST = 'best'
+ALL = 'all'
+
+
+@dataclass(frozen=True)
+class ModelRef:
+    """
+    Fitted pipeline persisted on disk. It's loaded only when needed.
+    """
+
+    path: Path
+
+    def load(self) -> Pipeline:
+        return joblib.load(self.path)
+
+    @property
+    def exists(self) -> bool:
+        return Path(self.path).exists()
+
+    def remove(self):
+        if self.exists:
+            Path(self.path).unlink()
+
+
+@dataclass(frozen=True)
+class Retention:
+    """
+    Which fitted pipelines are kept after processing.
+
+    Parameters
+    ----------
+    policy : str, optional
+        `none` drops every model, `best` keeps `k` best by `metric`,
+        `all` keeps each split's model.
+    k : int, optional
+        Number of models kept by `best` policy.
+    metric : str, optional
+        Scorer's name, models are ranked by. Required by `best` policy.
+    greater_is_better : bool, optional
+        Whether greater score means better model.
+    compress : int, optional
+        `joblib` compression level, from 0 to 9.
+    """
+
+    policy: str = ALL
+    k: int = 1
+    metric: str = None
+    greater_is_better: bool = True
+    compress: int = 0
+
+    def __post_init__(self):
+        if self.policy not in (NONE, BEST, ALL):
+            raise ValueError('Unknown policy: {}'.format(self.policy))
+
+        if self.policy == BEST and self.metric is None:
+            raise ValueError('Best policy requires metric.')
+
+        if self.k < 1:
+            raise ValueError('At least one model must be kept.')
+
+    def save(
+        self,
+        pipeline: Pipeline,
+        path: Path,
+        scores: Dict[str, float] = None,
+        threshold: float = None
+    ) -> ModelRef:
+        """
+        Persists fitted pipeline, unless policy drops every model,
+        or it doesn't make it to `k` best.
+
+        Parameters
+        ----------
+        pipeline : Pipeline
+            Fitted pipeline.
+        path : Path
+            Target file.
+        scores : Dict[str, float], optional
+            Scores of the pipeline, checked by `best` policy.
+        threshold : float, optional
+            Score of the worst of `k` best models so far, see `threshold`.
+            Pipelines, that don't beat it, are never dumped.
+
+        Returns
+        -------
+        ModelRef
+            `None` for `none` policy, or model, that isn't kept.
+        """
+
+        if self.policy == NONE:
+            return None
+
+        if not self.__beats(scores, threshold):
+            return None
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        joblib.dump(pipeline, path, compress=self.compress)
+
+        return ModelRef(path)
+
+    def threshold(self, splits: List) -> float:
+        """
+        Score, models have to beat to make it to `k` best.
+        Threshold only grows stricter, as better models arrive,
+        so models worse than it are never kept.
+
+        Parameters
+        ----------
+        splits : List[SplitStats]
+            Processed splits of single batch.
+
+        Returns
+        -------
+        float
+            `None` until `k` models are kept, or for other policies.
+        """
+
+        if self.policy != BEST:
+            return None
+
+        kept = self.__ranked(splits)
+
+        if len(kept) < self.k:
+            return None
+
+        return kept[self.k - 1].scores[self.metric]
+
+    def prune(self, splits: List):
+        """
+        Removes models of splits, that didn't make it to `k` best.
+        Their refs are cleared.
+
+        Parameters
+        ----------
+        splits : List[SplitStats]
+            Processed splits of single batch.
+        """
+
+        if self.policy != BEST:
+            return
+
+        for split in self.__ranked(splits)[self.k:]:
+            split.model.remove()
+            split.model = None
+
+    def __ranked(self, splits: List) -> List:
+        # ? Stable, so the earlier of equal models is kept.
+        return sorted(
+            [split for split in splits if split.model is not None],
+            key=lambda split: split.scores[self.metric],
+            reverse=self.greater_is_better
+        )
+
+    def __beats(self, scores: Dict[str, float], threshold: float) -> bool:
+        if self.policy != BEST or scores is None or threshold is None:
+            return True
+
+        score = scores[self.metric]
+
+        if self.greater_is_better:
+            return score > threshold
+
+        return score < threshold
@@ -0,0 +1,50 @@
+from functools import wraps
+from typing import Any
+
+# ? Methods, whose outputs are shared by scorers.
+_METHODS = (
+    'predict',
+    'predict_proba',
+    'predict_log_proba',
+    'decision_function'
+)
+
+
+class CachedPredictions:
+    """
+    Fitted estimator proxy, that computes predictions only once per records,
+    so scorers evaluated on the same test set share them.
+    Everything else is delegated to the estimator.
+    """
+
+    def __init__(self, estimator: Any):
+        """
+        Parameters
+        ----------
+        estimator : Any
+            Fitted estimator, e.g. pipeline.
+        """
+
+        self.estimator = estimator
+        self.__cache = {}
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self.estimator, name)
+
+        if name not in _METHODS:
+            return attribute
+
+        @wraps(attribute)
+        def cached(x, *args, **kwargs):
+            if args or kwargs:
+                return attribute(x, *args, **kwargs)
+
+            # ? Records are kept along, so their `id` isn't reused.
+            key = (name, id(x))
+
+            if key not in self.__cache:
+                self.__cache[key] = (x, attribute(x))
+
+            return self.__cache[key][1]
+
+        return cached
@@ -0,0 +1,127 @@
+import queue
+import threading
+from typing import Any, List, Tuple
+
+from austen import Logger
+
+
+class Records:
+    """
+    Stand-in for child `Logger` within workers.
+    Calls are only recorded, `LogSink` replays them in the main process,
+    so workers never block on disk writes.
+    """
+
+    def __init__(self, name: str):
+        """
+        Parameters
+        ----------
+        name : str
+            Name of child logger, records are written to.
+        """
+
+        self.name = name
+        self.calls: List[Tuple[str, tuple]] = []
+
+    def add_entry(self, key: str, value: Any):
+        self.calls.append(('add_entry', (key, value)))
+
+    def save_json(self, obj: Any, name: str):
+        self.calls.append(('save_json', (obj, name)))
+
+    def save_obj(self, obj: Any, name: str):
+        self.calls.append(('save_obj', (obj, name)))
+
+
+class LogSink:
+    """
+    Writes records on a single background thread.
+    Records queued meanwhile are written at once, in batches.
+    """
+
+    def __init__(self, batch_size: int = 64):
+        """
+        Parameters
+        ----------
+        batch_size : int, optional
+            Maximum number of records written at once.
+        """
+
+        self.batch_size = batch_size
+        self.__queue = queue.Queue()
+        self.__thread = None
+        self.__error = None
+
+    def put(self, logger: Logger, records: Records):
+        """
+        Queues records for writing. It doesn't block.
+
+        Parameters
+        ----------
+        logger : Logger
+            Parent of child logger, records are written to.
+        records : Records
+            Calls recorded by a worker.
+        """
+
+        if self.__thread is None:
+            self.__thread = threading.Thread(
+                target=self.__write,
+                name='coltrane-log-sink',
+                daemon=True
+            )
+            self.__thread.start()
+
+        self.__queue.put((logger, records))
+
+    def close(self):
+        """
+        Waits until every queued record is written.
+        Raises first error the writer ran into.
+        """
+
+        if self.__thread is not None:
+            self.__queue.put(None)
+            self.__thread.join()
+            self.__thread = None
+
+        if self.__error is not None:
+            error, self.__error = self.__error, None
+            raise error
+
+    def __write(self):
+        done = False
+
+        while not done:
+            batch = [self.__queue.get()]
+
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.__queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            for item in batch:
+                if item is None:
+                    done = True
+                    continue
+
+                # ? Once failed, remaining records are drained, not written.
+                if self.__error is not None:
+                    continue
+
+                logger, records = item
+
+                try:
+                    with logger.get_child(records.name) as child:
+                        for method, args in records.calls:
+                            getattr(child, method)(*args)
+
+                except Exception as error:
+                    self.__error = error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
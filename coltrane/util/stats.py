@@ -1,22 +1,165 @@
-from dataclasses import dataclass
-from typing import Dict, List
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
 
+import numpy as np
 from lazy import lazy
+from scipy.stats import t
 from sklearn.pipeline import Pipeline
 
+from coltrane.util.profile import Timings, aggregate, chrome_trace
+from coltrane.util.retention import ModelRef
+
 
 @dataclass(init=True)
 class SplitStats():
     scores: Dict[str, float]
-    pipeline: Pipeline
+    model: Optional[ModelRef]
     dt_fit: float
+    timings: Timings = None
+
+    @property
+    def pipeline(self) -> Optional[Pipeline]:
+        """
+        Fitted pipeline, loaded from disk.
+        `None`, when it wasn't retained.
+        """
+
+        if self.model is None:
+            return None
+
+        return self.model.load()
+
+
+class RunningScores:
+    """
+    Running mean and variance of each metric, updated split by split
+    with Welford's algorithm.
+    """
+
+    def __init__(self):
+        self.metrics: List[str] = []
+        self.count = np.zeros(0, dtype=np.int64)
+        self.mean = np.zeros(0)
+        self.__m2 = np.zeros(0)
+
+    def update(self, scores: Dict[str, float]):
+        """
+        Accounts scores of another split.
+
+        Parameters
+        ----------
+        scores : Dict[str, float]
+            Scores by metric.
+        """
+
+        for metric in scores:
+            if metric not in self.metrics:
+                self.metrics.append(metric)
+                self.count = np.append(self.count, 0)
+                self.mean = np.append(self.mean, 0.0)
+                self.__m2 = np.append(self.__m2, 0.0)
+
+        index = np.array([self.metrics.index(metric) for metric in scores])
+        values = np.array(list(scores.values()), dtype=np.float64)
+
+        self.count[index] += 1
+        delta = values - self.mean[index]
+        self.mean[index] += delta / self.count[index]
+        self.__m2[index] += delta * (values - self.mean[index])
+
+    @property
+    def variance(self) -> np.ndarray:
+        """
+        Sample variance, `nan` until metric has two scores.
+        """
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(
+                self.count > 1,
+                self.__m2 / (self.count - 1),
+                np.nan
+            )
+
+    @property
+    def std(self) -> np.ndarray:
+        return np.sqrt(self.variance)
+
+    def interval(self, confidence: float = 0.95) -> np.ndarray:
+        """
+        Student's t confidence interval of each metric's mean.
+
+        Parameters
+        ----------
+        confidence : float, optional
+            Confidence level.
+
+        Returns
+        -------
+        np.ndarray
+            Lower and upper bounds, shaped `(metrics, 2)`.
+        """
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            quantile = t.ppf((1 + confidence) / 2, self.count - 1)
+            margin = quantile * self.std / np.sqrt(self.count)
+
+        return np.stack([self.mean - margin, self.mean + margin], axis=-1)
+
+    def summary(self, confidence: float = 0.95) -> Dict[str, Dict]:
+        """
+        Running stats by metric.
+
+        Returns
+        -------
+        Dict[str, Dict]
+            Count, mean, std and confidence interval of each metric.
+        """
+
+        interval = self.interval(confidence)
+
+        return {
+            metric: {
+                'count': int(self.count[index]),
+                'mean': float(self.mean[index]),
+                'std': float(self.std[index]),
+                'interval': [float(bound) for bound in interval[index]]
+            }
+            for index, metric in enumerate(self.metrics)
+        }
 
 
 @dataclass()
 class BatchStats():
-    splits: List[SplitStats]
+    """
+    Stats of processed splits. Splits may be added as they complete,
+    running stats of scores are kept up to date.
+    """
 
-    @lazy
+    splits: List[SplitStats] = field(default_factory=list)
+    total: int = None
+
+    def __post_init__(self):
+        self.running = RunningScores()
+
+        for split in self.splits:
+            self.running.update(split.scores)
+
+    def add(self, split: SplitStats):
+        """
+        Accounts another processed split.
+
+        Parameters
+        ----------
+        split : SplitStats
+        """
+
+        self.splits.append(split)
+        self.running.update(split.scores)
+
+        for cached in ('profile', 'trace'):
+            self.__dict__.pop(cached, None)
+
+    @property
     def grouped_scores(self) -> Dict[str, List[float]]:
         """
         Groups evaluated scores from each split by name.
@@ -43,3 +186,38 @@ class BatchStats():
                 grouped[metric].append(value)
 
         return grouped
+
+    @lazy
+    def profile(self) -> Dict:
+        """
+        Timings of splits summed up: queue wait and compute time,
+        stages, pipeline steps and scorers.
+
+        Returns
+        -------
+        Dict
+            JSON serializable summary.
+        """
+
+        return aggregate([
+            split.timings
+            for split in self.splits
+            if split.timings is not None
+        ])
+
+    @lazy
+    def trace(self) -> Dict:
+        """
+        Timings of splits in Chrome's trace event format.
+
+        Returns
+        -------
+        Dict
+            JSON serializable trace.
+        """
+
+        return chrome_trace({
+            str(index): split.timings
+            for index, split in enumerate(self.splits)
+            if split.timings is not None
+        })
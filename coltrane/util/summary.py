@@ -0,0 +1,643 @@
+import warnings
+from collections import Counter
+from typing import Dict, Iterable, List
+
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+
+
+class Summary:
+    """
+    Mergeable statistics of numerical columns.
+    Feed it with chunks of data, or merge summaries computed separately,
+    result doesn't depend on how records were split.
+    Quantiles are estimated from uniform sample of rows of bounded size.
+    """
+
+    def __init__(
+        self,
+        columns: List[str],
+        sample_size: int = 10000,
+        random_state: int = None
+    ):
+        """
+        Parameters
+        ----------
+        columns : List[str]
+            Names of summarized columns.
+        sample_size : int, optional
+            Number of rows kept for quantile estimation.
+        random_state : int, optional
+            Seed for sampling.
+        """
+
+        width = len(columns)
+
+        self.columns = list(columns)
+        self.sample_size = sample_size
+        self.random = np.random.RandomState(random_state)
+
+        self.records = 0
+        self.count = np.zeros(width, dtype=np.int64)
+        self.mean = np.zeros(width)
+        self.m2 = np.zeros(width)
+        self.min = np.full(width, np.inf)
+        self.max = np.full(width, -np.inf)
+
+        self.__keys = np.empty(0)
+        self.__sample = np.empty((0, width))
+
+    def update(self, values: np.ndarray) -> 'Summary':
+        """
+        Accumulates chunk of records.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            Two dimensional array, one column per summarized column.
+            Missing values should be `NaN`.
+
+        Returns
+        -------
+        Summary
+            Self, updated.
+        """
+
+        values = np.asarray(values, dtype=np.float64)
+        present = ~np.isnan(values)
+        count = present.sum(axis=0)
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = np.nansum(values, axis=0) / count
+            m2 = np.nansum((values - mean) ** 2, axis=0)
+
+        chunk = Summary(self.columns, self.sample_size)
+        chunk.records = len(values)
+        chunk.count = count
+        chunk.mean = np.where(count > 0, mean, 0.0)
+        chunk.m2 = np.where(count > 0, m2, 0.0)
+        # ? `fmin` and `fmax` skip missing values without masked copies.
+        chunk.min = np.fmin.reduce(values, axis=0, initial=np.inf)
+        chunk.max = np.fmax.reduce(values, axis=0, initial=-np.inf)
+
+        # ? Bottom-k sampling of rows, one key per row.
+        keys = self.random.uniform(size=len(values))
+
+        if len(keys) > self.sample_size:
+            kept = np.argpartition(keys, self.sample_size)
+            kept = kept[:self.sample_size]
+            keys, values = keys[kept], values[kept]
+
+        chunk.__keys, chunk.__sample = keys, values
+
+        return self.merge(chunk)
+
+    def merge(self, other: 'Summary') -> 'Summary':
+        """
+        Combines statistics with summary of other records.
+
+        Parameters
+        ----------
+        other : Summary
+            Summary of the same columns.
+
+        Returns
+        -------
+        Summary
+            Self, updated.
+        """
+
+        count = self.count + other.count
+        delta = other.mean - self.mean
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            share = np.where(count > 0, other.count / count, 0.0)
+            weight = np.where(count > 0, self.count * other.count / count, 0.0)
+
+        self.mean = self.mean + delta * share
+        self.m2 = self.m2 + other.m2 + delta ** 2 * weight
+        self.count = count
+        self.records += other.records
+        self.min = np.minimum(self.min, other.min)
+        self.max = np.maximum(self.max, other.max)
+
+        keys = np.concatenate([self.__keys, other.__keys])
+        sample = np.concatenate([self.__sample, other.__sample])
+
+        if len(keys) > self.sample_size:
+            kept = np.argpartition(keys, self.sample_size)
+            kept = kept[:self.sample_size]
+            keys, sample = keys[kept], sample[kept]
+
+        self.__keys, self.__sample = keys, sample
+
+        return self
+
+    @property
+    def missing(self) -> np.ndarray:
+        return self.records - self.count
+
+    @property
+    def std(self) -> np.ndarray:
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.sqrt(np.where(self.count > 1, self.m2, np.nan) / (
+                self.count - 1
+            ))
+
+    def quantile(self, q: float) -> np.ndarray:
+        # ? Missing values are kept in sampled rows, they're skipped here.
+        sample = self.__sample
+
+        if not len(sample):
+            return np.full(len(self.columns), np.nan)
+
+        with warnings.catch_warnings():
+            # ? All-NaN columns yield NaN, that's expected.
+            warnings.simplefilter('ignore', RuntimeWarning)
+            return np.nanquantile(sample, q, axis=0)
+
+    def describe(self) -> pd.DataFrame:
+        """
+        Statistics in `pandas.DataFrame.describe` layout.
+
+        Returns
+        -------
+        pd.DataFrame
+        """
+
+        empty = self.count == 0
+
+        rows = {
+            'count': self.count.astype(np.float64),
+            'mean': np.where(empty, np.nan, self.mean),
+            'std': self.std,
+            'min': np.where(empty, np.nan, self.min),
+            '25%': self.quantile(0.25),
+            '50%': self.quantile(0.5),
+            '75%': self.quantile(0.75),
+            'max': np.where(empty, np.nan, self.max)
+        }
+
+        return pd.DataFrame(rows, index=self.columns).T
+
+
+class SparseSummary(Summary):
+    """
+    Mergeable statistics of sparse numerical columns.
+    Entries, that aren't stored, are zeros, `NaN` has to be stored.
+    Moments are computed from stored entries, without densifying.
+    Quantiles are estimated from uniform sample of rows, kept sparse,
+    so wide data sets don't need dense sample of every column.
+    """
+
+    def __init__(
+        self,
+        columns: List[str],
+        sample_size: int = 10000,
+        random_state: int = None
+    ):
+        """
+        Parameters
+        ----------
+        columns : List[str]
+            Names of summarized columns.
+        sample_size : int, optional
+            Number of rows kept for quantile estimation.
+        random_state : int, optional
+            Seed for sampling.
+        """
+
+        # ? Dense sample of base summary stays empty.
+        super().__init__(columns, 0, random_state)
+        self.sample_size = sample_size
+
+        self.__keys = np.empty(0)
+        self.__rows = sp.csr_matrix((0, len(self.columns)))
+
+    def update(self, values: sp.spmatrix) -> 'SparseSummary':
+        """
+        Accumulates chunk of records.
+
+        Parameters
+        ----------
+        values : sp.spmatrix
+            Sparse matrix, one column per summarized column.
+
+        Returns
+        -------
+        SparseSummary
+            Self, updated.
+        """
+
+        values = sp.csc_matrix(values, dtype=np.float64)
+        records, width = values.shape
+
+        columns = np.repeat(np.arange(width), np.diff(values.indptr))
+        present = ~np.isnan(values.data)
+        data = values.data[present]
+        columns, missing = columns[present], columns[~present]
+
+        stored = np.bincount(columns, minlength=width)
+        count = records - np.bincount(missing, minlength=width)
+        zeros = count - stored
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            total = np.bincount(columns, data, minlength=width)
+            mean = np.where(count > 0, total / count, 0.0)
+
+        deviation = (data - mean[columns]) ** 2
+        m2 = np.bincount(columns, deviation, minlength=width)
+
+        chunk = SparseSummary(self.columns, self.sample_size)
+        chunk.records = records
+        chunk.count = count
+        chunk.mean = mean
+        chunk.m2 = m2 + zeros * mean ** 2
+
+        lowest = np.where(np.isnan(values.data), np.inf, values.data)
+        highest = np.where(np.isnan(values.data), -np.inf, values.data)
+        lowest = _reduce_columns(np.minimum, values.indptr, lowest, np.inf)
+        highest = _reduce_columns(np.maximum, values.indptr, highest, -np.inf)
+
+        chunk.min = np.where(zeros > 0, np.minimum(lowest, 0.0), lowest)
+        chunk.max = np.where(zeros > 0, np.maximum(highest, 0.0), highest)
+
+        # ? Bottom-k sampling of whole rows.
+        chunk.__keys = self.random.uniform(size=records)
+        chunk.__rows = values.tocsr()
+
+        return self.merge(chunk)
+
+    def merge(self, other: 'SparseSummary') -> 'SparseSummary':
+        """
+        Combines statistics with summary of other records.
+
+        Parameters
+        ----------
+        other : SparseSummary
+            Summary of the same columns.
+
+        Returns
+        -------
+        SparseSummary
+            Self, updated.
+        """
+
+        super().merge(other)
+
+        keys = np.concatenate([self.__keys, other.__keys])
+        rows = sp.vstack([self.__rows, other.__rows], format='csr')
+
+        if len(keys) > self.sample_size:
+            kept = np.argpartition(keys, self.sample_size)
+            kept = kept[:self.sample_size]
+            keys, rows = keys[kept], rows[kept]
+
+        self.__keys, self.__rows = keys, rows
+
+        return self
+
+    def quantile(self, q: float) -> np.ndarray:
+        rows = self.__rows.tocsc()
+        quantiles = np.full(len(self.columns), np.nan)
+
+        if not rows.shape[0]:
+            return quantiles
+
+        # ? Sample is densified in blocks of columns, to bound memory.
+        step = max(1, 2 ** 20 // rows.shape[0])
+
+        for start in range(0, rows.shape[1], step):
+            block = rows[:, start:start + step].toarray()
+
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', RuntimeWarning)
+                quantiles[start:start + step] = np.nanquantile(
+                    block,
+                    q,
+                    axis=0
+                )
+
+        return quantiles
+
+
+class Distinct:
+    """
+    Mergeable estimate of distinct values count.
+    Keeps `size` smallest 64-bit hashes, count is exact below that.
+    """
+
+    def __init__(self, size: int = 1024):
+        """
+        Parameters
+        ----------
+        size : int, optional
+            Number of kept hashes. Relative error is about `1 / sqrt(size)`.
+        """
+
+        self.size = size
+        self.hashes = np.empty(0, dtype=np.uint64)
+
+    def update(self, hashes: np.ndarray) -> 'Distinct':
+        hashes = np.concatenate([self.hashes, np.asarray(hashes, np.uint64)])
+        self.hashes = np.unique(hashes)[:self.size]
+        return self
+
+    def merge(self, other: 'Distinct') -> 'Distinct':
+        return self.update(other.hashes)
+
+    @property
+    def count(self) -> int:
+        if len(self.hashes) < self.size:
+            return len(self.hashes)
+
+        # ? k-th smallest of uniformly spread hashes
+        kth = float(self.hashes[-1]) / 2.0 ** 64
+        return int(round((self.size - 1) / kth))
+
+
+class Statistics:
+    """
+    Statistics of the whole data set, gathered in a single sweep.
+    Counts records, missing and distinct values of every column,
+    moments and quantiles of numerical attributes, and class balance.
+    Chunks or partitions can be summarized separately, even in different
+    processes, and merged afterwards.
+    """
+
+    def __init__(
+        self,
+        attributes: List[str],
+        numerical: List[str],
+        label: str,
+        sample_size: int = 4096,
+        distinct_size: int = 1024,
+        max_classes: int = 1000,
+        sparse: bool = False
+    ):
+        """
+        Parameters
+        ----------
+        attributes : List[str]
+            Names of attribute columns.
+        numerical : List[str]
+            Attributes, that are summarized with moments and quantiles.
+        label : str
+            Name of ground truth column.
+        sample_size : int, optional
+            Values per numerical attribute kept for quantile estimation.
+        distinct_size : int, optional
+            Hashes per column kept for distinct values estimation.
+        max_classes : int, optional
+            Class balance is dropped, once label has more distinct values,
+            e.g. for regression.
+        sparse : bool, optional
+            Whether attributes come as sparse matrices, see `update_sparse`.
+            Quantiles are then estimated from `sample_size` rows.
+        """
+
+        self.attributes = [str(attribute) for attribute in attributes]
+        self.numerical = [str(attribute) for attribute in numerical]
+        self.label = str(label)
+        self.max_classes = max_classes
+
+        self.records = 0
+        self.missing = pd.Series(0, index=self.columns, dtype=np.int64)
+
+        if sparse:
+            self.summary = SparseSummary(self.numerical, sample_size)
+        else:
+            self.summary = Summary(self.numerical, sample_size)
+
+        self.distinct = {
+            column: Distinct(distinct_size)
+            for column in self.columns
+        }
+        self.balance = Counter()
+
+    @classmethod
+    def of(cls, frames: Iterable[pd.DataFrame], *args, **kwargs):
+        """
+        Summarizes chunks of data set.
+
+        Parameters
+        ----------
+        frames : Iterable[pd.DataFrame]
+            Chunks holding attributes and label columns.
+        *args, **kwargs
+            Passed to `Statistics`.
+
+        Returns
+        -------
+        Statistics
+        """
+
+        statistics = cls(*args, **kwargs)
+
+        for frame in frames:
+            statistics.update(frame)
+
+        return statistics
+
+    @property
+    def columns(self) -> List[str]:
+        return self.attributes + [self.label]
+
+    def update(self, frame: pd.DataFrame) -> 'Statistics':
+        """
+        Accumulates chunk of records.
+
+        Parameters
+        ----------
+        frame : pd.DataFrame
+            Chunk holding attributes and label columns.
+
+        Returns
+        -------
+        Statistics
+            Self, updated.
+        """
+
+        frame = frame.copy(deep=False)
+        frame.columns = [str(column) for column in frame.columns]
+
+        self.records += len(frame)
+
+        missing = frame[self.columns].isna()
+        self.missing += missing.sum().values
+
+        self.summary.update(frame[self.numerical].values.astype(np.float64))
+
+        for column in self.columns:
+            values = frame[column][~missing[column].values]
+            hashes = pd.util.hash_pandas_object(values, index=False)
+            self.distinct[column].update(hashes.values)
+
+        if self.balance is not None:
+            labels = frame[self.label].value_counts()
+            self.balance.update(labels.to_dict())
+            self.__limit_classes()
+
+        return self
+
+    def update_sparse(
+        self,
+        x: sp.spmatrix,
+        y: np.ndarray
+    ) -> 'Statistics':
+        """
+        Accumulates chunk of records held in sparse matrix,
+        without densifying it. Every attribute has to be numerical.
+
+        Parameters
+        ----------
+        x : sp.spmatrix
+            Attributes of chunk, entries that aren't stored are zeros.
+        y : np.ndarray
+            Labels of chunk.
+
+        Returns
+        -------
+        Statistics
+            Self, updated.
+        """
+
+        if self.numerical != self.attributes:
+            raise ValueError('Sparse attributes have to be numerical.')
+
+        x = sp.csc_matrix(x, dtype=np.float64)
+        labels = pd.Series(y)
+        records, width = x.shape
+
+        self.records += records
+
+        columns = np.repeat(np.arange(width), np.diff(x.indptr))
+        present = ~np.isnan(x.data)
+        missing = np.bincount(columns[~present], minlength=width)
+
+        self.missing += np.append(missing, labels.isna().sum())
+        self.summary.update(x)
+
+        # ? Hashes of each column are sorted, smallest ones come first.
+        columns = columns[present]
+        hashes = pd.util.hash_array(x.data[present])
+        zeros = records - missing > np.bincount(columns, minlength=width)
+
+        if zeros.any():
+            zero = pd.util.hash_array(np.zeros(1))[0]
+            columns = np.append(columns, np.flatnonzero(zeros))
+            hashes = np.append(hashes, np.full(zeros.sum(), zero, np.uint64))
+
+        order = np.lexsort((hashes, columns))
+        columns, hashes = columns[order], hashes[order]
+
+        unique = np.ones(len(hashes), dtype=bool)
+        unique[1:] = columns[1:] != columns[:-1]
+        unique[1:] |= hashes[1:] != hashes[:-1]
+        columns, hashes = columns[unique], hashes[unique]
+
+        bounds = np.searchsorted(columns, np.arange(width + 1))
+
+        for attribute, start, end in zip(self.attributes, bounds, bounds[1:]):
+            distinct = self.distinct[attribute]
+            distinct.update(hashes[start:min(end, start + distinct.size)])
+
+        labels = labels.dropna()
+        hashes = pd.util.hash_pandas_object(labels, index=False)
+        self.distinct[self.label].update(hashes.values)
+
+        if self.balance is not None:
+            self.balance.update(labels.value_counts().to_dict())
+            self.__limit_classes()
+
+        return self
+
+    def merge(self, other: 'Statistics') -> 'Statistics':
+        """
+        Combines statistics with summary of other records.
+
+        Parameters
+        ----------
+        other : Statistics
+            Summary of the same columns.
+
+        Returns
+        -------
+        Statistics
+            Self, updated.
+        """
+
+        self.records += other.records
+        self.missing += other.missing
+        self.summary.merge(other.summary)
+
+        for column, distinct in other.distinct.items():
+            self.distinct[column].merge(distinct)
+
+        if self.balance is not None and other.balance is not None:
+            self.balance.update(other.balance)
+            self.__limit_classes()
+        else:
+            self.balance = None
+
+        return self
+
+    @property
+    def missing_count(self) -> int:
+        return int(self.missing.sum())
+
+    @property
+    def cardinality(self) -> Dict[str, int]:
+        """
+        Estimated number of distinct values in each column.
+        """
+
+        return {
+            column: distinct.count
+            for column, distinct in self.distinct.items()
+        }
+
+    @property
+    def class_balance(self) -> Dict[str, int]:
+        """
+        Record count for each label.
+        `None` if label had too many distinct values.
+        """
+
+        if self.balance is None:
+            return None
+
+        return {str(label): count for label, count in self.balance.items()}
+
+    def describe(self) -> pd.DataFrame:
+        """
+        Statistics of numerical attributes,
+        in `pandas.DataFrame.describe` layout.
+
+        Returns
+        -------
+        pd.DataFrame
+        """
+
+        return self.summary.describe()
+
+    def __limit_classes(self):
+        if len(self.balance) > self.max_classes:
+            self.balance = None
+
+
+def _reduce_columns(
+    ufunc: np.ufunc,
+    indptr: np.ndarray,
+    values: np.ndarray,
+    initial: float
+) -> np.ndarray:
+    reduced = np.full(len(indptr) - 1, initial)
+    filled = np.diff(indptr) > 0
+
+    # ? Empty columns would take value of the next one.
+    if filled.any():
+        reduced[filled] = ufunc.reduceat(values, indptr[:-1][filled])
+
+    return reduced
@@ -0,0 +1,64 @@
+from pathlib import Path
+
+from pytest import fixture
+from sklearn.naive_bayes import GaussianNB
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import StandardScaler
+
+from coltrane.file.io.csv.single import Data
+
+from ..cache import PrefixCache
+
+
+@fixture(scope='function')
+def data(iris_path: Path) -> Data:
+    return Data(path=iris_path)
+
+
+@fixture(scope='function')
+def pipeline() -> Pipeline:
+    return Pipeline(
+        steps=[
+            ('standard-scaler', StandardScaler()),
+            ('naive-bayes', GaussianNB())
+        ],
+    )
+
+
+def test_prefix_cache(data: Data, pipeline: Pipeline, tmp_path: Path):
+    cache = PrefixCache(tmp_path / 'prefix')
+
+    expected = Pipeline(
+        steps=[
+            ('standard-scaler', StandardScaler()),
+            ('naive-bayes', GaussianNB())
+        ],
+    ).fit(data.x, data.y)
+
+    fitted = cache.fit(pipeline, data.x, data.y, 'iris')
+    assert len(list(cache.path.glob('*.joblib'))) == 1
+
+    # ? Other estimator reuses fitted scaler.
+    other = Pipeline(
+        steps=[
+            ('standard-scaler', StandardScaler()),
+            ('bayes', GaussianNB(var_smoothing=1e-3))
+        ],
+    )
+
+    other = cache.fit(other, data.x, data.y, 'iris')
+    assert len(list(cache.path.glob('*.joblib'))) == 1
+    assert other.steps[0][1].mean_ is not None
+
+    assert (fitted.predict(data.x) == expected.predict(data.x)).all()
+
+
+def test_prefix_cache_eviction(
+    data: Data,
+    pipeline: Pipeline,
+    tmp_path: Path
+):
+    cache = PrefixCache(tmp_path / 'prefix', max_bytes=1)
+
+    cache.fit(pipeline, data.x, data.y, 'iris')
+    assert not list(cache.path.glob('*.joblib'))
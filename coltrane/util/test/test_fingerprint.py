@@ -0,0 +1,28 @@
+import numpy as np
+from sklearn.metrics import accuracy_score
+from sklearn.preprocessing import FunctionTransformer
+
+from ..fingerprint import describe, digest
+
+
+def test_callables():
+    def power(exponent):
+        return lambda x: x ** exponent
+
+    identity = FunctionTransformer(lambda x: x)
+    square = FunctionTransformer(lambda x: x ** 2)
+
+    assert describe(identity.func) != describe(square.func)
+    assert describe(power(2)) != describe(power(3))
+    assert describe(power(2)) == describe(power(2))
+    assert describe(accuracy_score) == describe(accuracy_score)
+
+
+def test_random_state():
+    assert (
+        digest(np.random.RandomState(7)) == digest(np.random.RandomState(7))
+    )
+
+    assert (
+        digest(np.random.RandomState(7)) != digest(np.random.RandomState(8))
+    )
@@ -0,0 +1,29 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+
+from ..mapped import detach
+
+
+def test_detach(tmp_path: Path):
+    path = Path(tmp_path, 'values.npy')
+    np.save(path, np.arange(10.0))
+    mapped = np.load(path, mmap_mode='r')
+
+    matrix = sp.csr_matrix((1, 10))
+    matrix.data = mapped
+
+    state = {
+        'path': path,
+        'values': np.arange(3),
+        'mapped': mapped,
+        'matrix': matrix,
+        'frame': pd.DataFrame(mapped),
+        'statistics': {}
+    }
+
+    detached = detach(state, skipped=('statistics',))
+
+    assert set(detached) == {'path', 'values'}
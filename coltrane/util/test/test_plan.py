@@ -0,0 +1,48 @@
+import pickle
+from pathlib import Path
+
+import numpy as np
+from pytest import mark
+from sklearn.model_selection import RepeatedStratifiedKFold, ShuffleSplit
+
+from ..plan import SplitPlan
+
+
+@mark.parametrize('selection', [
+    RepeatedStratifiedKFold(n_splits=5, n_repeats=3, random_state=0),
+    ShuffleSplit(n_splits=4, test_size=0.3, random_state=0)
+])
+def test_write(selection, tmp_path: Path):
+    y = np.arange(300) % 3
+    expected = list(selection.split(y, y))
+
+    plan = SplitPlan(Path(tmp_path, 'plan'))
+    assert not plan.exists
+
+    plan.write(selection.split(y, y), len(y))
+
+    assert plan.exists
+    assert len(plan) == len(expected)
+
+    for split_index, (train_index, test_index) in enumerate(expected):
+        train, test = plan[split_index]
+
+        assert isinstance(train, np.memmap)
+        assert train.dtype == np.int32
+        assert np.array_equal(train, train_index)
+        assert np.array_equal(test, test_index)
+
+
+def test_pickle_without_indices(tmp_path: Path):
+    y = np.arange(10000) % 2
+    selection = ShuffleSplit(n_splits=10, random_state=0)
+    plan = SplitPlan(tmp_path).write(selection.split(y, y), len(y))
+
+    train, test = plan[3]
+    dumped = pickle.dumps(plan)
+
+    assert len(dumped) < train.nbytes
+
+    attached = pickle.loads(dumped)
+    assert np.array_equal(attached[3][0], train)
+    assert np.array_equal(attached[3][1], test)
@@ -1,3 +1,6 @@
+import subprocess
+import sys
+
 import numpy as np
 from pytest import fixture
 from sklearn.datasets import make_classification
@@ -52,3 +55,14 @@ def test_metrics(plot: Plot):
     }
 
     plot.scores(scores)
+
+
+def test_headless():
+    code = '\n'.join([
+        'import sys',
+        'from coltrane.util.plot import Plot',
+        'Plot(headless=True).class_balance({"a": 1})',
+        'assert "plotly" not in sys.modules'
+    ])
+
+    subprocess.run([sys.executable, '-c', code], check=True)
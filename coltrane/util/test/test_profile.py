@@ -0,0 +1,31 @@
+from pathlib import Path
+
+from sklearn.naive_bayes import GaussianNB
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import StandardScaler
+
+from coltrane.file.io.csv.single import Data
+
+from ..profile import instrument
+
+
+def test_instrument(iris_path: Path):
+    data = Data(path=iris_path)
+    pipeline = Pipeline(
+        steps=[
+            ('standard-scaler', StandardScaler()),
+            ('naive-bayes', GaussianNB())
+        ],
+    )
+
+    steps = {}
+
+    with instrument(pipeline, steps):
+        pipeline.fit(data.x, data.y)
+        pipeline.predict(data.x)
+
+    assert set(steps['standard-scaler']) == {'fit_transform', 'transform'}
+    assert set(steps['naive-bayes']) == {'fit', 'predict'}
+
+    # ? Steps are restored, so the pipeline pickles.
+    assert 'fit' not in vars(pipeline.steps[0][1])
@@ -0,0 +1,11 @@
+from pytest import raises
+
+from ..retention import Retention
+
+
+def test_invalid_retention():
+    with raises(ValueError):
+        Retention(policy='some')
+
+    with raises(ValueError):
+        Retention(policy='best')
@@ -0,0 +1,42 @@
+from sklearn.datasets import load_iris
+from sklearn.metrics import accuracy_score, f1_score, get_scorer, make_scorer
+from sklearn.naive_bayes import GaussianNB
+
+from ..scoring import CachedPredictions
+
+
+class CountingNB(GaussianNB):
+
+    calls = 0
+
+    def predict(self, x):
+        CountingNB.calls += 1
+        return super().predict(x)
+
+    def predict_proba(self, x):
+        CountingNB.calls += 1
+        return super().predict_proba(x)
+
+
+def test_cached_predictions():
+    x, y = load_iris(return_X_y=True)
+    estimator = CountingNB().fit(x, y)
+    predictions = CachedPredictions(estimator)
+
+    scorers = [
+        make_scorer(accuracy_score),
+        make_scorer(f1_score, average='macro'),
+        get_scorer('neg_log_loss'),
+        get_scorer('roc_auc_ovr')
+    ]
+
+    scores = [scorer(predictions, x, y) for scorer in scorers]
+
+    # ? `predict_proba` of GaussianNB doesn't call `predict`.
+    assert CountingNB.calls == 2
+
+    CountingNB.calls = 0
+    assert scores == [scorer(estimator, x, y) for scorer in scorers]
+    assert CountingNB.calls == 4
+
+    assert predictions.classes_ is estimator.classes_
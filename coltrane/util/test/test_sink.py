@@ -0,0 +1,63 @@
+import threading
+
+from pytest import raises
+
+from ..sink import LogSink, Records
+
+
+class Logger:
+
+    def __init__(self):
+        self.children = {}
+        self.threads = set()
+
+    def get_child(self, name: str) -> 'Logger':
+        self.threads.add(threading.get_ident())
+        return self.children.setdefault(name, Child())
+
+
+class Child:
+
+    def __init__(self):
+        self.entries = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def add_entry(self, key, value):
+        if key == 'broken':
+            raise IOError('Disk is full.')
+
+        self.entries[key] = value
+
+
+def test_sink():
+    logger = Logger()
+
+    with LogSink(batch_size=4) as sink:
+        for index in range(10):
+            records = Records(str(index))
+            records.add_entry('scores', {'accuracy': index})
+            sink.put(logger, records)
+
+    assert len(logger.children) == 10
+    assert logger.children['7'].entries == {'scores': {'accuracy': 7}}
+    assert threading.get_ident() not in logger.threads
+
+
+def test_sink_error():
+    logger = Logger()
+    sink = LogSink()
+
+    records = Records('0')
+    records.add_entry('broken', None)
+    sink.put(logger, records)
+
+    with raises(IOError):
+        sink.close()
+
+    # ? Error is raised once.
+    sink.close()
@@ -0,0 +1,39 @@
+import numpy as np
+
+from ..stats import BatchStats, RunningScores, SplitStats
+
+
+def test_running_scores():
+    scores = np.random.RandomState(0).rand(20, 2)
+    running = RunningScores()
+
+    for accuracy, f1 in scores:
+        running.update({'accuracy': accuracy, 'f1': f1})
+
+    assert running.metrics == ['accuracy', 'f1']
+    assert np.allclose(running.mean, scores.mean(axis=0))
+    assert np.allclose(running.variance, scores.var(axis=0, ddof=1))
+
+    interval = running.interval(0.95)
+    assert np.all(interval[:, 0] < running.mean)
+    assert np.all(running.mean < interval[:, 1])
+
+    # ? Wider at higher confidence.
+    wider = running.interval(0.99)
+    assert np.all(wider[:, 1] - wider[:, 0] > interval[:, 1] - interval[:, 0])
+
+
+def test_running_scores_single():
+    running = RunningScores()
+    running.update({'accuracy': 1.0})
+
+    assert np.isnan(running.variance[0])
+    assert running.summary()['accuracy']['count'] == 1
+
+
+def test_batch_stats_add():
+    stats = BatchStats([SplitStats({'accuracy': 0.5}, None, 0.0)])
+    stats.add(SplitStats({'accuracy': 1.0}, None, 0.0))
+
+    assert stats.grouped_scores == {'accuracy': [0.5, 1.0]}
+    assert stats.running.mean[0] == 0.75
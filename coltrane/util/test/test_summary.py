@@ -0,0 +1,112 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+from pytest import approx, fixture
+
+from coltrane.classification import Inspector
+from coltrane.executor import Process
+from coltrane.file.io import npy
+from coltrane.file.io.csv.single import Data
+
+from ..summary import Distinct, SparseSummary, Statistics, Summary
+
+
+@fixture(scope='function')
+def data(iris_path: Path) -> Data:
+    return Data(path=iris_path)
+
+
+def test_statistics(data: Data):
+    statistics = data.statistics
+
+    assert statistics.records == 150
+    assert statistics.missing_count == 0
+    assert np.allclose(statistics.describe(), data.describe())
+    assert statistics.cardinality['Species'] == 3
+    assert statistics.class_balance == {
+        'Iris-setosa': 50,
+        'Iris-versicolor': 50,
+        'Iris-virginica': 50
+    }
+
+
+def test_merge(data: Data):
+    args = (list(data.attributes), list(data.attributes), data.label)
+    halves = [
+        Statistics.of(data.chunks(chunksize=60), *args),
+        Statistics.of(data.chunks(chunksize=60), *args)
+    ]
+
+    merged = halves[0].merge(halves[1])
+
+    assert merged.records == 300
+    assert np.allclose(merged.summary.mean, data.statistics.summary.mean)
+    assert merged.cardinality == data.statistics.cardinality
+
+
+def test_partitions(data: Data, tmp_path: Path):
+    partitions = [
+        npy.dump(data, Path(tmp_path, str(partition)))
+        for partition in range(3)
+    ]
+
+    with Process(n_jobs=2) as executor:
+        statistics = Inspector().summarize(partitions, executor)
+
+    assert statistics.records == 450
+    assert np.allclose(statistics.describe().loc['mean'], data.x.mean(0))
+
+
+def test_distinct(random_state: int):
+    values = np.random.RandomState(random_state).randint(0, 50000, 200000)
+    hashes = pd.util.hash_array(values)
+
+    distinct = Distinct(size=1024).update(hashes)
+    expected = len(np.unique(values))
+
+    assert abs(distinct.count - expected) / expected < 0.1
+
+
+def test_sparse_summary(random_state: int):
+    values = sp.random(
+        400,
+        8,
+        density=0.1,
+        format='lil',
+        random_state=random_state
+    )
+
+    values[5, 3] = np.nan
+    values[:, 7] = 0
+    values = values.tocsr()
+
+    columns = [str(column) for column in range(8)]
+    dense = Summary(columns, sample_size=1000).update(values.toarray())
+
+    halves = [
+        SparseSummary(columns, sample_size=1000).update(values[:150]),
+        SparseSummary(columns, sample_size=1000).update(values[150:])
+    ]
+
+    merged = halves[0].merge(halves[1])
+
+    assert np.array_equal(merged.count, dense.count)
+    assert np.allclose(merged.describe(), dense.describe(), equal_nan=True)
+
+
+def test_summary_sample(random_state: int):
+    values = np.random.RandomState(random_state).normal(size=(5000, 3))
+    values[::2, 0] = np.nan
+
+    summary = Summary(['a', 'b', 'c'], sample_size=100)
+
+    for start in range(0, len(values), 1000):
+        summary.update(values[start:start + 1000])
+
+    # ? Sample holds whole rows, at most `sample_size` of them.
+    assert summary._Summary__sample.shape == (100, 3)
+    assert np.nanmin(values, axis=0) == approx(summary.min)
+    assert np.nanmax(values, axis=0) == approx(summary.max)
+    assert not np.isnan(summary.quantile(0.5)).any()
@@ -30,6 +30,19 @@ setuptools.setup(
         'scikit-learn==0.22.2',
         'tqdm==4.45.0'
     ],
+    extras_require={
+        'arrow': [
+            'pyarrow==0.16.0'
+        ],
+        'yaml': [
+            'PyYAML==5.3.1'
+        ]
+    },
+    entry_points={
+        'console_scripts': [
+            'coltrane=coltrane.cli:main'
+        ]
+    },
     classifiers=[
         'Programming Language :: Python :: 3',
         'License :: OSI Approved :: MIT License',